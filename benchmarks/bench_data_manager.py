@@ -0,0 +1,335 @@
+"""
+Benchmark der öffentlichen DataManager-Methoden auf synthetischen Beständen.
+
+Aufruf aus dem Projektordner:
+
+    python -m benchmarks.bench_data_manager --sizes 1000,10000 --output bench.json
+    python -m benchmarks.bench_data_manager --sizes 1000 --compare bench.json
+
+Pro Bestandsgröße wird jede lesende Methode in drei Zuständen gemessen:
+
+- cold:    nichts im Speicher und keine Dateien unter data/.cache (erster Start)
+- restart: nichts im Speicher, aber Manifest/Index/Kopfdaten aus dem letzten Lauf
+- warm:    Wiederholung direkt danach (Median und Minimum über --repeat Läufe)
+
+Zum kalten Lauf werden zusätzlich die Dateizugriffe aus DataManager.stats() notiert.
+
+Schreibende Methoden laufen danach und werden nur warm gemessen. Den Seiten-Cache
+des Betriebssystems leert der Benchmark nicht; "cold" heißt also "kalt für die
+Anwendung", nicht "kalt für die Festplatte".
+
+Das Ergebnis ist ein JSON-Dokument (Standard: stdout, sonst --output), eine lesbare
+Übersicht geht nach stderr. Mit --compare werden die Zeiten gegen einen früheren
+Lauf verglichen; Verschlechterungen über --threshold führen zu Exit-Code 1.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import statistics
+import subprocess
+import tempfile
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+if __package__ in (None, ""):
+    # direkter Aufruf als Skript: Projektordner für "classes" importierbar machen
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_data import SyntheticDataset, generate_dataset
+from classes.core.data_manager import DataManager
+from classes.core.json_codec import DEFAULT_CODEC
+
+FORMAT_VERSION = 1
+DEFAULT_SIZES = (1000, 10000)
+SEARCH_TEXT = "labor stadt"
+
+Case = Tuple[str, Callable[[], Any]]
+
+
+# --- Messung ---
+
+def _timed(func: Callable[[], Any]) -> Tuple[float, Any]:
+    start = time.perf_counter()
+    result = func()
+    if not isinstance(result, (list, dict, str, bool, int, type(None))):
+        # Generatoren erst beim Weiterlesen messen
+        result = list(result)
+    return (time.perf_counter() - start) * 1000.0, result
+
+
+def _count(result: Any) -> Optional[int]:
+    if isinstance(result, (list, dict)):
+        return len(result)
+    if isinstance(result, int) and not isinstance(result, bool):
+        return result
+    return None
+
+
+def _cold_start(keep_sidecars: bool) -> None:
+    if not keep_sidecars:
+        shutil.rmtree(DataManager.CACHE_DIR, ignore_errors=True)
+    DataManager.reset_state()
+
+
+def measure_read(name: str, func: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    _cold_start(keep_sidecars=False)
+    DataManager.reset_stats()
+    cold_ms, result = _timed(func)
+    cold_io = DataManager.stats()["io"]
+    _cold_start(keep_sidecars=True)
+    restart_ms, _ = _timed(func)
+    warm = [_timed(func)[0] for _ in range(repeat)]
+    return {
+        "method": name,
+        "kind": "read",
+        "cold_ms": round(cold_ms, 3),
+        "restart_ms": round(restart_ms, 3),
+        "warm_ms": round(statistics.median(warm), 3),
+        "warm_min_ms": round(min(warm), 3),
+        "result_count": _count(result),
+        "cold_io": cold_io,
+    }
+
+
+def measure_write(name: str, func: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    timings = [_timed(func)[0] for _ in range(repeat)]
+    return {
+        "method": name,
+        "kind": "write",
+        "warm_ms": round(statistics.median(timings), 3),
+        "warm_min_ms": round(min(timings), 3),
+    }
+
+
+# --- Testfälle ---
+
+def read_cases(dataset: SyntheticDataset) -> List[Case]:
+    campaign = dataset.campaigns[len(dataset.campaigns) // 2][0]
+    char_id, char_path = dataset.characters[len(dataset.characters) // 2]
+    item = dataset.items[len(dataset.items) // 2]
+    player = dataset.players[0]
+    dm = DataManager
+    return [
+        ("get_all_characters", dm.get_all_characters),
+        ("get_characters_by_role(npc)", lambda: dm.get_characters_by_role("npc")),
+        ("get_character_by_id", lambda: dm.get_character_by_id(char_id)),
+        ("query_characters(role, campaign_id)", lambda: dm.query_characters(role="pc", campaign_id=campaign["id"])),
+        ("query_characters(name_prefix)", lambda: dm.query_characters(name_prefix="Maya")),
+        ("iter_characters(limit=20)", lambda: dm.iter_characters(role="npc", limit=20)),
+        ("get_summaries(character)", lambda: dm.get_summaries(dm.KIND_CHARACTER)),
+        ("load_entity_data", lambda: dm.load_entity_data(char_path)),
+        ("get_all_items", dm.get_all_items),
+        ("get_all_items_meta", dm.get_all_items_meta),
+        ("iter_items(name)", lambda: dm.iter_items(name=item["name"], limit=1)),
+        ("get_summaries(item)", lambda: dm.get_summaries(dm.KIND_ITEM)),
+        ("get_all_conditions", dm.get_all_conditions),
+        ("get_all_conditions_meta", dm.get_all_conditions_meta),
+        ("iter_conditions(limit=20)", lambda: dm.iter_conditions(limit=20)),
+        ("get_all_campaigns", dm.get_all_campaigns),
+        ("get_all_quests_meta", lambda: dm.get_all_quests_meta(campaign["id"])),
+        ("iter_quests(status)", lambda: dm.iter_quests(campaign["id"], status="offen")),
+        ("get_all_players", dm.get_all_players),
+        ("get_player_by_id", lambda: dm.get_player_by_id(player["id"])),
+        ("search", lambda: dm.search(SEARCH_TEXT)),
+        ("collect_unused_images", dm.collect_unused_images),
+    ]
+
+
+def write_cases(dataset: SyntheticDataset, work_dir: str) -> List[Case]:
+    campaign = dataset.campaigns[0][0]
+    char_id, char_path = dataset.characters[0]
+    item = dataset.items[0]
+    condition = dataset.conditions[0]
+    player = dataset.players[0]
+    dm = DataManager
+    counter = {"n": 0}
+
+    def touch(data: Dict[str, Any]) -> Dict[str, Any]:
+        counter["n"] += 1
+        data["description"] = f"Benchmark-Änderung {counter['n']}"
+        return data
+
+    # wird beim ersten Lauf angelegt und danach überschrieben
+    quest = {"campaign_id": campaign["id"], "title": "Benchmark-Quest", "status": "offen"}
+
+    character = dict(dm.get_character_by_id(char_id))
+
+    def save_and_delete_item():
+        new_item = touch({"name": "Benchmark-Item", "weapon_state": item["weapon_state"]})
+        dm.save_item(new_item)
+        return dm.delete_item(new_item["id"])
+
+    def save_many_items():
+        records = [touch({"name": f"Massen-Item {i}", "weapon_state": item["weapon_state"]}) for i in range(100)]
+        results = dm.save_many(dm.KIND_ITEM, records)
+        for result in results:
+            dm.delete_item(result["id"])
+        return results
+
+    bundle_path = os.path.join(work_dir, "benchmark.pnpbundle")
+    return [
+        ("save_character", lambda: dm.save_character(touch(character), file_path=char_path)),
+        ("save_item", lambda: dm.save_item(touch(dict(item)))),
+        ("save_condition", lambda: dm.save_condition(touch(dict(condition)))),
+        ("save_campaign", lambda: dm.save_campaign(dict(campaign))),
+        ("save_quest", lambda: dm.save_quest(touch(quest))),
+        ("save_player", lambda: dm.save_player(dict(player))),
+        ("save_item+delete_item", save_and_delete_item),
+        ("save_many(100 items)+delete_item", save_many_items),
+        ("export_campaign_bundle", lambda: dm.export_campaign_bundle(campaign["id"], bundle_path)),
+    ]
+
+
+# --- Ablauf ---
+
+def run_size(size: int, work_dir: str, seed: int, repeat: int, compact: bool, only: Optional[str]) -> Dict[str, Any]:
+    data_dir = os.path.join(work_dir, f"size-{size}", "data")
+    shutil.rmtree(os.path.dirname(data_dir), ignore_errors=True)
+
+    start = time.perf_counter()
+    dataset = generate_dataset(data_dir, size, seed=seed, compact=compact)
+    generate_s = time.perf_counter() - start
+    _log(f"{size} Entities: {dataset.files_written} Dateien, {dataset.bytes_written / 1e6:.1f} MB in {generate_s:.1f} s")
+
+    DataManager.set_data_dir(data_dir)
+    results = []
+    for name, func in read_cases(dataset):
+        if only and only not in name:
+            continue
+        results.append(measure_read(name, func, repeat))
+        _log_result(results[-1])
+    for name, func in write_cases(dataset, os.path.dirname(data_dir)):
+        if only and only not in name:
+            continue
+        results.append(measure_write(name, func, repeat))
+        _log_result(results[-1])
+    DataManager.reset_state()
+
+    return {
+        "size": size,
+        "counts": dataset.counts,
+        "files": dataset.files_written,
+        "bytes": dataset.bytes_written,
+        "generate_s": round(generate_s, 3),
+        "results": results,
+    }
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=DataManager.BASE_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _log(message: str) -> None:
+    print(message, file=sys.stderr)
+
+
+def _log_result(result: Dict[str, Any]) -> None:
+    if result["kind"] == "read":
+        _log(
+            f"  {result['method']:<40} cold {result['cold_ms']:>10.2f} ms   restart {result['restart_ms']:>10.2f} ms"
+            f"   warm {result['warm_ms']:>10.2f} ms"
+        )
+    else:
+        _log(f"  {result['method']:<40} {'':>45}   warm {result['warm_ms']:>10.2f} ms")
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float, min_ms: float) -> List[str]:
+    """
+    Vergleicht zwei Ergebnisdokumente; liefert eine Zeile pro Messwert, der um mehr als
+    den Faktor threshold langsamer geworden ist (Messwerte unter min_ms zählen nicht).
+    """
+    old = {
+        (run["size"], result["method"], phase): result[phase]
+        for run in baseline.get("runs", [])
+        for result in run["results"]
+        for phase in ("cold_ms", "restart_ms", "warm_ms")
+        if phase in result
+    }
+    regressions = []
+    for run in current["runs"]:
+        for result in run["results"]:
+            for phase in ("cold_ms", "restart_ms", "warm_ms"):
+                before = old.get((run["size"], result["method"], phase))
+                after = result.get(phase)
+                if before is None or after is None or max(before, after) < min_ms:
+                    continue
+                if after > before * threshold:
+                    regressions.append(
+                        f"{run['size']:>7} {result['method']:<40} {phase:<10} {before:>10.2f} -> {after:>10.2f} ms"
+                        f" (x{after / max(before, 1e-9):.2f})"
+                    )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark der DataManager-Methoden auf synthetischen Daten.")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="Bestandsgrößen (Entities gesamt), kommagetrennt, bis 100000")
+    parser.add_argument("--repeat", type=int, default=5, help="Wiederholungen für warme Messungen")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--compact", action="store_true", help="Testdaten im kompakten JSON-Format schreiben")
+    parser.add_argument("--only", help="nur Methoden, deren Name diesen Text enthält")
+    parser.add_argument("--work-dir", help="Ordner für die Testdaten (Standard: temporär, wird gelöscht)")
+    parser.add_argument("--output", help="Ergebnisdatei (JSON); Standard: stdout")
+    parser.add_argument("--compare", help="früheres Ergebnis, gegen das verglichen wird")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Faktor, ab dem eine Messung als Verschlechterung gilt")
+    parser.add_argument("--min-ms", type=float, default=1.0, help="kürzere Messungen beim Vergleich ignorieren")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="pnp-bench-")
+    os.makedirs(work_dir, exist_ok=True)
+    original_data_dir = DataManager.DATA_DIR
+    report = {
+        "format": FORMAT_VERSION,
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "json_backend": DEFAULT_CODEC.backend,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "compact": args.compact,
+        },
+        "runs": [],
+    }
+    try:
+        for size in sizes:
+            report["runs"].append(run_size(size, work_dir, args.seed, max(1, args.repeat), args.compact, args.only))
+    finally:
+        DataManager.set_data_dir(original_data_dir)
+        if not args.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    payload = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload + "\n")
+    else:
+        print(payload)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold, args.min_ms)
+        if regressions:
+            _log(f"{len(regressions)} Verschlechterung(en) gegenüber {args.compare}:")
+            for line in regressions:
+                _log("  " + line)
+            return 1
+        _log(f"Keine Verschlechterung gegenüber {args.compare}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,283 @@
+"""
+Synthetischer Datenbestand für Benchmarks.
+
+Erzeugt Charaktere (mit Fertigkeiten, Kategoriewerten, eingebetteten Items und
+Zuständen), Kampagnen samt Quests, Items mit Waffenzustand, Zustände und Spieler
+im selben Ordnerlayout, das der DataManager schreibt. Die Dateien werden direkt
+geschrieben (nicht über den DataManager), damit Caches, Indizes und
+Änderungsprotokoll danach leer sind – wie bei einem Bestand, der von einem anderen
+Rechner oder aus einem Backup stammt.
+
+Gleicher seed und gleiche Größe ergeben denselben Bestand (IDs eingeschlossen).
+"""
+import os
+import uuid
+import random
+from typing import Any, Dict, List, Optional
+
+from classes.core.data_manager import DataManager
+from classes.core.json_codec import DEFAULT_CODEC
+
+# Anteile am Gesamtbestand (Rest: Kampagnen und Spieler)
+SHARE_CHARACTERS = 0.40
+SHARE_ITEMS = 0.30
+SHARE_CONDITIONS = 0.10
+SHARE_QUESTS = 0.15
+ENTITIES_PER_CAMPAIGN = 200
+ENTITIES_PER_PLAYER = 500
+# Anteil der Charaktere ohne Kampagne (liegen unter data/characters)
+SHARE_FREE_CHARACTERS = 0.10
+
+FIRST_NAMES = [
+    "Maya", "Jonas", "Lena", "Karl", "Mira", "Tobias", "Hanna", "Felix", "Greta", "Emil",
+    "Ida", "Oskar", "Frieda", "Anton", "Lotte", "Bruno", "Nora", "Paul", "Ella", "Theo",
+]
+LAST_NAMES = [
+    "Vasquez", "Hengst", "Krüger", "Schmidt", "Becker", "Wolf", "Neumann", "Schwarz",
+    "Zimmermann", "Braun", "Hofmann", "Hartmann", "Lange", "Werner", "Krause", "Lehmann",
+]
+CLASSES = ["Soldatin", "Ärztin", "Hacker", "Händler", "Pilot", "Mechaniker", "Polizist", "Forscherin"]
+GENDERS = ["Weiblich", "Männlich", "Divers"]
+BUILDS = ["athletisch", "schlank", "kräftig", "zierlich"]
+SKILLS = {
+    "Handeln": ["Akrobatik", "Schießen", "Überleben", "Schleichen", "Klettern", "Nahkampf", "Fahren", "Schwimmen"],
+    "Wissen": ["Programmieren", "Logik", "Politik", "Medizin", "Chemie", "Geschichte", "Technik", "Sprachen"],
+    "Soziales": ["Feilschen", "Überzeugen", "Einschüchtern", "Lügen", "Empathie", "Führung", "Verführen"],
+}
+ITEM_NAMES = ["Fackel", "Messer", "Funkgerät", "Seil", "Verbandskasten", "Taschenlampe", "Karte", "Feldflasche"]
+WEAPONS = [
+    ("G36", "Schusswaffe", "7W10", 30),
+    ("Pistole P8", "Schusswaffe", "7W10", 15),
+    ("Schrotflinte", "Schusswaffe", "5W10", 8),
+    ("Kampfmesser", "Nahkampfwaffe", "2W10", 0),
+    ("Handgranate", "Explosivwaffe", "8W10", 0),
+]
+CONDITION_NAMES = ["Gute Laune", "schläfrig", "tiefe Wunde", "vergiftet", "erschöpft", "motiviert", "verängstigt"]
+EFFECT_TYPES = ["keine Auswirkung", "missionsweit", "rundenbasiert"]
+QUEST_STATUS = ["offen", "in Arbeit", "abgeschlossen", "gescheitert"]
+CAMPAIGN_TYPES = ["Sandbox", "One-Shot", "Kampagne"]
+WORDS = [
+    "Ausbruch", "Stadt", "Neuanfang", "Labor", "Krankheit", "Rettung", "Stützpunkt", "Konvoi",
+    "Funkspruch", "Vorräte", "Verrat", "Bunker", "Grenze", "Flucht", "Expedition", "Archiv",
+    "Wachturm", "Schmuggler", "Impfstoff", "Kanalisation", "Hafen", "Brücke", "Kloster", "Mine",
+]
+
+
+def dataset_counts(size: int) -> Dict[str, int]:
+    """Aufteilung einer Gesamtzahl von Entities auf die einzelnen Typen."""
+    size = max(1, int(size))
+    return {
+        "characters": max(1, int(size * SHARE_CHARACTERS)),
+        "items": max(1, int(size * SHARE_ITEMS)),
+        "conditions": max(1, int(size * SHARE_CONDITIONS)),
+        "quests": int(size * SHARE_QUESTS),
+        "campaigns": max(1, size // ENTITIES_PER_CAMPAIGN),
+        "players": max(1, size // ENTITIES_PER_PLAYER),
+    }
+
+
+class SyntheticDataset:
+    """Schreibt einen synthetischen Bestand nach data_dir (Ordner wird angelegt)."""
+
+    def __init__(self, data_dir: str, seed: int = 0, compact: bool = False):
+        self.data_dir = os.path.abspath(data_dir)
+        self.rng = random.Random(seed)
+        self.compact = compact
+        self.items: List[Dict[str, Any]] = []
+        self.conditions: List[Dict[str, Any]] = []
+        self.players: List[Dict[str, Any]] = []
+        # (Kampagnendaten, Ordner)
+        self.campaigns: List[Any] = []
+        # (ID, Pfad) aller Charaktere, z. B. für Einzelabrufe im Benchmark
+        self.characters: List[Any] = []
+        self.counts: Dict[str, int] = {}
+        self.bytes_written = 0
+        self.files_written = 0
+
+    # --- Hilfen ---
+
+    def _uuid(self) -> str:
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def _text(self, words: int) -> str:
+        return " ".join(self.rng.choice(WORDS) for _ in range(words)) + "."
+
+    def _write(self, folder: str, name: str, data: Dict[str, Any], own_folder: bool = True) -> str:
+        safe_name = DataManager._safe_name(name)
+        stem = f"{safe_name} - {data['id']}"
+        if own_folder:
+            folder = os.path.join(folder, stem)
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"{stem}.json")
+        raw = DEFAULT_CODEC.encode_file(data, compact=self.compact)
+        with open(path, "wb") as f:
+            f.write(raw)
+        self.bytes_written += len(raw)
+        self.files_written += 1
+        return path
+
+    # --- Entities ---
+
+    def _weapon_state(self, capacity: int) -> Dict[str, Any]:
+        return {
+            "chambers": self.rng.randint(0, 1) if capacity else 0,
+            "chambers_capacity": 1 if capacity else 0,
+            "magazine": {
+                "inserted": bool(capacity),
+                "count": self.rng.randint(0, capacity) if capacity else 0,
+                "capacity": capacity,
+            },
+            "projectiles_loaded": 0,
+            "projectile_type": "",
+        }
+
+    def _item(self, index: int) -> Dict[str, Any]:
+        if self.rng.random() < 0.4:
+            name, category, formula, capacity = self.rng.choice(WEAPONS)
+            is_weapon = True
+        else:
+            name, category, formula, capacity = self.rng.choice(ITEM_NAMES), None, "", 0
+            is_weapon = False
+        return {
+            "id": self._uuid(),
+            "name": f"{name} {index}",
+            "description": self._text(self.rng.randint(3, 12)),
+            "attributes": {"Gewicht": self.rng.randint(1, 20)} if self.rng.random() < 0.5 else {},
+            "is_weapon": is_weapon,
+            "damage_formula": formula,
+            "weapon_category": category,
+            "weapon_state": self._weapon_state(capacity),
+            "linked_conditions": [],
+        }
+
+    def _condition(self, index: int) -> Dict[str, Any]:
+        return {
+            "id": self._uuid(),
+            "name": f"{self.rng.choice(CONDITION_NAMES)} {index}",
+            "description": self._text(self.rng.randint(2, 8)),
+            "effect_type": self.rng.choice(EFFECT_TYPES),
+            "effect_target": self.rng.choice(["", "Lebenspunkte", "Schießen", "Handeln"]),
+            "effect_value": self.rng.choice([0, -20, -10, 10, 15]),
+        }
+
+    def _player(self, index: int) -> Dict[str, Any]:
+        name = f"{self.rng.choice(FIRST_NAMES)} {index}"
+        return {"id": self._uuid(), "name": name, "nickname": name.split()[0], "discord": "", "roll20": ""}
+
+    def _character(self, index: int, campaign_id: Optional[str]) -> Dict[str, Any]:
+        skills = {}
+        category_scores = {}
+        inspiration_points = {}
+        for category, names in SKILLS.items():
+            chosen = self.rng.sample(names, self.rng.randint(3, len(names)))
+            skills[category] = {name: self.rng.randrange(10, 90, 5) for name in chosen}
+            category_scores[category] = sum(skills[category].values()) // 10
+            inspiration_points[category] = self.rng.randint(0, 3)
+
+        items = {}
+        for source in self.rng.sample(self.items, min(len(self.items), self.rng.randint(0, 6))):
+            embedded = {key: value for key, value in source.items() if key not in ("name", "description")}
+            embedded["id"] = None
+            embedded["weapon_state"] = self._weapon_state(source["weapon_state"]["magazine"]["capacity"])
+            items[source["name"]] = embedded
+        conditions = {
+            source["name"]: dict(source)
+            for source in self.rng.sample(self.conditions, min(len(self.conditions), self.rng.randint(0, 3)))
+        }
+        player = self.rng.choice(self.players)
+
+        data = {
+            "id": self._uuid(),
+            "name": f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)} {index}",
+            "class": self.rng.choice(CLASSES),
+            "gender": self.rng.choice(GENDERS),
+            "age": self.rng.randint(16, 70),
+            "hitpoints": self.rng.randrange(50, 150, 5),
+            "base_damage": f"{self.rng.randint(1, 3)}W10",
+            "build": self.rng.choice(BUILDS),
+            "skills": skills,
+            "category_scores": category_scores,
+            "inspiration_points": inspiration_points,
+            "items": items,
+            "conditions": conditions,
+            "description": self._text(self.rng.randint(20, 80)),
+            "role": "pc" if self.rng.random() < 0.3 else "npc",
+            "armor_enabled": self.rng.random() < 0.5,
+            "armor_value": self.rng.randint(0, 6),
+            "armor_condition": self.rng.randint(0, 10),
+            "player_id": player["id"],
+            "player": dict(player),
+        }
+        if campaign_id:
+            data["campaign_id"] = campaign_id
+        return data
+
+    def _campaign(self, index: int) -> Dict[str, Any]:
+        return {
+            "id": self._uuid(),
+            "title": f"{self.rng.choice(WORDS)} {index}",
+            "ruleset": "How To Be A Hero",
+            "type": self.rng.choice(CAMPAIGN_TYPES),
+        }
+
+    def _quest(self, index: int, campaign_id: str) -> Dict[str, Any]:
+        return {
+            "id": self._uuid(),
+            "campaign_id": campaign_id,
+            "title": f"{self.rng.choice(WORDS)} {self.rng.choice(WORDS)} {index}",
+            "questgiver": f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}",
+            "assigned_to": "",
+            "status": self.rng.choice(QUEST_STATUS),
+            "description": self._text(self.rng.randint(10, 40)),
+            "goals": self._text(self.rng.randint(3, 10)),
+        }
+
+    # --- Erzeugen ---
+
+    def generate(self, size: int) -> Dict[str, int]:
+        """Schreibt einen Bestand mit insgesamt etwa size Entities; liefert die Anzahl je Typ."""
+        counts = dataset_counts(size)
+        characters_dir = os.path.join(self.data_dir, "characters")
+        campaigns_dir = os.path.join(self.data_dir, "campaigns")
+        for sub in ("characters", "campaigns", "items", "conditions", "players"):
+            os.makedirs(os.path.join(self.data_dir, sub), exist_ok=True)
+
+        for i in range(counts["players"]):
+            player = self._player(i)
+            self.players.append(player)
+            self._write(os.path.join(self.data_dir, "players"), player["name"], player, own_folder=False)
+        for i in range(counts["items"]):
+            item = self._item(i)
+            self.items.append(item)
+            self._write(os.path.join(self.data_dir, "items"), item["name"], item)
+        for i in range(counts["conditions"]):
+            condition = self._condition(i)
+            self.conditions.append(condition)
+            self._write(os.path.join(self.data_dir, "conditions"), condition["name"], condition)
+        for i in range(counts["campaigns"]):
+            campaign = self._campaign(i)
+            path = self._write(campaigns_dir, campaign["title"], campaign)
+            self.campaigns.append((campaign, os.path.dirname(path)))
+
+        free_characters = int(counts["characters"] * SHARE_FREE_CHARACTERS)
+        for i in range(counts["characters"]):
+            if i < free_characters:
+                character = self._character(i, None)
+                path = self._write(characters_dir, character["name"], character)
+            else:
+                campaign, folder = self.campaigns[i % len(self.campaigns)]
+                character = self._character(i, campaign["id"])
+                path = self._write(folder, character["name"], character)
+            self.characters.append((character["id"], path))
+        for i in range(counts["quests"]):
+            campaign, folder = self.campaigns[i % len(self.campaigns)]
+            quest = self._quest(i, campaign["id"])
+            self._write(os.path.join(folder, DataManager.QUESTS_SUBDIR), quest["title"], quest)
+        return counts
+
+
+def generate_dataset(data_dir: str, size: int, seed: int = 0, compact: bool = False) -> SyntheticDataset:
+    """Erzeugt einen synthetischen Bestand mit etwa size Entities unter data_dir."""
+    dataset = SyntheticDataset(data_dir, seed=seed, compact=compact)
+    dataset.counts = dataset.generate(size)
+    return dataset
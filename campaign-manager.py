@@ -1,10 +1,26 @@
+import os
 import sys
 from PyQt6.QtWidgets import QApplication
 
+from classes.core.data_manager import DataManager
 from classes.ui.welcome_window import WelcomeWindow
 
+
+def _env_flag(name: str) -> bool:
+    """Schalter über Umgebungsvariablen: "1", "true", "yes" oder "on" (Standard: aus)."""
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    # Optional: Datenordner während der Sitzung überwachen (z. B. bei gemeinsam genutzten Laufwerken)
+    if _env_flag("PNP_WATCH_DATA"):
+        DataManager.start_watching()
+        app.aboutToQuit.connect(DataManager.stop_watching)
+    # Optional: Speichern im Hintergrund, damit große Saves den Dialog nicht blockieren
+    if _env_flag("PNP_WRITE_BEHIND"):
+        DataManager.enable_write_behind()
+        app.aboutToQuit.connect(DataManager.disable_write_behind)
     window = WelcomeWindow()
     window.show()
     sys.exit(app.exec())
@@ -0,0 +1,156 @@
+import os
+import mmap
+import posixpath
+import struct
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from classes.core.json_codec import DEFAULT_CODEC
+from classes.core.write_queue import atomic_write
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"PNPBNDL1"
+# Magic (8 Bytes) + Länge des Inhaltsverzeichnisses (uint32, little endian)
+_HEADER = struct.Struct("<8sI")
+VERSION = 1
+
+# classify(path, data) -> Entity-Typ oder None (DataManager._classify_entity)
+Classifier = Callable[[str, Dict[str, Any]], Optional[str]]
+
+
+def write_bundle(
+    bundle_path: str,
+    files: List[Tuple[str, str]],
+    campaign_id: str,
+    classify: Classifier,
+    image_paths: Optional[Dict[str, str]] = None,
+) -> int:
+    """
+    Packt die übergebenen Dateien (relativer Pfad im Paket, Pfad auf der Platte) –
+    Kampagnen-JSON, Charaktere, Quests, Bilder – in eine einzelne Datei:
+
+        MAGIC | Länge des Inhaltsverzeichnisses | Inhaltsverzeichnis (JSON) | Dateiinhalte
+
+    Das Inhaltsverzeichnis steht vorne und enthält pro Datei relativen Pfad, Offset
+    (ab Beginn der Dateiinhalte), Größe sowie bei Entities deren Typ und ID.
+    Dateien werden unverändert übernommen. image_paths ordnet Bild-Referenzen aus dem
+    Bildspeicher ihrem Pfad im Paket zu. Rückgabe: Anzahl gepackter Dateien.
+    """
+    entries: List[Dict[str, Any]] = []
+    blobs: List[bytes] = []
+    offset = 0
+    for rel_path, full_path in files:
+        with open(full_path, "rb") as f:
+            blob = f.read()
+        entry: Dict[str, Any] = {
+            "path": rel_path,
+            "offset": offset,
+            "size": len(blob),
+        }
+        if rel_path.lower().endswith(".json"):
+            try:
+                data = DEFAULT_CODEC.loads(blob)
+            except Exception as e:
+                logger.warning(f"{full_path} ist kein gültiges JSON und wird nur als Datei übernommen: {e}")
+                data = None
+            kind = classify(full_path, data) if isinstance(data, dict) else None
+            if kind:
+                entry["kind"] = kind
+                entry["id"] = str(data["id"])
+                image_filename = data.get("image_filename")
+                if image_paths and image_filename in image_paths:
+                    entry["image"] = image_paths[image_filename]
+                elif image_filename:
+                    entry["image"] = posixpath.join(posixpath.dirname(rel_path), image_filename)
+        entries.append(entry)
+        blobs.append(blob)
+        offset += len(blob)
+
+    toc = DEFAULT_CODEC.dumps(
+        {"version": VERSION, "campaign_id": str(campaign_id), "entries": entries},
+        compact=True,
+    )
+    os.makedirs(os.path.dirname(bundle_path) or ".", exist_ok=True)
+    atomic_write(bundle_path, b"".join([_HEADER.pack(MAGIC, len(toc)), toc, *blobs]))
+    return len(entries)
+
+
+class CampaignBundle:
+    """
+    Liest ein mit write_bundle() erzeugtes Kampagnen-Paket, ohne es zu entpacken.
+
+    Die Datei wird einmal geöffnet und schreibgeschützt per mmap eingeblendet;
+    einzelne Entities und Bilder werden direkt über die Offsets aus dem
+    Inhaltsverzeichnis gelesen. Mit "with" verwenden oder close() aufrufen.
+    """
+
+    def __init__(self, bundle_path: str):
+        self.path = bundle_path
+        self._file = open(bundle_path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, toc_size = _HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{bundle_path} ist kein Kampagnen-Paket.")
+            toc = DEFAULT_CODEC.loads(self._mm[_HEADER.size:_HEADER.size + toc_size])
+            if toc.get("version") != VERSION:
+                raise ValueError(f"Nicht unterstützte Paket-Version in {bundle_path}: {toc.get('version')}")
+        except Exception:
+            self.close()
+            raise
+        self._data_start = _HEADER.size + toc_size
+        self.campaign_id: str = toc.get("campaign_id")
+        self._entries: Dict[str, Dict[str, Any]] = {e["path"]: e for e in toc.get("entries", [])}
+        self._by_id: Dict[str, Dict[str, Any]] = {e["id"]: e for e in self._entries.values() if e.get("id")}
+
+    def __enter__(self) -> "CampaignBundle":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        mm = getattr(self, "_mm", None)
+        if mm is not None:
+            mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # --- Inhaltsverzeichnis ---
+
+    def paths(self) -> List[str]:
+        return list(self._entries)
+
+    def ids(self, kind: Optional[str] = None) -> List[str]:
+        return [eid for eid, e in self._by_id.items() if kind is None or e.get("kind") == kind]
+
+    # --- Lesen ---
+
+    def read_bytes(self, rel_path: str) -> bytes:
+        """Inhalt einer gepackten Datei (relativer Pfad mit '/')."""
+        entry = self._entries.get(rel_path)
+        if entry is None:
+            raise KeyError(rel_path)
+        start = self._data_start + entry["offset"]
+        return self._mm[start:start + entry["size"]]
+
+    def get(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        """Lädt ein Entity (Kampagne, Charakter, Quest) anhand seiner ID."""
+        entry = self._by_id.get(str(entity_id))
+        if entry is None:
+            return None
+        return DEFAULT_CODEC.loads(self.read_bytes(entry["path"]))
+
+    def get_all(self, kind: str) -> List[Dict[str, Any]]:
+        """Alle Entities eines Typs in Ablage-Reihenfolge."""
+        return [self.get(eid) for eid in self.ids(kind)]
+
+    def read_image(self, entity_id: str) -> Optional[bytes]:
+        """Bilddaten zum Entity (Feld "image_filename"), falls mitgepackt."""
+        entry = self._by_id.get(str(entity_id))
+        if entry is None or entry.get("image") not in self._entries:
+            return None
+        return self.read_bytes(entry["image"])
@@ -0,0 +1,248 @@
+import os
+import time
+import logging
+import threading
+from typing import Any, Dict, Iterator, List, Optional
+
+from classes.core.io_stats import IO_STATS
+from classes.core.json_codec import DEFAULT_CODEC
+from classes.core.write_queue import atomic_write
+
+logger = logging.getLogger(__name__)
+
+OP_SAVE = "save"
+OP_DELETE = "delete"
+
+
+def diff(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Flacher Unterschied zweier Dokumente: geänderte/neue Felder und entfernte Felder."""
+    changes: Dict[str, Any] = {}
+    set_fields = {key: value for key, value in new.items() if key not in old or old[key] != value}
+    unset_fields = [key for key in old if key not in new]
+    if set_fields:
+        changes["set"] = set_fields
+    if unset_fields:
+        changes["unset"] = unset_fields
+    return changes
+
+
+def apply_diff(doc: Dict[str, Any], changes: Dict[str, Any]) -> Dict[str, Any]:
+    result = dict(doc)
+    result.update(changes.get("set", {}))
+    for key in changes.get("unset", []):
+        result.pop(key, None)
+    return result
+
+
+class ChangeJournal:
+    """
+    Append-only Änderungsprotokoll: eine kompakte JSON-Zeile pro save_*/delete_*.
+
+        {"seq": 17, "ts": 1718000000.123, "op": "save", "kind": "item", "id": "...",
+         "path": "items/...", "snapshot": {...}}      bzw. "diff": {"set": {...}, "unset": [...]}
+
+    Die erste Änderung eines Entities innerhalb einer Sitzung (und jede
+    SNAPSHOT_EVERY-te) wird als vollständiger Stand geschrieben, alle weiteren als
+    Unterschied zum vorherigen Stand. seq steigt monoton, auch über compact() hinweg –
+    andere Rechner bzw. Sync-Werkzeuge merken sich die letzte gelesene seq und lesen
+    mit read(since_seq) nur das Ende nach.
+
+    compact() fasst alle Einträge vor einem Stichtag zu je einem Stand pro noch
+    existierendem Entity zusammen; wird max_bytes überschritten, geschieht das
+    automatisch beim nächsten Anhängen.
+    """
+
+    SNAPSHOT_EVERY = 20
+
+    def __init__(self, journal_file: str, max_bytes: int = 8 * 1024 * 1024, retention_days: float = 30.0):
+        self.journal_file = journal_file
+        self.max_bytes = max_bytes
+        self.retention_days = retention_days
+        self._lock = threading.RLock()
+        self._file = None
+        self._size = 0
+        self._seq = 0
+        self._compact_at = max_bytes
+        # entity_id -> (letzter Stand, Änderungen seit dem letzten vollständigen Stand)
+        self._last: Dict[str, Any] = {}
+        self._opened = False
+
+    # --- Datei ---
+
+    def _ensure_open(self) -> None:
+        if self._opened:
+            return
+        os.makedirs(os.path.dirname(self.journal_file), exist_ok=True)
+        self._seq = self._read_last_seq()
+        self._file = open(self.journal_file, "ab")
+        self._size = self._file.tell()
+        if self._size and not self._ends_with_newline():
+            # abgeschnittene letzte Zeile abschließen, sonst hängt der nächste Eintrag daran
+            self._file.write(b"\n")
+            self._file.flush()
+            self._size += 1
+        self._compact_at = max(self.max_bytes, 2 * self._size)
+        self._opened = True
+
+    def _read_last_seq(self) -> int:
+        """seq des letzten vollständigen Eintrags (liest nur das Dateiende)."""
+        try:
+            with open(self.journal_file, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                end = f.tell()
+                chunk = 64 * 1024
+                f.seek(max(0, end - chunk))
+                tail = f.read()
+        except FileNotFoundError:
+            return 0
+        for line in reversed(tail.splitlines()):
+            try:
+                return int(DEFAULT_CODEC.loads(line)["seq"])
+            except Exception:
+                # abgeschnittene letzte Zeile (z. B. nach einem Absturz) überspringen
+                continue
+        return 0
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.journal_file, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._opened = False
+
+    # --- Schreiben ---
+
+    def _append(self, record: Dict[str, Any]) -> int:
+        with self._lock:
+            self._ensure_open()
+            self._seq += 1
+            record["seq"] = self._seq
+            line = DEFAULT_CODEC.dumps(record, compact=True) + b"\n"
+            self._file.write(line)
+            self._file.flush()
+            IO_STATS.add(bytes_written=len(line))
+            self._size += len(line)
+            if self._size > self._compact_at:
+                self.compact()
+            return record["seq"]
+
+    def record_save(self, kind: str, entity_id: str, rel_path: str, data: Dict[str, Any]) -> int:
+        """Protokolliert einen gespeicherten Stand (vollständig oder als Unterschied)."""
+        # eigene Kopie: der Aufrufer darf das Dictionary danach weiter verändern
+        doc = DEFAULT_CODEC.loads(DEFAULT_CODEC.dumps(data, compact=True))
+        record: Dict[str, Any] = {"ts": round(time.time(), 3), "op": OP_SAVE, "kind": kind, "id": entity_id, "path": rel_path}
+        with self._lock:
+            previous = self._last.get(entity_id)
+            if previous is None or previous[1] >= self.SNAPSHOT_EVERY:
+                record["snapshot"] = doc
+                self._last[entity_id] = (doc, 0)
+            else:
+                changes = diff(previous[0], doc)
+                if not changes:
+                    return self._seq
+                record["diff"] = changes
+                self._last[entity_id] = (doc, previous[1] + 1)
+            return self._append(record)
+
+    def record_delete(self, kind: str, entity_id: str, rel_path: Optional[str] = None) -> int:
+        record = {"ts": round(time.time(), 3), "op": OP_DELETE, "kind": kind, "id": entity_id, "path": rel_path}
+        with self._lock:
+            self._last.pop(entity_id, None)
+            return self._append(record)
+
+    # --- Lesen ---
+
+    def read(self, since_seq: int = 0) -> Iterator[Dict[str, Any]]:
+        """Alle Einträge mit seq > since_seq in Schreibreihenfolge."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+        try:
+            f = open(self.journal_file, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = DEFAULT_CODEC.loads(line)
+                except Exception:
+                    logger.warning(f"Unlesbarer Eintrag im Änderungsprotokoll {self.journal_file} übersprungen.")
+                    continue
+                if record.get("seq", 0) > since_seq:
+                    yield record
+
+    def history(self, entity_id: str) -> List[Dict[str, Any]]:
+        """Einträge eines Entities (ohne Dokumentinhalt): seq, ts, op, path."""
+        return [
+            {key: record.get(key) for key in ("seq", "ts", "op", "path")}
+            for record in self.read()
+            if record.get("id") == entity_id
+        ]
+
+    def state_at(self, entity_id: str, timestamp: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Stand eines Entities zum Zeitpunkt timestamp (None: letzter bekannter Stand).
+        None, wenn es damals nicht existierte oder vor dem ersten erhaltenen Eintrag liegt.
+        """
+        state: Optional[Dict[str, Any]] = None
+        for record in self.read():
+            if timestamp is not None and record.get("ts", 0) > timestamp:
+                break
+            if record.get("id") != entity_id:
+                continue
+            if record.get("op") == OP_DELETE:
+                state = None
+            elif "snapshot" in record:
+                state = record["snapshot"]
+            elif state is not None:
+                state = apply_diff(state, record.get("diff", {}))
+        return state
+
+    # --- Verdichten ---
+
+    def compact(self, before: Optional[float] = None) -> int:
+        """
+        Fasst alle Einträge mit ts < before (Standard: älter als retention_days) zu einem
+        vollständigen Stand pro Entity zusammen; gelöschte Entities entfallen.
+        Rückgabe: Anzahl der Einträge danach.
+        """
+        if before is None:
+            before = time.time() - self.retention_days * 86400
+        with self._lock:
+            self._ensure_open()
+            self._file.flush()
+            folded: Dict[str, Dict[str, Any]] = {}
+            kept: List[Dict[str, Any]] = []
+            for record in self.read():
+                if record.get("ts", 0) >= before:
+                    kept.append(record)
+                    continue
+                entity_id = record.get("id")
+                if record.get("op") == OP_DELETE:
+                    folded.pop(entity_id, None)
+                elif "snapshot" in record:
+                    folded[entity_id] = dict(record)
+                elif entity_id in folded:
+                    base = folded[entity_id]
+                    base["snapshot"] = apply_diff(base["snapshot"], record.get("diff", {}))
+                    base.update({key: record[key] for key in ("seq", "ts", "path") if key in record})
+
+            records = sorted(folded.values(), key=lambda r: r["seq"]) + kept
+            payload = b"".join(DEFAULT_CODEC.dumps(r, compact=True) + b"\n" for r in records)
+            self._file.close()
+            try:
+                atomic_write(self.journal_file, payload)
+            finally:
+                self._file = open(self.journal_file, "ab")
+            self._size = len(payload)
+            # nicht bei jedem weiteren Eintrag erneut verdichten, wenn der Rest groß bleibt
+            self._compact_at = max(self.max_bytes, 2 * self._size)
+            logger.info(f"Änderungsprotokoll verdichtet: {len(records)} Einträge, {self._size} Bytes.")
+            return len(records)
@@ -0,0 +1,134 @@
+import bisect
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Felder mit eigenem Sekundärindex (Wert -> Pfade)
+INDEXED_FIELDS = ("role", "campaign_id", "class", "player_id")
+
+# Fehlende Rolle zählt wie in get_characters_by_role als Spielercharakter
+DEFAULT_ROLE = "pc"
+
+
+def _key(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+class CharacterIndex:
+    """
+    Sekundärindizes über die Kopfdaten aller Charaktere (Rolle, Kampagne, Klasse,
+    Spieler, Name). query() liefert die Pfade der passenden Charaktere, ohne dass
+    dafür ein einziges Dokument geöffnet werden muss.
+
+    Gefüllt wird der Index aus den Kopfdaten (SummaryStore) und danach über
+    put()/forget() aktuell gehalten.
+    """
+
+    def __init__(self, sort_key: Callable[[str], Any] = lambda path: path):
+        self._sort_key = sort_key
+        self._lock = threading.RLock()
+        # path -> Kopfdaten
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # Feld -> Wert -> Pfade
+        self._by_field: Dict[str, Dict[Optional[str], Set[str]]] = {f: {} for f in INDEXED_FIELDS}
+        # sortiert nach (Name in Kleinbuchstaben, Pfad) für Präfixsuche
+        self._names: List[Tuple[str, str]] = []
+        # Stand (DataManager._index_generation) des letzten vollständigen Aufbaus, None = nie
+        self.generation: Optional[int] = None
+
+    @staticmethod
+    def _values(summary: Dict[str, Any]) -> Dict[str, Optional[str]]:
+        values = {field: _key(summary.get(field)) for field in INDEXED_FIELDS}
+        values["role"] = _key(summary.get("role", DEFAULT_ROLE))
+        return values
+
+    @staticmethod
+    def _name_key(summary: Dict[str, Any]) -> str:
+        return str(summary.get("name") or "").casefold()
+
+    # --- Pflege ---
+
+    def rebuild(self, entries: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Baut alle Indizes aus (Pfad, Kopfdaten)-Paaren neu auf."""
+        with self._lock:
+            self._entries = {}
+            self._by_field = {f: {} for f in INDEXED_FIELDS}
+            names = []
+            for path, summary in entries:
+                self._entries[path] = summary
+                for field, value in self._values(summary).items():
+                    self._by_field[field].setdefault(value, set()).add(path)
+                names.append((self._name_key(summary), path))
+            names.sort()
+            self._names = names
+
+    def put(self, path: str, summary: Dict[str, Any]) -> None:
+        with self._lock:
+            self.forget(path)
+            self._entries[path] = summary
+            for field, value in self._values(summary).items():
+                self._by_field[field].setdefault(value, set()).add(path)
+            bisect.insort(self._names, (self._name_key(summary), path))
+
+    def forget(self, path: str) -> None:
+        with self._lock:
+            summary = self._entries.pop(path, None)
+            if summary is None:
+                return
+            for field, value in self._values(summary).items():
+                paths = self._by_field[field].get(value)
+                if paths is not None:
+                    paths.discard(path)
+                    if not paths:
+                        del self._by_field[field][value]
+            item = (self._name_key(summary), path)
+            pos = bisect.bisect_left(self._names, item)
+            if pos < len(self._names) and self._names[pos] == item:
+                del self._names[pos]
+
+    def forget_under(self, dir_path: str) -> None:
+        """Entfernt alle Charaktere unterhalb eines (gelöschten) Ordners."""
+        prefix = dir_path.rstrip("/\\")
+        with self._lock:
+            for path in [p for p in self._entries if p.startswith(prefix) and p[len(prefix):len(prefix) + 1] in ("/", "\\")]:
+                self.forget(path)
+
+    # --- Abfrage ---
+
+    def _with_name_prefix(self, prefix: str) -> Set[str]:
+        prefix = prefix.casefold()
+        start = bisect.bisect_left(self._names, (prefix, ""))
+        matches = set()
+        for name, path in self._names[start:]:
+            if not name.startswith(prefix):
+                break
+            matches.add(path)
+        return matches
+
+    def query(self, criteria: Dict[str, Any], name_prefix: Optional[str] = None) -> List[str]:
+        """
+        Pfade aller Charaktere, deren Felder criteria (Feld -> Wert, nur INDEXED_FIELDS)
+        entsprechen und deren Name mit name_prefix beginnt (Groß-/Kleinschreibung egal).
+        Ohne Kriterien: alle Charaktere. Reihenfolge wie beim Verzeichnis-Scan.
+        """
+        with self._lock:
+            candidates: List[Set[str]] = []
+            for field, value in criteria.items():
+                if field not in self._by_field:
+                    raise ValueError(f"Kein Index für Feld: {field}")
+                candidates.append(self._by_field[field].get(_key(value), set()))
+            if name_prefix:
+                candidates.append(self._with_name_prefix(name_prefix))
+
+            if not candidates:
+                result = set(self._entries)
+            else:
+                candidates.sort(key=len)
+                result = set(candidates[0])
+                for other in candidates[1:]:
+                    result &= other
+                    if not result:
+                        break
+            return sorted(result, key=self._sort_key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
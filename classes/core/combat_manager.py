@@ -1,4 +1,8 @@
-from typing import List, Dict, Optional, Tuple
+import copy
+from typing import Any, List, Dict, Optional, Tuple
+
+from classes.core.character_calculator import CharacterCalculator
+from classes.core.data_manager import DataManager
 
 class CombatManager:
     """
@@ -7,17 +11,23 @@ class CombatManager:
     """
 
     def __init__(self):
-        # Aktive Kämpfer (Spieler und NSCs)
+        # Aktive Kämpfer (Spieler und NSCs), instance_id -> Kämpfer in Reihenfolge des Hinzufügens
         # Struktur jedes Kämpfers (wie bisher im UI):
         # { "instance_id", "source_char_id", "display_name", "team", "current_hp", "max_hp", "unconscious", "dead" }
-        self.battle_actors: List[Dict] = []
+        self._actors: Dict[str, Dict] = {}
         
-        # Initiative-Reihenfolge (Referenzen auf Dicts in battle_actors)
-        self.turn_order: List[Dict] = []
+        # Initiative-Reihenfolge (Referenzen auf Dicts in battle_actors), nach außen über
+        # turn_order/current_turn_index. Entfernte Kämpfer hinterlassen eine Lücke (None),
+        # damit die übrigen Positionen gültig bleiben; verdichtet wird erst, wenn die
+        # Lücken überwiegen oder jemand die Reihenfolge als Liste braucht.
+        self._turn_slots: List[Optional[Dict]] = []
+        # instance_id -> Index in _turn_slots
+        self._slot_of: Dict[str, int] = {}
+        # Index des Kämpfers am Zug in _turn_slots
+        self._current_slot: int = 0
         
         # State
         self.round_number: int = 1
-        self.current_turn_index: int = 0
         
         # Trackt den in dieser Runde erlittenen Schaden pro instance_id
         # Resets auf {} beim Rundenwechsel
@@ -30,16 +40,175 @@ class CombatManager:
         # Trackt, wer an der Überraschungsrunde (Runde 1) nicht teilnehmen darf
         self.surprised_ids: set = set()
 
+        # Schnappschuss der Charakterdaten pro source_char_id für die Dauer des Kampfes:
+        # { "data": Charakter-Dict (Kopie), "effective": CharacterCalculator.compute_effective_values(...),
+        #   "skill_categories": Fertigkeit -> Kategorie }
+        # Wird beim Hinzufügen angelegt und nur über reload_characters() erneuert.
+        self._characters: Dict[str, Dict[str, Any]] = {}
+
     # ==========================
     # Initialization / Setup
     # ==========================
-    def add_combatant(self, actor: Dict):
-        """Fügt einen Kämpfer zur aktuellen Schlacht hinzu."""
-        self.battle_actors.append(actor)
+    @property
+    def battle_actors(self) -> List[Dict]:
+        """Alle Kämpfer in Reihenfolge des Hinzufügens (neue Liste, Dicts sind die Originale)."""
+        return list(self._actors.values())
+
+    def get_actor(self, instance_id: str) -> Optional[Dict]:
+        """Kämpfer zu einer instance_id (None, wenn nicht (mehr) im Kampf)."""
+        return self._actors.get(instance_id)
+
+    def add_combatant(self, actor: Dict, character: Optional[Dict[str, Any]] = None):
+        """
+        Fügt einen Kämpfer zur aktuellen Schlacht hinzu. character sind die bereits
+        geladenen Daten des Quell-Charakters (sonst werden sie einmalig nachgeladen).
+        Eine bereits vergebene instance_id führt zu einem ValueError.
+        """
+        instance_id = actor["instance_id"]
+        if instance_id in self._actors:
+            raise ValueError(f"Kämpfer mit instance_id {instance_id} ist bereits im Kampf.")
+        self._actors[instance_id] = actor
+        source_id = actor.get("source_char_id")
+        if source_id and source_id not in self._characters:
+            self._snapshot_character(source_id, character if character is not None else DataManager.get_character_by_id(source_id))
 
     def remove_combatant(self, instance_id: str):
-        """Entfernt einen Kämpfer komplett aus der Schlacht (z.B. UI-Löschung)."""
-        self.battle_actors = [a for a in self.battle_actors if a["instance_id"] != instance_id]
+        """
+        Entfernt einen Kämpfer komplett aus der Schlacht (z.B. UI-Löschung) –
+        auch aus einer laufenden Initiative-Reihenfolge.
+        """
+        if self._actors.pop(instance_id, None) is None:
+            return
+        self.surprised_ids.discard(instance_id)
+        slot = self._slot_of.pop(instance_id, None)
+        if slot is None:
+            return
+        self._turn_slots[slot] = None
+        # der Kämpfer am Zug bleibt am Zug; war es der entfernte, ist der nächste dran.
+        # War er der letzte der Runde, steht die Position hinter dem Ende – die neue Runde
+        # beginnt erst mit dem nächsten next_turn()
+        if slot == self._current_slot:
+            self._skip_removed_slots()
+        if len(self._turn_slots) > 2 * len(self._slot_of) + 8:
+            self._compact_turn_order()
+
+    @property
+    def turn_order(self) -> List[Dict]:
+        """Initiative-Reihenfolge ohne entfernte Kämpfer (neue Liste, Dicts sind die Originale)."""
+        self._compact_turn_order()
+        return list(self._turn_slots)
+
+    @property
+    def current_turn_index(self) -> int:
+        """Position des Kämpfers am Zug in turn_order."""
+        self._compact_turn_order()
+        return self._current_slot
+
+    @current_turn_index.setter
+    def current_turn_index(self, index: int):
+        self._compact_turn_order()
+        self._current_slot = index
+
+    def turn_position(self, instance_id: str) -> Optional[int]:
+        """Index eines Kämpfers in turn_order (None, wenn er nicht in der Reihenfolge steht)."""
+        if instance_id not in self._slot_of:
+            return None
+        self._compact_turn_order()
+        return self._slot_of[instance_id]
+
+    def _compact_turn_order(self):
+        """Entfernt die Lücken aus _turn_slots (nur, wenn es welche gibt)."""
+        if len(self._turn_slots) == len(self._slot_of):
+            return
+        current = self._current_slot
+        live: List[Dict] = []
+        for slot, actor in enumerate(self._turn_slots):
+            if slot == current:
+                self._current_slot = len(live)
+            if actor is not None:
+                live.append(actor)
+        if current >= len(self._turn_slots):
+            self._current_slot = len(live)
+        self._turn_slots = live
+        self._slot_of = {a["instance_id"]: i for i, a in enumerate(live)}
+
+    def _advance_slot(self) -> bool:
+        """
+        Setzt _current_slot auf den nächsten verbliebenen Kämpfer ab der aktuellen Position.
+        Rückgabe: True, wenn dabei eine neue Runde begonnen hat.
+        """
+        self._skip_removed_slots()
+        if self._current_slot < len(self._turn_slots) or not self._slot_of:
+            return False
+        self._start_new_round()
+        self._skip_removed_slots()
+        return True
+
+    def _skip_removed_slots(self):
+        """Schiebt _current_slot über Lücken hinweg bis zum nächsten Kämpfer (oder ans Ende)."""
+        slots = self._turn_slots
+        while self._current_slot < len(slots) and slots[self._current_slot] is None:
+            self._current_slot += 1
+
+    # ==========================
+    # Character Snapshots
+    # ==========================
+    def _snapshot_character(self, char_id: str, char_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if char_data is None:
+            self._characters.pop(char_id, None)
+            return None
+        data = copy.deepcopy(char_data)
+        entry = {
+            "data": data,
+            "effective": CharacterCalculator.compute_effective_values(data),
+            "skill_categories": {
+                skill: category for category, skills in data.get("skills", {}).items() for skill in skills
+            },
+        }
+        self._characters[char_id] = entry
+        return entry
+
+    def _character_entry(self, char_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._characters.get(char_id)
+        if entry is None:
+            entry = self._snapshot_character(char_id, DataManager.get_character_by_id(char_id))
+        return entry
+
+    def get_character(self, char_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Charakterdaten aus dem Schnappschuss des Kampfes (ohne Dateizugriff).
+        Liefert eine Kopie; Änderungen daran wirken sich nicht auf den Schnappschuss aus.
+        """
+        entry = self._character_entry(char_id)
+        return copy.deepcopy(entry["data"]) if entry else None
+
+    def get_effective_values(self, char_id: str) -> Optional[Dict[str, Dict[str, int]]]:
+        """
+        Vorberechnete effektive Kategorie-/Fertigkeitswerte (siehe CharacterCalculator)
+        inkl. missionsweiter Zustände, als Kopie.
+        """
+        entry = self._character_entry(char_id)
+        if not entry:
+            return None
+        return {key: dict(values) for key, values in entry["effective"].items()}
+
+    def get_skill_category(self, char_id: str, skill_name: str) -> Optional[str]:
+        """Kategorie, zu der eine Fertigkeit des Charakters gehört (None, wenn unbekannt)."""
+        entry = self._character_entry(char_id)
+        return entry["skill_categories"].get(skill_name) if entry else None
+
+    def reload_characters(self) -> int:
+        """
+        Liest die Charakterdaten aller Kämpfer neu ein (z. B. nachdem ein Charakter
+        während des Kampfes bearbeitet wurde). Rückgabe: Anzahl neu geladener Charaktere.
+        """
+        source_ids = {a.get("source_char_id") for a in self._actors.values() if a.get("source_char_id")}
+        self._characters = {}
+        loaded = 0
+        for char_id in source_ids:
+            if self._snapshot_character(char_id, DataManager.get_character_by_id(char_id)) is not None:
+                loaded += 1
+        return loaded
 
     def set_initiative_order(self, order: List[Dict], surprised_ids: set):
         """
@@ -47,10 +216,11 @@ class CombatManager:
         - order ist eine sortierte Liste aller teilnehmenden Kämpfer.
         - surprised_ids ist ein Set aus instance_ids, die überrascht sind.
         """
-        self.turn_order = order
+        self._turn_slots = list(order)
+        self._slot_of = {a["instance_id"]: i for i, a in enumerate(self._turn_slots)}
+        self._current_slot = 0
         self.surprised_ids = set(surprised_ids)
         self.round_number = 1
-        self.current_turn_index = 0
         self.round_damage = {}
         self.parry_used = {}
 
@@ -59,9 +229,9 @@ class CombatManager:
     # ==========================
     def get_current_actor(self) -> Optional[Dict]:
         """Gibt den Kämpfer zurück, der gerade am Zug ist."""
-        if not self.turn_order or self.current_turn_index >= len(self.turn_order):
+        if self._current_slot >= len(self._turn_slots):
             return None
-        return self.turn_order[self.current_turn_index]
+        return self._turn_slots[self._current_slot]
 
     def is_current_actor_surprised_and_blocked(self) -> bool:
         """Checkt, ob der aktuelle Kämpfer wegen Überraschung am Zug gehindert ist."""
@@ -94,19 +264,16 @@ class CombatManager:
         Geht zum nächsten Kämpfer über.
         Rückgabe: True, wenn eine NEUE Runde begonnen hat; False sonst.
         """
-        if not self.turn_order:
+        if not self._slot_of:
             return False
 
-        self.current_turn_index += 1
-        if self.current_turn_index >= len(self.turn_order):
-            self._start_new_round()
-            return True
-        return False
+        self._current_slot += 1
+        return self._advance_slot()
 
     def _start_new_round(self):
         """Interne Logik für Rundenbeginn."""
         self.round_number += 1
-        self.current_turn_index = 0
+        self._current_slot = 0
         self.round_damage = {}
         self.parry_used = {}
 
@@ -129,7 +296,7 @@ class CombatManager:
             - Eine Liste von Log-Nachrichten (was passiert ist)
         """
         logs = []
-        target = next((a for a in self.battle_actors if a["instance_id"] == target_id), None)
+        target = self._actors.get(target_id)
         if not target:
             return None, ["Fehler: Ziel nicht gefunden."]
 
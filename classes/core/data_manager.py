@@ -1,10 +1,78 @@
 import os
-import json
+import time
+import shutil
 import logging
-from typing import List, Dict, Any, Optional
+import functools
+import itertools
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from classes.core import data_watcher, image_store, io_stats
+from classes.core.campaign_bundle import CampaignBundle, write_bundle
+from classes.core.change_journal import ChangeJournal
+from classes.core.character_index import CharacterIndex
+from classes.core.data_manifest import DataManifest
+from classes.core.data_watcher import DataWatcher
+from classes.core.entity_cache import EntityCache
+from classes.core.entity_index import EntityIndex
+from classes.core.image_store import ImageStore
+from classes.core.io_stats import IO_STATS
+from classes.core.json_codec import JsonCodec
+from classes.core.search_index import SearchIndex, tokenize
+from classes.core.summary_store import SummaryStore
+from classes.core.write_queue import WriteBehindQueue, atomic_write
 
 logger = logging.getLogger(__name__)
 
+
+def _backend_method(func):
+    """
+    Leitet einen öffentlichen DataManager-Aufruf an das per use_backend() gesetzte
+    Storage-Backend weiter, sofern dieses eine gleichnamige Methode anbietet.
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(cls, *args, **kwargs):
+        backend = cls._backend
+        if backend is not None and hasattr(backend, name):
+            return getattr(backend, name)(*args, **kwargs)
+        return func(cls, *args, **kwargs)
+
+    return wrapper
+
+
+_call_state = threading.local()
+
+
+def _instrumented(func):
+    """
+    Misst die Laufzeit eines öffentlichen DataManager-Aufrufs (siehe DataManager.stats()).
+    Dauert der äußerste Aufruf länger als DataManager.SLOW_CALL_MS, wird er samt
+    Dateizugriffen und aufrufender Stelle geloggt.
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(cls, *args, **kwargs):
+        depth = getattr(_call_state, "depth", 0)
+        before = IO_STATS.counters() if depth == 0 and cls.SLOW_CALL_MS is not None else None
+        _call_state.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            return func(cls, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            _call_state.depth = depth
+            IO_STATS.record_call(name, elapsed)
+            if before is not None and elapsed * 1000.0 >= cls.SLOW_CALL_MS:
+                cls._log_slow_call(name, elapsed, before)
+
+    return wrapper
+
+
 class DataManager:
     """
     Zentrale Klasse für Datenzugriff (Datei-I/O) von Charakteren, Items und Zuständen.
@@ -12,91 +80,1545 @@ class DataManager:
     """
     
     BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    CHARACTERS_DIR = os.path.join(BASE_DIR, "data", "characters")
-    CAMPAIGNS_DIR = os.path.join(BASE_DIR, "data", "campaigns")
-    ITEMS_DIR = os.path.join(BASE_DIR, "data", "items")
+    DATA_DIR = os.path.join(BASE_DIR, "data")
+    CHARACTERS_DIR = os.path.join(DATA_DIR, "characters")
+    CAMPAIGNS_DIR = os.path.join(DATA_DIR, "campaigns")
+    ITEMS_DIR = os.path.join(DATA_DIR, "items")
     LEGACY_ITEMS_FILE = os.path.join(BASE_DIR, "items.json")
-    CONDITIONS_DIR = os.path.join(BASE_DIR, "data", "conditions")
+    CONDITIONS_DIR = os.path.join(DATA_DIR, "conditions")
     LEGACY_CONDITIONS_FILE = os.path.join(BASE_DIR, "conditions.json")
-    PLAYERS_DIR = os.path.join(BASE_DIR, "data", "players")
+    PLAYERS_DIR = os.path.join(DATA_DIR, "players")
     QUESTS_SUBDIR = "quests"
+    # Inhaltsadressierter Bildspeicher (siehe _copy_entity_image)
+    IMAGES_DIR = os.path.join(DATA_DIR, "images")
+    # Gepackte Kampagnen (export_campaign_bundle)
+    BUNDLES_DIR = os.path.join(DATA_DIR, "bundles")
+    BUNDLE_SUFFIX = ".pnpbundle"
+
+    # Änderungsprotokoll aller save_*/delete_* (siehe ChangeJournal)
+    JOURNAL_DIR = os.path.join(DATA_DIR, ".journal")
+    JOURNAL_FILE = os.path.join(JOURNAL_DIR, "changes.jsonl")
+    JOURNAL_ENABLED = True
+    JOURNAL_MAX_BYTES = 8 * 1024 * 1024
+    JOURNAL_RETENTION_DAYS = 30
+
+    # Interne Caches/Indizes (nicht versioniert, jederzeit neu aufbaubar)
+    CACHE_DIR = os.path.join(DATA_DIR, ".cache")
+    ID_INDEX_FILE = os.path.join(CACHE_DIR, "entity_index.json")
+    SUMMARY_FILE = os.path.join(CACHE_DIR, "summaries.json")
+    SEARCH_FILE = os.path.join(CACHE_DIR, "search_index.json")
+    MANIFEST_FILE = os.path.join(CACHE_DIR, "manifest.bin")
+
+    # Kopfdaten, die für Auswahllisten (Anzeigetexte, einfache Filter) ausreichen
+    SUMMARY_FIELDS = (
+        "id", "name", "title", "class", "age", "hitpoints", "role", "status",
+        "type", "campaign_id", "player_id", "nickname", "discord",
+    )
+
+    # Entity-Typen, wie sie im ID-Index geführt werden
+    KIND_CHARACTER = "character"
+    KIND_CAMPAIGN = "campaign"
+    KIND_QUEST = "quest"
+    KIND_ITEM = "item"
+    KIND_CONDITION = "condition"
+    KIND_PLAYER = "player"
+
+    # Volltextsuche: durchsuchbare Entity-Typen, Gewichte einzelner Felder (sonst 1.0)
+    # und Felder, die nur IDs/Dateinamen enthalten
+    SEARCH_KINDS = (KIND_CHARACTER, KIND_ITEM, KIND_CONDITION, KIND_QUEST)
+    SEARCH_FIELD_WEIGHTS = {"name": 3.0, "title": 3.0, "class": 2.0, "questgiver": 1.5}
+    SEARCH_SKIP_FIELDS = ("id", "image_filename", "linked_conditions")
+
+    # Obergrenzen des In-Memory-Caches für geparste Dateien (LRU)
+    ENTITY_CACHE_MAX_ENTRIES = 4096
+    ENTITY_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+    # Aufrufe, die länger dauern, werden mit ihren Dateizugriffen geloggt (None = aus), siehe stats()
+    SLOW_CALL_MS: Optional[float] = None
+
+    # Optionales Storage-Backend (z. B. SQLiteStorage), siehe use_backend()
+    _backend: Optional[Any] = None
+
+    # JSON-Codec (orjson, falls installiert) und Schreibformat der Entity-Dateien:
+    # False = lesbar wie bisher (indent=4), True = kompakt ohne Einrückung
+    JSON_COMPACT = False
+    _codec = JsonCodec()
+
+    # Threads für paralleles Öffnen/Parsen in Verzeichnis-Scans (0 oder 1 = sequentiell).
+    # Lohnt sich v. a. bei Netzlaufwerken mit hoher Latenz pro Datei.
+    LOAD_WORKERS = 0
+    _load_executor: Optional[ThreadPoolExecutor] = None
+
+    # Optionaler Hintergrund-Schreiber, siehe enable_write_behind()
+    _writer: Optional[WriteBehindQueue] = None
+
+    # Verzeichnis-Manifest: Ordner mit unveränderter mtime werden nicht neu gelistet
+    MANIFEST_ENABLED = True
+    _manifest: Optional[DataManifest] = None
+
+    # Kampagnen-ID -> Kampagnenordner, siehe _find_campaign_base_dir()
+    _campaign_dirs: Optional[Dict[str, str]] = None
+    _campaign_dirs_mtime: Optional[int] = None
+
+    # Neue Bilder im Bildspeicher ablegen statt in jeden Entity-Ordner zu kopieren
+    IMAGE_STORE_ENABLED = True
+    _image_store: Optional[ImageStore] = None
+
+    _id_index: Optional[EntityIndex] = None
+    _entity_cache: Optional[EntityCache] = None
+    _summary_store: Optional[SummaryStore] = None
+    # Sekundärindizes für query_characters()
+    _character_index: Optional[CharacterIndex] = None
+    # Volltext-Index für search()
+    _search_index: Optional[SearchIndex] = None
+    _journal: Optional[ChangeJournal] = None
+
+    # Überwachungsmodus (start_watching): bekannte JSON-Dateien je Datenordner
+    _watcher: Optional[DataWatcher] = None
+    _watched_files: Dict[str, Set[str]] = {}
+    _watch_lock = threading.RLock()
+
+    # Zähler für Änderungen am Datenbestand; gemerkte Scans (_scan_tree) gelten nur für eine Generation
+    _data_generation = 0
+    # Zähler für Änderungen, die nicht über save_*/delete_* laufen (invalidate_manifest,
+    # umbenannte Kampagnenordner). Such- und Charakterindex werden von den Speicher-/Lösch-
+    # Hooks nachgeführt und gleichen sich nur nach einer solchen Änderung neu ab.
+    _index_generation = 0
+    _scan_memo: Dict[str, Tuple[int, Dict[str, List[str]]]] = {}
+
+    @classmethod
+    def _ensure_dirs(cls):
+        os.makedirs(cls.CHARACTERS_DIR, exist_ok=True)
+        os.makedirs(cls.CAMPAIGNS_DIR, exist_ok=True)
+        os.makedirs(cls.ITEMS_DIR, exist_ok=True)
+        os.makedirs(cls.CONDITIONS_DIR, exist_ok=True)
+        os.makedirs(cls.PLAYERS_DIR, exist_ok=True)
+
+    @classmethod
+    def use_backend(cls, backend: Optional[Any]) -> Optional[Any]:
+        """
+        Setzt ein alternatives Storage-Backend (z. B. SQLiteStorage) für die öffentlichen
+        get_all_*/get_*_by_id/save_*/delete_*-Methoden. None schaltet zurück auf die
+        Ordnerstruktur unter data/. Liefert das bisher gesetzte Backend zurück.
+        """
+        previous = cls._backend
+        cls._backend = backend
+        return previous
+
+    @classmethod
+    def set_json_codec(cls, codec: Optional[JsonCodec] = None, compact: Optional[bool] = None) -> None:
+        """
+        Tauscht den JSON-Codec aus (None = automatische Wahl) und/oder stellt das
+        Schreibformat um. Bestehende Dateien bleiben in beiden Formaten lesbar.
+        """
+        if codec is not None:
+            cls._codec = codec
+        if compact is not None:
+            cls.JSON_COMPACT = bool(compact)
+
+    @classmethod
+    def set_data_dir(cls, data_dir: str) -> None:
+        """
+        Richtet den DataManager auf einen anderen Datenordner aus (z. B. Testdaten oder
+        Benchmarks). Überwachung und Hintergrund-Schreiber werden vorher beendet bzw.
+        geleert, alle Caches und Indizes im Speicher verworfen (siehe reset_state).
+        """
+        cls.stop_watching()
+        cls.reset_state()
+        data_dir = os.path.abspath(data_dir)
+        base_dir = os.path.dirname(data_dir)
+        cls.BASE_DIR = base_dir
+        cls.DATA_DIR = data_dir
+        cls.CHARACTERS_DIR = os.path.join(data_dir, "characters")
+        cls.CAMPAIGNS_DIR = os.path.join(data_dir, "campaigns")
+        cls.ITEMS_DIR = os.path.join(data_dir, "items")
+        cls.LEGACY_ITEMS_FILE = os.path.join(base_dir, "items.json")
+        cls.CONDITIONS_DIR = os.path.join(data_dir, "conditions")
+        cls.LEGACY_CONDITIONS_FILE = os.path.join(base_dir, "conditions.json")
+        cls.PLAYERS_DIR = os.path.join(data_dir, "players")
+        cls.IMAGES_DIR = os.path.join(data_dir, "images")
+        cls.BUNDLES_DIR = os.path.join(data_dir, "bundles")
+        cls.JOURNAL_DIR = os.path.join(data_dir, ".journal")
+        cls.JOURNAL_FILE = os.path.join(cls.JOURNAL_DIR, "changes.jsonl")
+        cls.CACHE_DIR = os.path.join(data_dir, ".cache")
+        cls.ID_INDEX_FILE = os.path.join(cls.CACHE_DIR, "entity_index.json")
+        cls.SUMMARY_FILE = os.path.join(cls.CACHE_DIR, "summaries.json")
+        cls.SEARCH_FILE = os.path.join(cls.CACHE_DIR, "search_index.json")
+        cls.MANIFEST_FILE = os.path.join(cls.CACHE_DIR, "manifest.bin")
+
+    @classmethod
+    def reset_state(cls) -> None:
+        """
+        Verwirft alle Caches und Indizes im Speicher, als wäre die Anwendung neu gestartet
+        worden. Die Dateien unter data/.cache bleiben erhalten und werden beim nächsten
+        Zugriff wieder eingelesen. Ausstehende Hintergrund-Schreibvorgänge werden vorher
+        abgeschlossen.
+        """
+        if cls._writer is not None:
+            cls.flush()
+        if cls._journal is not None:
+            cls._journal.close()
+        cls._journal = None
+        if cls._search_index is not None:
+            cls._search_index.save()
+        cls._id_index = None
+        cls._entity_cache = None
+        cls._summary_store = None
+        cls._character_index = None
+        cls._search_index = None
+        cls._manifest = None
+        cls._image_store = None
+        cls._campaign_dirs = None
+        cls._campaign_dirs_mtime = None
+        cls._scan_memo = {}
+        cls._touch_data()
+
+    # --- helpers ---
+
+    @staticmethod
+    def _safe_name(name: str, fallback: str = "Unbenannt") -> str:
+        safe = "".join(c for c in (name or "") if c.isalnum() or c in (" ", "-", "_")).strip()
+        return safe or fallback
+
+    @classmethod
+    def _copy_entity_image(
+        cls,
+        *,
+        entity_safe_name: str,
+        entity_id: str,
+        target_folder_path: str,
+        image_source_path: Optional[str],
+    ) -> Optional[str]:
+        """
+        Übernimmt ein Bild und liefert den Wert für "image_filename" zurück.
+        Mit Bildspeicher (Standard) wird jedes Bild nur einmal abgelegt und als
+        "sha256:<hash><ext>" referenziert, sonst wie früher in den Zielordner kopiert.
+        Akzeptiert: png/jpg/jpeg/webp
+        """
+        if not image_source_path or not os.path.exists(image_source_path):
+            return None
+
+        _, ext = os.path.splitext(image_source_path)
+        ext = ext.lower()
+        allowed_exts = {".png", ".jpg", ".jpeg", ".webp"}
+        if ext not in allowed_exts:
+            logger.warning(f"Nicht unterstütztes Bildformat: {image_source_path}")
+            return None
+
+        if cls.IMAGE_STORE_ENABLED:
+            try:
+                return cls._get_image_store().add(image_source_path)
+            except Exception as e:
+                logger.error(f"Fehler beim Übernehmen des Bildes {image_source_path} in den Bildspeicher: {e}")
+                return None
+
+        image_filename = f"{entity_safe_name} - {entity_id}{ext}"
+        image_target_path = os.path.join(target_folder_path, image_filename)
+        try:
+            shutil.copyfile(image_source_path, image_target_path)
+            return image_filename
+        except Exception as e:
+            logger.error(f"Fehler beim Kopieren des Bildes nach {image_target_path}: {e}")
+            return None
+
+    @classmethod
+    def _get_image_store(cls) -> ImageStore:
+        if cls._image_store is None:
+            cls._image_store = ImageStore(cls.IMAGES_DIR)
+        return cls._image_store
+
+    @classmethod
+    def resolve_image_path(cls, folder_path: Optional[str], image_filename: Optional[str]) -> Optional[str]:
+        """
+        Liefert den Dateipfad zu einem "image_filename"-Wert: Referenzen in den Bildspeicher
+        ("sha256:…") werden dort aufgelöst, ältere Dateinamen relativ zum Entity-Ordner.
+        """
+        if not image_filename:
+            return None
+        if image_store.is_ref(image_filename):
+            return cls._get_image_store().path_of(image_filename)
+        if not folder_path:
+            return None
+        return os.path.join(folder_path, image_filename)
+
+    @classmethod
+    def collect_unused_images(cls) -> int:
+        """
+        Zählt die Bild-Referenzen aller Entities neu und löscht Bilder im Bildspeicher,
+        die von keinem Entity mehr verwendet werden. Rückgabe: Anzahl gelöschter Bilder.
+
+        Ist ein Backend gesetzt (use_backend), zählen dessen Entities mit; liefert es
+        keine Bild-Referenzen (image_owners), wird nichts gelöscht.
+        """
+        owners = []
+        for base_dir in (cls.CHARACTERS_DIR, cls.CAMPAIGNS_DIR, cls.ITEMS_DIR, cls.CONDITIONS_DIR):
+            for entries in cls._scan_tree(base_dir).values():
+                owners.extend((data.get("id"), data.get("image_filename")) for _, data in entries)
+        backend = cls._backend
+        if backend is not None:
+            if not hasattr(backend, "image_owners"):
+                logger.warning("Bildspeicher wird nicht aufgeräumt: das gesetzte Backend liefert keine Bild-Referenzen.")
+                return 0
+            owners.extend(backend.image_owners())
+        store = cls._get_image_store()
+        store.rebuild(owners)
+        removed = store.collect_garbage(keep=[image_filename for _, image_filename in owners])
+        if removed:
+            logger.info(f"{removed} nicht mehr verwendete Bilder entfernt.")
+        return removed
+
+    @classmethod
+    def _read_json(cls, path: str) -> Any:
+        raw = io_stats.read_file(path)
+        start = time.perf_counter()
+        data = cls._codec.loads(raw)
+        IO_STATS.add(parse_s=time.perf_counter() - start)
+        return data
+
+    @classmethod
+    def _write_json(cls, path: str, data: Any, kind: Optional[str] = None) -> None:
+        """
+        Schreibt ein Dokument atomar (temp-Datei + os.replace). Ist der Hintergrund-Schreiber
+        aktiv, wird das Dokument nur eingereiht; Cache und Kopfdaten folgen nach dem Schreiben.
+        """
+        if cls._writer is not None:
+            cls._writer.submit(path, data, kind)
+            return
+        atomic_write(path, cls._encode_entity(data))
+
+    @classmethod
+    def _encode_entity(cls, data: Any) -> bytes:
+        start = time.perf_counter()
+        payload = cls._codec.encode_file(data, compact=cls.JSON_COMPACT)
+        IO_STATS.add(encode_s=time.perf_counter() - start)
+        return payload
+
+    @classmethod
+    def _discard_pending(cls, path: str) -> None:
+        """Verwirft einen noch nicht geschriebenen Stand (vor dem Löschen/Umbenennen einer Datei)."""
+        if cls._writer is not None:
+            cls._writer.discard(path)
+
+    # --- DELETE ---
+
+    @staticmethod
+    def _entity_id_of_name(name: str) -> str:
+        """'<Name> - <UUID>' bzw. '<Name> - <UUID>.json' -> '<UUID>'."""
+        if name.lower().endswith(".json"):
+            name = name[:-5]
+        return name.rsplit(" - ", 1)[-1]
+
+    @classmethod
+    def _locate_entities(cls, kind: str, base_dir: str, entity_id: str) -> List[Tuple[Optional[str], Optional[str]]]:
+        """
+        Findet alle Ordner ("<Name> - <UUID>/") bzw. – bei alten, flach abgelegten Dateien –
+        JSON-Dateien eines Entities direkt unter base_dir (exakter UUID-Vergleich), also auch
+        Reste früherer Umbenennungen. Ein abweichender Treffer im ID-Index kommt hinzu.
+        Rückgabe: Liste von (Ordner, None) bzw. (None, JSON-Pfad).
+        """
+        found: List[Tuple[Optional[str], Optional[str]]] = []
+        try:
+            entries = sorted(io_stats.scandir(base_dir), key=lambda e: e.name)
+        except OSError:
+            return found
+        for entry in entries:
+            if entry.name.startswith(".") or cls._entity_id_of_name(entry.name) != entity_id:
+                continue
+            if entry.is_dir():
+                found.append((entry.path, None))
+            elif entry.name.lower().endswith(".json"):
+                found.append((None, entry.path))
+
+        hit = cls._get_id_index().get(entity_id)
+        if hit and hit[1] == kind and cls._is_within(hit[0], base_dir):
+            parent = os.path.dirname(hit[0])
+            if parent == base_dir:
+                match = (None, hit[0])
+            elif cls._entity_id_of_name(os.path.basename(parent)) == entity_id and os.path.isdir(parent):
+                match = (parent, None)
+            else:
+                match = None
+            if match is not None and match not in found and os.path.exists(match[0] or match[1]):
+                found.append(match)
+        return found
+
+    @classmethod
+    def _forget_deleted(cls, json_paths: List[str]) -> None:
+        cache = cls._get_entity_cache()
+        index = cls._get_id_index()
+        store = cls._get_summary_store()
+        for path in json_paths:
+            cache.invalidate(path)
+            index.forget_path(path, persist=False)
+            store.forget(path)
+            if cls._character_index is not None:
+                cls._character_index.forget(path)
+            if cls._search_index is not None:
+                cls._search_index.forget(path)
+
+    @classmethod
+    def _delete_entity(cls, kind: str, base_dir: str, entity_id: str) -> bool:
+        """
+        Löscht ein Item oder einen Zustand samt Ordner und Bild – auch übrig gebliebene
+        Ordner mit derselben ID. Jeder Ordner wird zuerst in einen versteckten
+        Papierkorb-Namen umbenannt (ein atomarer Schritt: das Entity ist sofort
+        vollständig weg) und danach entfernt.
+        """
+        entity_id = str(entity_id)
+        if not entity_id or not os.path.isdir(base_dir):
+            return False
+
+        deleted_paths = []
+        for folder, json_path in cls._locate_entities(kind, base_dir, entity_id):
+            try:
+                if folder is not None:
+                    cls._delete_entity_folder(folder)
+                elif json_path is not None:
+                    cls._delete_flat_entity(base_dir, json_path)
+                deleted_paths.append(folder or json_path)
+            except Exception as e:
+                logger.error(f"Fehler beim Löschen von {folder or json_path}: {e}")
+
+        index = cls._get_id_index()
+        index.forget_id(entity_id)
+        if deleted_paths:
+            index.save()
+            cls._get_image_store().assign(entity_id, None)
+            cls._touch_data()
+            cls._journal_change(kind, entity_id, deleted_paths[0])
+        return bool(deleted_paths)
+
+    @classmethod
+    def _delete_entity_folder(cls, folder: str) -> None:
+        if cls._writer is not None:
+            for path in cls._writer.pending_paths():
+                if cls._is_within(path, folder):
+                    cls._writer.discard(path)
+        trash = os.path.join(os.path.dirname(folder), f".{os.path.basename(folder)}.deleting")
+        if os.path.exists(trash):
+            shutil.rmtree(trash, ignore_errors=True)
+        os.replace(folder, trash)
+        cls._watch_forget(folder, is_dir=True)
+        cls._forget_deleted([
+            os.path.join(folder, os.path.relpath(path, trash))
+            for path in cls._walk_json_files(trash)
+        ])
+        shutil.rmtree(trash, ignore_errors=True)
+        if os.path.exists(trash):
+            logger.warning(f"Papierkorb-Ordner {trash} konnte nicht vollständig entfernt werden.")
+
+    @classmethod
+    def _delete_flat_entity(cls, base_dir: str, json_path: str) -> None:
+        # altes, flaches Layout: Bild liegt (falls vorhanden) neben der JSON-Datei
+        try:
+            image_filename = (cls._load_json(json_path) or {}).get("image_filename")
+        except Exception:
+            image_filename = None
+        cls._discard_pending(json_path)
+        os.remove(json_path)
+        if image_filename and not image_store.is_ref(image_filename):
+            image_path = os.path.join(base_dir, image_filename)
+            if os.path.isfile(image_path):
+                os.remove(image_path)
+        cls._watch_forget(json_path)
+        cls._forget_deleted([json_path])
+
+    @classmethod
+    def _remove_renamed_folder(cls, old_path: Optional[str], new_folder: str, entity_id: str) -> None:
+        """
+        Räumt nach dem Umbenennen (oder Verschieben in eine andere Kampagne) den alten
+        Ordner '<alter Name> - <UUID>/' auf. Ältere, direkt im Ordner abgelegte Bilder
+        ziehen in den neuen Ordner um; bleibt danach außer weiteren Ständen desselben
+        Entities nichts übrig, wird der alte Ordner entfernt.
+        """
+        if not old_path:
+            return
+        old_folder = os.path.dirname(os.path.abspath(old_path))
+        if (
+            old_folder == os.path.abspath(new_folder)
+            or cls._entity_id_of_name(os.path.basename(old_folder)) != str(entity_id)
+            or not os.path.isdir(old_folder)
+        ):
+            return
+
+        if cls._writer is not None:
+            for path in cls._writer.pending_paths():
+                if cls._is_within(path, old_folder):
+                    cls._writer.discard(path)
+        stale = []
+        try:
+            for entry in io_stats.scandir(old_folder):
+                if entry.is_dir():
+                    logger.warning(f"Alter Ordner {old_folder} enthält Unterordner und bleibt erhalten.")
+                    return
+                if entry.name.lower().endswith(".json"):
+                    if cls._entity_id_of_name(entry.name) != str(entity_id):
+                        logger.warning(f"Alter Ordner {old_folder} enthält fremde Dateien und bleibt erhalten.")
+                        return
+                    stale.append(entry.path)
+                else:
+                    target = os.path.join(new_folder, entry.name)
+                    if not os.path.exists(target):
+                        os.replace(entry.path, target)
+            for path in stale:
+                os.remove(path)
+            shutil.rmtree(old_folder)
+        except OSError as e:
+            logger.warning(f"Alter Ordner {old_folder} konnte nicht entfernt werden: {e}")
+            return
+        cls._watch_forget(old_folder, is_dir=True)
+        cls._forget_deleted([os.path.abspath(path) for path in stale])
+        cls._touch_data()
+
+    # --- CHANGE JOURNAL (Änderungsprotokoll) ---
+
+    @classmethod
+    def _get_journal(cls) -> Optional[ChangeJournal]:
+        if not cls.JOURNAL_ENABLED:
+            return None
+        if cls._journal is None:
+            cls._journal = ChangeJournal(
+                cls.JOURNAL_FILE,
+                max_bytes=cls.JOURNAL_MAX_BYTES,
+                retention_days=cls.JOURNAL_RETENTION_DAYS,
+            )
+        return cls._journal
+
+    @classmethod
+    def _journal_change(cls, kind: str, entity_id: str, path: str, data: Optional[Dict[str, Any]] = None) -> None:
+        """Protokolliert ein save_* (data gesetzt) bzw. delete_* (data=None); Fehler brechen das Speichern nicht ab."""
+        journal = cls._get_journal()
+        if journal is None:
+            return
+        try:
+            rel_path = os.path.relpath(path, cls.DATA_DIR)
+            if data is None:
+                journal.record_delete(kind, entity_id, rel_path)
+            else:
+                journal.record_save(kind, entity_id, rel_path, data)
+        except Exception as e:
+            logger.error(f"Fehler beim Schreiben des Änderungsprotokolls ({kind} {entity_id}): {e}")
+
+    @classmethod
+    def read_journal(cls, since_seq: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Einträge des Änderungsprotokolls mit seq > since_seq (seq, ts, op, kind, id, path
+        und snapshot bzw. diff). Wer sich die letzte seq merkt, liest nur neue Änderungen.
+        """
+        journal = cls._get_journal()
+        return journal.read(since_seq) if journal is not None else iter(())
+
+    @classmethod
+    def entity_history(cls, entity_id: str) -> List[Dict[str, Any]]:
+        """Protokollierte Änderungen eines Entities (seq, ts, op, path), älteste zuerst."""
+        journal = cls._get_journal()
+        return journal.history(str(entity_id)) if journal is not None else []
+
+    @classmethod
+    def entity_state_at(cls, entity_id: str, timestamp: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Stand eines Entities zu einem Zeitpunkt (time.time()-Wert) laut Änderungsprotokoll."""
+        journal = cls._get_journal()
+        return journal.state_at(str(entity_id), timestamp) if journal is not None else None
+
+    @classmethod
+    def compact_journal(cls, before: Optional[float] = None) -> int:
+        """Verdichtet das Änderungsprotokoll (siehe ChangeJournal.compact)."""
+        journal = cls._get_journal()
+        return journal.compact(before) if journal is not None else 0
+
+    # --- WRITE-BEHIND (Speichern im Hintergrund) ---
+
+    @classmethod
+    def enable_write_behind(cls, delay: float = 0.2, fsync: bool = True) -> None:
+        """
+        Lässt save_* nur noch einreihen; ein Hintergrund-Thread schreibt die Dateien
+        (mehrfaches Speichern derselben Datei wird zusammengefasst, fsync gesammelt).
+        Lesezugriffe sehen eingereihte Stände sofort. Vor dem Beenden flush() aufrufen.
+        """
+        if cls._writer is not None:
+            return
+        cls._writer = WriteBehindQueue(
+            encode=cls._encode_entity,
+            on_written=cls._remember_saved,
+            delay=delay,
+            fsync=fsync,
+        )
+
+    @classmethod
+    def disable_write_behind(cls) -> List[str]:
+        """Schreibt alles Ausstehende und kehrt zum synchronen Speichern zurück."""
+        writer = cls._writer
+        if writer is None:
+            return []
+        cls._writer = None
+        return writer.stop()
+
+    @classmethod
+    def flush(cls, timeout: Optional[float] = None) -> List[str]:
+        """
+        Wartet, bis alle im Hintergrund eingereihten Dateien geschrieben sind.
+        Rückgabe: Pfade, deren Schreiben fehlgeschlagen ist (Details stehen im Log).
+        """
+        if cls._writer is None:
+            return []
+        failed = cls._writer.flush(timeout)
+        for path in failed:
+            logger.error(f"Datei konnte nicht gespeichert werden: {path}")
+        return failed
+
+    @classmethod
+    def _get_entity_cache(cls) -> EntityCache:
+        if cls._entity_cache is None:
+            cls._entity_cache = EntityCache(
+                max_entries=cls.ENTITY_CACHE_MAX_ENTRIES,
+                max_bytes=cls.ENTITY_CACHE_MAX_BYTES,
+            )
+        return cls._entity_cache
+
+    @classmethod
+    def _load_json(cls, path: str, validate: bool = False) -> Any:
+        """
+        Lädt eine JSON-Datei über den Entity-Cache.
+        Unveränderte Dateien (gleiche mtime und Größe) werden aus dem Speicher bedient.
+        Im Überwachungsmodus meldet der Watcher Änderungen selbst, dann entfällt
+        auch das stat (außer validate=True).
+        """
+        if cls._writer is not None:
+            data = cls._writer.pending(path)
+            if data is not WriteBehindQueue.MISSING:
+                return data
+
+        cache = cls._get_entity_cache()
+        trust_cache = cls._watcher is not None and not validate
+        if trust_cache:
+            data = cache.get(path, None)
+            if data is not EntityCache.MISSING:
+                return data
+
+        st = io_stats.stat(path)
+        signature = (st.st_mtime_ns, st.st_size)
+        if not trust_cache:
+            data = cache.get(path, signature)
+            if data is not EntityCache.MISSING:
+                return data
+        data = cls._read_json(path)
+        cache.put(path, signature, data)
+        return data
+
+    @classmethod
+    def _remember_saved(cls, path: str, data: Any, kind: Optional[str] = None) -> None:
+        """Legt ein gerade geschriebenes Dokument direkt im Cache (und seine Kopfdaten) ab."""
+        try:
+            st = io_stats.stat(path)
+        except OSError:
+            return
+        signature = (st.st_mtime_ns, st.st_size)
+        cls._get_entity_cache().put(path, signature, data)
+        if kind:
+            cls._get_summary_store().put(path, signature, kind, cls._summarize(data))
+            if cls._search_index is not None:
+                cls._index_for_search(path, signature, kind, data)
+
+    @classmethod
+    def set_load_workers(cls, workers: int) -> None:
+        """Legt fest, mit wie vielen Threads Scans Dateien öffnen und parsen (0/1 = sequentiell)."""
+        workers = max(0, int(workers))
+        if workers == cls.LOAD_WORKERS:
+            return
+        cls.LOAD_WORKERS = workers
+        if cls._load_executor is not None:
+            cls._load_executor.shutdown(wait=False)
+            cls._load_executor = None
+
+    @classmethod
+    def _get_load_executor(cls) -> ThreadPoolExecutor:
+        if cls._load_executor is None:
+            cls._load_executor = ThreadPoolExecutor(
+                max_workers=cls.LOAD_WORKERS,
+                thread_name_prefix="DataManager-Load",
+            )
+        return cls._load_executor
+
+    @classmethod
+    def _load_many(cls, paths: List[str]) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Lädt mehrere JSON-Dateien (über den Entity-Cache) und liefert (Pfad, Daten) in
+        der Reihenfolge von paths. Mit LOAD_WORKERS > 1 wird Öffnen und Parsen auf einen
+        Thread-Pool verteilt. Nicht lesbare Dateien und Nicht-Objekte werden geloggt und
+        übersprungen.
+        """
+        cls._get_entity_cache()  # vor dem Auffächern anlegen
+
+        def load(path: str):
+            try:
+                return path, cls._load_json(path), None
+            except Exception as e:
+                return path, None, e
+
+        if cls.LOAD_WORKERS > 1 and len(paths) > 1:
+            loaded = list(cls._get_load_executor().map(load, paths))
+        else:
+            loaded = [load(path) for path in paths]
+
+        results: List[Tuple[str, Dict[str, Any]]] = []
+        for path, data, error in loaded:
+            if error is not None:
+                logger.error(f"Fehler beim Laden von {path}: {error}")
+            elif not isinstance(data, dict):
+                logger.error(f"Unerwarteter Inhalt in {path}: JSON-Objekt erwartet.")
+            else:
+                results.append((path, data))
+        return results
+
+    @classmethod
+    def _list_json_files(cls, base_dir: str, recursive: bool = True) -> List[str]:
+        """
+        Liefert alle JSON-Dateien unterhalb von base_dir.
+        Im Überwachungsmodus aus dem Speicher, sonst über das Manifest bzw. os.listdir.
+        """
+        return [path for path, _ in cls._list_json_files_signed(base_dir, recursive)]
+
+    @classmethod
+    def _list_json_files_signed(
+        cls, base_dir: str, recursive: bool = True
+    ) -> List[Tuple[str, Optional[Tuple[int, int]]]]:
+        """
+        Wie _list_json_files, zusätzlich mit der Signatur (mtime_ns, Größe) jeder Datei,
+        soweit sie ohne eigenes stat bekannt ist (aus dem Manifest), sonst None.
+        """
+        watched = cls._watched_json_files(base_dir, recursive)
+        if watched is not None:
+            return [(path, None) for path in watched]
+
+        files = cls._list_json_files_on_disk(base_dir, recursive)
+        if cls._writer is not None:
+            # neu angelegte Dateien, die der Hintergrund-Schreiber noch nicht geschrieben hat
+            known = {path for path, _ in files}
+            for path in cls._writer.pending_paths():
+                if path in known or not cls._is_within(path, base_dir):
+                    continue
+                if recursive or os.path.dirname(path) == base_dir:
+                    files.append((path, None))
+            files.sort(key=lambda entry: entry[0])
+        return files
+
+    @classmethod
+    def _get_manifest(cls) -> Optional[DataManifest]:
+        if not cls.MANIFEST_ENABLED:
+            return None
+        if cls._manifest is None:
+            cls._manifest = DataManifest(cls.MANIFEST_FILE, cls.DATA_DIR)
+        return cls._manifest
+
+    @classmethod
+    def invalidate_manifest(cls) -> None:
+        """
+        Erzwingt beim nächsten Zugriff ein vollständiges Neulisten aller Ordner und einen
+        Abgleich von Such- und Charakterindex (z. B. nachdem Dateien außerhalb der
+        Anwendung an Ort und Stelle bearbeitet wurden).
+        """
+        manifest = cls._get_manifest()
+        if manifest is not None:
+            manifest.invalidate()
+            manifest.save()
+        cls._invalidate_indexes()
+
+    @classmethod
+    def _invalidate_indexes(cls) -> None:
+        """Such- und Charakterindex beim nächsten Zugriff einmal mit dem Datenordner abgleichen."""
+        cls._index_generation += 1
+
+    @classmethod
+    def _list_json_files_on_disk(
+        cls, base_dir: str, recursive: bool
+    ) -> List[Tuple[str, Optional[Tuple[int, int]]]]:
+        if not os.path.isdir(base_dir):
+            return []
+        # sortiert, damit die Ergebnisreihenfolge nicht vom Dateisystem abhängt
+        if not recursive:
+            return sorted(
+                (os.path.join(base_dir, fname), None)
+                for fname in io_stats.listdir(base_dir)
+                if fname.lower().endswith(".json")
+            )
+        manifest = cls._get_manifest()
+        if manifest is not None:
+            # nur Ordner mit geänderter mtime werden neu gelistet
+            return manifest.walk(base_dir)
+        files: List[Tuple[str, Optional[Tuple[int, int]]]] = []
+        for root, dirnames, filenames in io_stats.walk(base_dir):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for fname in filenames:
+                if fname.lower().endswith(".json"):
+                    files.append((os.path.join(root, fname), None))
+        return sorted(files)
+
+    @classmethod
+    def _scan_tree(cls, base_dir: str) -> Dict[str, List[Tuple[str, Dict[str, Any]]]]:
+        """
+        Durchläuft base_dir genau einmal und ordnet jede JSON-Datei ihrem Entity-Typ zu
+        (z. B. Charakter, Kampagne und Quest unter data/campaigns in einem Durchgang).
+        Im Überwachungsmodus wird die Zuordnung bis zur nächsten Änderung wiederverwendet.
+        """
+        memo = cls._scan_memo.get(base_dir) if cls._watcher is not None else None
+        if memo is not None and memo[0] == cls._data_generation:
+            result: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+            for kind, paths in memo[1].items():
+                result[kind] = [(full_path, data) for full_path, data in cls._load_many(paths)]
+            return result
+
+        generation = cls._data_generation
+        result = {}
+        for full_path, data in cls._load_many(cls._list_json_files(base_dir)):
+            kind = cls._classify_entity(full_path, data)
+            if kind:
+                result.setdefault(kind, []).append((full_path, data))
+
+        if cls._watcher is not None:
+            cls._scan_memo[base_dir] = (generation, {k: [p for p, _ in v] for k, v in result.items()})
+        return result
+
+    @classmethod
+    def _iter_entities(cls, base_dir: str, kind: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Wie _scan_tree(base_dir)[kind], aber als Generator: jede Datei wird erst geöffnet,
+        wenn der Aufrufer das nächste Element anfordert. Im Überwachungsmodus werden
+        nur die bereits als kind bekannten Dateien geöffnet.
+        """
+        memo = cls._scan_memo.get(base_dir) if cls._watcher is not None else None
+        if memo is not None and memo[0] == cls._data_generation:
+            paths, classify = memo[1].get(kind, []), False
+        else:
+            paths, classify = cls._list_json_files(base_dir), True
+
+        for full_path in paths:
+            try:
+                data = cls._load_json(full_path)
+            except Exception as e:
+                logger.error(f"Fehler beim Laden von {full_path}: {e}")
+                continue
+            if not isinstance(data, dict):
+                continue
+            if classify and cls._classify_entity(full_path, data) != kind:
+                continue
+            yield full_path, data
+
+    @staticmethod
+    def _filter_entries(
+        entries: Iterable[Dict[str, Any]],
+        where: Optional[Callable[[Dict[str, Any]], bool]],
+        limit: Optional[int],
+        fields: Dict[str, Any],
+        defaults: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Filtert Einträge ({"data", "path", "display"}) nach Feldwerten (Gleichheit, fehlende
+        Felder über defaults) und optional where(data); bricht nach limit Treffern ab.
+        """
+        defaults = defaults or {}
+
+        def matches(entry: Dict[str, Any]) -> bool:
+            data = entry["data"]
+            for key, expected in fields.items():
+                if data.get(key, defaults.get(key)) != expected:
+                    return False
+            return where is None or bool(where(data))
+
+        matching = (entry for entry in entries if matches(entry))
+        if limit is not None:
+            matching = itertools.islice(matching, max(0, int(limit)))
+        return matching
+
+    @classmethod
+    def _touch_data(cls) -> None:
+        """Markiert den Datenbestand als verändert (verwirft gemerkte Scan-Ergebnisse)."""
+        cls._data_generation += 1
+
+    @classmethod
+    def cache_stats(cls) -> Dict[str, int]:
+        """Trefferstatistik des Entity-Caches (hits, misses, evictions, entries, bytes)."""
+        return cls._get_entity_cache().stats()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Leert den Entity-Cache und setzt die Zähler zurück."""
+        cache = cls._get_entity_cache()
+        cache.invalidate()
+        cache.reset_stats()
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """
+        Momentaufnahme der Messwerte seit Programmstart bzw. reset_stats():
+        - "io": stat_calls, dir_listings, files_opened, bytes_read, parse_s (JSON-Parsen),
+          files_written, bytes_written, encode_s (JSON-Erzeugen) – inkl. Indizes/Manifest
+        - "calls": pro öffentlicher Methode calls, total_ms, avg_ms, max_ms
+        - "cache": Trefferstatistik des Entity-Caches (siehe cache_stats)
+        """
+        snapshot = IO_STATS.snapshot()
+        snapshot["cache"] = cls.cache_stats()
+        return snapshot
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        """Setzt alle Zähler von stats() zurück (der Inhalt des Entity-Caches bleibt)."""
+        IO_STATS.reset()
+        cls._get_entity_cache().reset_stats()
+
+    @classmethod
+    def _log_slow_call(cls, name: str, elapsed: float, before: Dict[str, float]) -> None:
+        after = IO_STATS.counters()
+        delta = {key: after[key] - before.get(key, 0) for key in after}
+        caller = "?"
+        for frame in reversed(traceback.extract_stack()):
+            if os.path.abspath(frame.filename) != os.path.abspath(__file__):
+                caller = f"{os.path.relpath(frame.filename, cls.BASE_DIR)}:{frame.lineno} ({frame.name})"
+                break
+        logger.warning(
+            f"Langsamer Aufruf: {name} dauerte {elapsed * 1000.0:.0f} ms – "
+            f"stat {delta['stat_calls']:.0f}, Verzeichnisse {delta['dir_listings']:.0f}, "
+            f"geöffnet {delta['files_opened']:.0f} ({delta['bytes_read'] / 1024:.0f} KiB, "
+            f"Parsen {delta['parse_s'] * 1000.0:.0f} ms), geschrieben {delta['files_written']:.0f} "
+            f"({delta['bytes_written'] / 1024:.0f} KiB) – aufgerufen von {caller}"
+        )
+
+    @staticmethod
+    def _is_within(path: str, base_dir: str) -> bool:
+        try:
+            return os.path.commonpath([os.path.abspath(path), base_dir]) == base_dir
+        except ValueError:
+            return False
+
+    @classmethod
+    def _classify_entity(cls, path: str, data: Dict[str, Any]) -> Optional[str]:
+        """
+        Ordnet eine geladene JSON-Datei anhand von Ablageort und Inhalt einem Entity-Typ zu.
+        Gleiche Heuristiken wie in den get_all_*-Methoden.
+        """
+        if not isinstance(data, dict) or "id" not in data:
+            return None
+        is_character = "hitpoints" in data or "age" in data
+
+        if cls._is_within(path, cls.PLAYERS_DIR):
+            return cls.KIND_PLAYER
+        if cls._is_within(path, cls.ITEMS_DIR):
+            return cls.KIND_ITEM if "name" in data else None
+        if cls._is_within(path, cls.CONDITIONS_DIR):
+            return cls.KIND_CONDITION if "name" in data else None
+        if cls._is_within(path, cls.CHARACTERS_DIR):
+            return cls.KIND_CHARACTER if is_character else None
+        if cls._is_within(path, cls.CAMPAIGNS_DIR):
+            if is_character:
+                return cls.KIND_CHARACTER
+            rel_parts = os.path.relpath(path, cls.CAMPAIGNS_DIR).split(os.sep)
+            if cls.QUESTS_SUBDIR in rel_parts[:-1] and "title" in data:
+                return cls.KIND_QUEST
+            if "title" in data and "type" in data:
+                return cls.KIND_CAMPAIGN
+        return None
+
+    @classmethod
+    def _get_id_index(cls) -> EntityIndex:
+        if cls._id_index is None:
+            cls._id_index = EntityIndex(
+                cls.ID_INDEX_FILE,
+                cls.DATA_DIR,
+                roots=[cls.CHARACTERS_DIR, cls.CAMPAIGNS_DIR, cls.ITEMS_DIR, cls.CONDITIONS_DIR, cls.PLAYERS_DIR],
+                classify=cls._classify_entity,
+                load=cls._load_json,
+            )
+        return cls._id_index
+
+    @classmethod
+    def _load_by_id(cls, entity_id: str, kind: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Löst eine ID über den ID-Index auf und öffnet genau eine Datei.
+        Nur wenn der Eintrag fehlt oder veraltet ist, wird der Index anhand der
+        Verzeichnis-mtimes aufgefrischt und ein zweites Mal nachgeschlagen.
+        """
+        if not entity_id:
+            return None
+        index = cls._get_id_index()
+        for attempt in range(2):
+            if attempt:
+                cls._ensure_dirs()
+                if not index.refresh():
+                    return None
+            hit = index.get(str(entity_id))
+            if not hit or hit[1] != kind:
+                continue
+            path = hit[0]
+            try:
+                data = cls._load_json(path)
+            except FileNotFoundError:
+                index.forget_path(path)
+                continue
+            except Exception as e:
+                logger.error(f"Fehler beim Lesen von {path}: {e}")
+                return None
+            if isinstance(data, dict) and data.get("id") == entity_id:
+                return path, data
+            index.forget_path(path)
+        return None
+
+    @classmethod
+    def _after_save(
+        cls,
+        path: str,
+        data: Dict[str, Any],
+        kind: str,
+        old_path: Optional[str] = None,
+        persist: bool = True,
+    ) -> None:
+        """
+        Hält ID-Index und Entity-Cache nach einem save_* aktuell.
+        persist=False schreibt die Indexdatei nicht (save_many speichert sie einmal am Ende).
+        """
+        cls._touch_data()
+        index = cls._get_id_index()
+        if old_path and old_path != path:
+            index.forget_path(old_path, persist=persist)
+            cls._get_entity_cache().invalidate(old_path)
+            cls._get_summary_store().forget(old_path)
+        index.record(path, str(data.get("id")), kind, persist=persist)
+        cls._get_image_store().assign(str(data.get("id")), data.get("image_filename"), persist=persist)
+        if cls._writer is None:
+            # im Write-Behind-Modus erst, wenn die Datei wirklich geschrieben ist
+            cls._remember_saved(path, data, kind)
+        if old_path and old_path != path and cls._search_index is not None:
+            cls._search_index.forget(old_path)
+        if cls._character_index is not None:
+            if old_path and old_path != path:
+                cls._character_index.forget(old_path)
+            if kind == cls.KIND_CHARACTER:
+                cls._character_index.put(path, cls._summarize(data))
+        if cls._watcher is not None:
+            if old_path and old_path != path:
+                cls._watch_forget(old_path)
+            cls._watch_add(path)
+        cls._journal_change(kind, str(data.get("id")), path, data)
+
+    # --- SUMMARIES (Kopfdaten für Auswahllisten) ---
+
+    @classmethod
+    def _get_summary_store(cls) -> SummaryStore:
+        if cls._summary_store is None:
+            cls._summary_store = SummaryStore(cls.SUMMARY_FILE, cls.DATA_DIR)
+        return cls._summary_store
+
+    @classmethod
+    def _summarize(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: data[key] for key in cls.SUMMARY_FIELDS if key in data}
+
+    @classmethod
+    def _display_for(cls, kind: str, data: Dict[str, Any]) -> str:
+        if kind == cls.KIND_CHARACTER:
+            return cls._character_display(data)
+        if kind == cls.KIND_CAMPAIGN:
+            return cls._campaign_display(data)
+        if kind == cls.KIND_QUEST:
+            return cls._quest_display(data)
+        if kind == cls.KIND_PLAYER:
+            return cls._player_display(data)
+        return cls._named_display(data)
+
+    @classmethod
+    def _summary_sources(cls, kind: str, campaign_id: Optional[str]) -> List[Tuple[str, bool]]:
+        """(Ordner, rekursiv) je Entity-Typ – entsprechend der get_all_*-Methoden."""
+        if kind == cls.KIND_CHARACTER:
+            return [(cls.CHARACTERS_DIR, True), (cls.CAMPAIGNS_DIR, True)]
+        if kind == cls.KIND_CAMPAIGN:
+            return [(cls.CAMPAIGNS_DIR, True)]
+        if kind == cls.KIND_QUEST:
+            return [(cls._get_campaign_quests_dir(str(campaign_id)), True)] if campaign_id else []
+        if kind == cls.KIND_ITEM:
+            cls._migrate_items_if_needed()
+            return [(cls.ITEMS_DIR, True)]
+        if kind == cls.KIND_CONDITION:
+            cls._migrate_conditions_if_needed()
+            return [(cls.CONDITIONS_DIR, True)]
+        if kind == cls.KIND_PLAYER:
+            return [(cls.PLAYERS_DIR, False)]
+        raise ValueError(f"Unbekannter Entity-Typ: {kind}")
+
+    @classmethod
+    @_instrumented
+    @_backend_method
+    def get_summaries(cls, kind: str, campaign_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Leichte Variante der get_all_*-Methoden für Auswahllisten.
+        Liefert je Entity {"path", "display", "summary"} – ohne das vollständige Dokument.
+        Die Kopfdaten kommen aus einer Sidecar-Datei; geöffnet werden nur Dateien, die
+        sich seit dem letzten Aufruf geändert haben. Das vollständige Dokument lädt
+        load_entity_data(path) bei Bedarf.
+        """
+        cls._ensure_dirs()
+        store = cls._get_summary_store()
+        results: List[Dict[str, Any]] = []
+
+        for base_dir, recursive in cls._summary_sources(kind, campaign_id):
+            entries: List[Tuple[str, Any]] = []
+            missing: Dict[str, Tuple[int, int]] = {}
+            for full_path, signature in cls._list_json_files_signed(base_dir, recursive):
+                if signature is None:
+                    try:
+                        st = io_stats.stat(full_path)
+                    except OSError:
+                        continue
+                    signature = (st.st_mtime_ns, st.st_size)
+                hit = store.get(full_path, signature)
+                if hit is None:
+                    missing[full_path] = signature
+                entries.append((full_path, hit))
+
+            # Nur geänderte/neue Dateien öffnen – ggf. parallel
+            loaded = dict(cls._load_many(list(missing)))
+            for full_path, hit in entries:
+                if hit is None:
+                    if full_path not in loaded:
+                        continue
+                    data = loaded[full_path]
+                    entry_kind = cls._classify_entity(full_path, data)
+                    summary = cls._summarize(data) if entry_kind else {}
+                    store.put(full_path, missing[full_path], entry_kind, summary)
+                else:
+                    entry_kind, summary = hit
+                if entry_kind != kind:
+                    continue
+                results.append({"path": full_path, "display": cls._display_for(kind, summary), "summary": summary})
+            if recursive:
+                store.prune(base_dir, {full_path for full_path, _ in entries})
+
+        store.save()
+        return results
+
+    @classmethod
+    @_instrumented
+    @_backend_method
+    def load_entity_data(cls, path: str) -> Optional[Dict[str, Any]]:
+        """Lädt das vollständige Dokument zu einem Eintrag aus get_summaries()."""
+        try:
+            return cls._load_json(path)
+        except Exception as e:
+            logger.error(f"Fehler beim Laden von {path}: {e}")
+            return None
+
+    # --- SEARCH (Volltextsuche) ---
+
+    @classmethod
+    def _get_search_index(cls) -> SearchIndex:
+        if cls._search_index is None:
+            cls._search_index = SearchIndex(cls.SEARCH_FILE, cls.DATA_DIR)
+        return cls._search_index
+
+    @classmethod
+    def _search_terms(cls, data: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Gewichtete Wörter eines Dokuments: alle Texte (auch verschachtelt, z. B. Fertigkeiten
+        oder Attribute inkl. ihrer Namen) außer ID-Feldern; Name/Titel zählen mehr.
+        """
+        terms: Dict[str, float] = {}
+
+        def add(text: str, weight: float) -> None:
+            for token in tokenize(text):
+                terms[token] = terms.get(token, 0.0) + weight
+
+        def walk(value: Any, weight: float) -> None:
+            if isinstance(value, str):
+                add(value, weight)
+            elif isinstance(value, dict):
+                for key, sub in value.items():
+                    key = str(key)
+                    if key in cls.SEARCH_SKIP_FIELDS or key.endswith("_id") or key.endswith("_ids"):
+                        continue
+                    add(key, weight * 0.5)
+                    walk(sub, weight)
+            elif isinstance(value, list):
+                for sub in value:
+                    walk(sub, weight)
+
+        for key, value in data.items():
+            if key in cls.SEARCH_SKIP_FIELDS or key.endswith("_id") or key.endswith("_ids"):
+                continue
+            walk(value, cls.SEARCH_FIELD_WEIGHTS.get(key, 1.0))
+        return {term: round(weight, 3) for term, weight in terms.items()}
+
+    @classmethod
+    def _index_for_search(cls, path: str, signature: Tuple[int, int], kind: Optional[str], data: Dict[str, Any]) -> None:
+        index = cls._get_search_index()
+        if kind in cls.SEARCH_KINDS:
+            index.put(path, signature, kind, str(data.get("id")), cls._display_for(kind, data), cls._search_terms(data))
+        else:
+            # bekannt, aber nicht durchsuchbar (z. B. Kampagnen) -> beim nächsten Abgleich nicht erneut lesen
+            index.put(path, signature, kind)
+
+    @classmethod
+    def _sync_search_index(cls) -> SearchIndex:
+        """
+        Gleicht den Suchindex mit dem Datenordner ab: nur stat, geöffnet werden
+        ausschließlich neue und geänderte Dateien. Das passiert einmal nach dem Start und
+        nach invalidate_manifest(); sonst halten save_*/delete_* (und im Überwachungsmodus
+        die Dateiereignisse) den Index aktuell.
+        """
+        index = cls._get_search_index()
+        if index.generation == cls._index_generation:
+            return index
+        generation = cls._index_generation
+        cls._migrate_items_if_needed()
+        cls._migrate_conditions_if_needed()
+        cls._ensure_dirs()
+
+        for base_dir in (cls.CHARACTERS_DIR, cls.CAMPAIGNS_DIR, cls.ITEMS_DIR, cls.CONDITIONS_DIR):
+            seen: List[str] = []
+            changed: Dict[str, Tuple[int, int]] = {}
+            for full_path, signature in cls._list_json_files_signed(base_dir):
+                if signature is None:
+                    try:
+                        st = io_stats.stat(full_path)
+                    except OSError:
+                        continue
+                    signature = (st.st_mtime_ns, st.st_size)
+                seen.append(full_path)
+                if not index.is_current(full_path, signature):
+                    changed[full_path] = signature
+            for full_path, data in cls._load_many(list(changed)):
+                cls._index_for_search(full_path, changed[full_path], cls._classify_entity(full_path, data), data)
+            index.prune(base_dir, seen)
+
+        index.save()
+        index.generation = generation
+        return index
+
+    @classmethod
+    @_instrumented
+    @_backend_method
+    def search(cls, text: str, kinds: Optional[Iterable[str]] = None, limit: Optional[int] = 50) -> List[Dict[str, Any]]:
+        """
+        Volltextsuche über Charaktere, Items, Zustände und Quests (Namen, Beschreibungen,
+        Attribute, Fertigkeiten, Quest-Texte). Alle Suchwörter müssen vorkommen, auch als
+        Wortanfang ("gift" findet "Giftpfeil"). kinds schränkt auf KIND_*-Typen ein.
+        Liefert {"kind", "id", "path", "display", "score"}, bestbewertete zuerst;
+        das Dokument lädt load_entity_data(path).
+        """
+        if cls._backend is not None:
+            # Backend ohne eigene Suche: Dokumente einmal in einen flüchtigen Index übernehmen
+            index = SearchIndex(None, cls.DATA_DIR)
+            sources = {
+                cls.KIND_CHARACTER: cls.get_all_characters,
+                cls.KIND_ITEM: cls.get_all_items_meta,
+                cls.KIND_CONDITION: cls.get_all_conditions_meta,
+                cls.KIND_QUEST: lambda: [
+                    quest
+                    for campaign in cls.get_all_campaigns()
+                    for quest in cls.get_all_quests_meta(str(campaign["data"].get("id")))
+                ],
+            }
+            for kind, load in sources.items():
+                if kinds is not None and kind not in kinds:
+                    continue
+                for entry in load():
+                    data = entry["data"]
+                    index.put(entry["path"], (0, 0), kind, str(data.get("id")), entry["display"], cls._search_terms(data))
+            return index.search(text, kinds, limit)
+
+        return cls._sync_search_index().search(text, kinds, limit)
+
+    # --- WATCH MODE ---
+
+    @classmethod
+    def _watch_roots(cls) -> List[str]:
+        return [cls.CHARACTERS_DIR, cls.CAMPAIGNS_DIR, cls.ITEMS_DIR, cls.CONDITIONS_DIR, cls.PLAYERS_DIR]
+
+    @classmethod
+    def _watch_root_of(cls, path: str) -> Optional[str]:
+        for root in cls._watch_roots():
+            if cls._is_within(path, root):
+                return root
+        return None
+
+    @classmethod
+    def _watched_json_files(cls, base_dir: str, recursive: bool) -> Optional[List[str]]:
+        if cls._watcher is None:
+            return None
+        root = cls._watch_root_of(base_dir)
+        if root is None:
+            return None
+        base_dir = os.path.abspath(base_dir)
+        prefix = base_dir + os.sep
+        with cls._watch_lock:
+            known = cls._watched_files.get(root, set())
+            if recursive:
+                return sorted(p for p in known if p.startswith(prefix))
+            return sorted(p for p in known if os.path.dirname(p) == base_dir)
+
+    @classmethod
+    def _watch_add(cls, path: str) -> None:
+        root = cls._watch_root_of(path)
+        if root is None:
+            return
+        with cls._watch_lock:
+            cls._watched_files.setdefault(root, set()).add(os.path.abspath(path))
+
+    @classmethod
+    def _watch_forget(cls, path: str, is_dir: bool = False) -> List[str]:
+        """Entfernt eine Datei (oder alle Dateien eines Ordners) aus dem Überwachungsbestand."""
+        root = cls._watch_root_of(path)
+        if root is None:
+            return []
+        path = os.path.abspath(path)
+        with cls._watch_lock:
+            known = cls._watched_files.get(root, set())
+            if is_dir:
+                prefix = path + os.sep
+                removed = [p for p in known if p.startswith(prefix)]
+            else:
+                removed = [path] if path in known else []
+            known.difference_update(removed)
+        return removed
+
+    @classmethod
+    def _on_data_changed(cls, event_type: str, path: str) -> None:
+        """Callback des DataWatchers (läuft im Watcher-Thread)."""
+        cls._touch_data()
+        cache = cls._get_entity_cache()
+        index = cls._get_id_index()
+
+        if event_type in (data_watcher.EVENT_DIR_CREATED, data_watcher.EVENT_DIR_DELETED):
+            if os.path.dirname(path) == cls.CAMPAIGNS_DIR:
+                cls._campaign_dirs = None
+
+        if event_type == data_watcher.EVENT_DIR_DELETED:
+            for removed in cls._watch_forget(path, is_dir=True):
+                cache.invalidate(removed)
+                index.forget_path(removed, persist=False)
+                if cls._search_index is not None:
+                    cls._search_index.forget(removed)
+            if cls._character_index is not None:
+                cls._character_index.forget_under(path)
+            return
+
+        if event_type == data_watcher.EVENT_DIR_CREATED:
+            for json_path in cls._walk_json_files(path):
+                cls._on_data_changed(data_watcher.EVENT_CREATED, json_path)
+            return
+
+        if event_type == data_watcher.EVENT_DELETED:
+            cls._watch_forget(path)
+            cache.invalidate(path)
+            index.forget_path(path, persist=False)
+            if cls._character_index is not None:
+                cls._character_index.forget(path)
+            if cls._search_index is not None:
+                cls._search_index.forget(path)
+            return
+
+        # created / modified
+        try:
+            data = cls._load_json(path, validate=True)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            # z. B. halb geschriebene Datei – beim nächsten Ereignis erneut versuchen
+            logger.debug(f"Geänderte Datei {path} noch nicht lesbar: {e}")
+            cache.invalidate(path)
+            return
+        cls._watch_add(path)
+        kind = cls._classify_entity(path, data)
+        if kind:
+            index.record(path, str(data["id"]), kind, persist=False)
+        else:
+            index.forget_path(path, persist=False)
+        if cls._character_index is not None:
+            if kind == cls.KIND_CHARACTER:
+                cls._character_index.put(path, cls._summarize(data))
+            else:
+                cls._character_index.forget(path)
+        if cls._search_index is not None:
+            try:
+                st = io_stats.stat(path)
+            except OSError:
+                return
+            cls._index_for_search(path, (st.st_mtime_ns, st.st_size), kind, data)
+
+    @staticmethod
+    def _walk_json_files(base_dir: str) -> List[str]:
+        files: List[str] = []
+        for root, dirnames, filenames in io_stats.walk(base_dir):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for fname in filenames:
+                if fname.lower().endswith(".json"):
+                    files.append(os.path.abspath(os.path.join(root, fname)))
+        return files
 
     @classmethod
-    def _ensure_dirs(cls):
-        os.makedirs(cls.CHARACTERS_DIR, exist_ok=True)
-        os.makedirs(cls.CAMPAIGNS_DIR, exist_ok=True)
-        os.makedirs(cls.ITEMS_DIR, exist_ok=True)
-        os.makedirs(cls.CONDITIONS_DIR, exist_ok=True)
-        os.makedirs(cls.PLAYERS_DIR, exist_ok=True)
+    def start_watching(cls, poll_interval: float = 2.0) -> None:
+        """
+        Schaltet den Überwachungsmodus ein: Der Datenordner wird einmal eingelesen,
+        danach halten Dateisystem-Ereignisse (watchdog/inotify, sonst Polling) Cache,
+        ID-Index und Dateibestand aktuell. get_all_* muss dann nicht mehr den
+        Verzeichnisbaum durchlaufen.
+        """
+        if cls._watcher is not None:
+            return
+        cls._ensure_dirs()
+        cls._get_id_index().refresh()
+
+        with cls._watch_lock:
+            cls._watched_files = {
+                root: {path for path, _ in cls._list_json_files_on_disk(root, True)}
+                for root in cls._watch_roots()
+            }
+        cls._scan_memo = {}
+        # ab jetzt über Ereignisse gepflegt -> einmal frisch abgleichen
+        cls._invalidate_indexes()
+
+        watcher = DataWatcher(cls._watch_roots(), cls._on_data_changed, poll_interval=poll_interval)
+        watcher.start()
+        cls._watcher = watcher
+        logger.info(f"Datenordner wird überwacht ({watcher.backend}).")
 
-    # --- helpers ---
+    @classmethod
+    def stop_watching(cls) -> None:
+        """Beendet den Überwachungsmodus; get_all_* liest danach wieder direkt vom Dateisystem."""
+        watcher = cls._watcher
+        if watcher is None:
+            return
+        cls._watcher = None
+        watcher.stop()
+        with cls._watch_lock:
+            cls._watched_files = {}
+        cls._scan_memo = {}
+        cls._get_id_index().save()
+
+    @classmethod
+    def is_watching(cls) -> bool:
+        return cls._watcher is not None
 
     @staticmethod
-    def _safe_name(name: str, fallback: str = "Unbenannt") -> str:
-        safe = "".join(c for c in (name or "") if c.isalnum() or c in (" ", "-", "_")).strip()
-        return safe or fallback
+    def _campaign_id_of_folder(folder_name: str) -> str:
+        """'<Titel> - <UUID>' -> '<UUID>'; legacy-Ordner heißen direkt '<UUID>'."""
+        if " - " in folder_name:
+            return folder_name.rsplit(" - ", 1)[1]
+        return folder_name
 
     @classmethod
-    def _copy_entity_image(
-        cls,
-        *,
-        entity_safe_name: str,
-        entity_id: str,
-        target_folder_path: str,
-        image_source_path: Optional[str],
-    ) -> Optional[str]:
+    def _get_campaign_dirs(cls) -> Dict[str, str]:
         """
-        Kopiert ein Bild in den Zielordner und liefert den gespeicherten Dateinamen zurück.
-        Akzeptiert: png/jpg/jpeg/webp
+        Zuordnung Kampagnen-ID -> Ordner. Wird neu aufgebaut, wenn sich die mtime von
+        CAMPAIGNS_DIR geändert hat (Ordner angelegt/gelöscht/umbenannt); im
+        Überwachungsmodus setzt der Watcher die Zuordnung selbst zurück.
         """
-        if not image_source_path or not os.path.exists(image_source_path):
-            return None
+        campaign_dirs = cls._campaign_dirs
+        if campaign_dirs is not None and cls._watcher is not None:
+            return campaign_dirs
+        try:
+            mtime = io_stats.stat(cls.CAMPAIGNS_DIR).st_mtime_ns
+        except OSError:
+            return {}
+        if campaign_dirs is not None and mtime == cls._campaign_dirs_mtime:
+            return campaign_dirs
+
+        candidates: Dict[str, List[str]] = {}
+        legacy: Dict[str, str] = {}
+        for entry in sorted(io_stats.scandir(cls.CAMPAIGNS_DIR), key=lambda e: e.name):
+            if entry.name.startswith(".") or not entry.is_dir():
+                continue
+            campaign_id = cls._campaign_id_of_folder(entry.name)
+            if campaign_id == entry.name:
+                legacy[campaign_id] = entry.path
+            else:
+                candidates.setdefault(campaign_id, []).append(entry.path)
+        # mehrere Ordner mit derselben ID (z. B. nach einer Umbenennung, deren Verschieben
+        # fehlgeschlagen ist): maßgeblich ist der Ordner mit Quests/Charakteren
+        campaign_dirs = {
+            campaign_id: paths[0] if len(paths) == 1 else next(
+                (path for path in paths if cls._has_subdirs(path)), paths[0]
+            )
+            for campaign_id, paths in candidates.items()
+        }
+        # legacy-Struktur hat wie bisher Vorrang
+        campaign_dirs.update(legacy)
+        cls._campaign_dirs = campaign_dirs
+        cls._campaign_dirs_mtime = mtime
+        return campaign_dirs
 
-        import shutil
+    @staticmethod
+    def _has_subdirs(folder_path: str) -> bool:
+        try:
+            return any(entry.is_dir() for entry in io_stats.scandir(folder_path))
+        except OSError:
+            return False
 
-        _, ext = os.path.splitext(image_source_path)
-        ext = ext.lower()
-        allowed_exts = {".png", ".jpg", ".jpeg", ".webp"}
-        if ext not in allowed_exts:
-            logger.warning(f"Nicht unterstütztes Bildformat: {image_source_path}")
+    @classmethod
+    def _move_campaign_dir(cls, campaign_id: str, folder_path: str) -> Optional[str]:
+        """
+        Benennt beim Umbenennen einer Kampagne den bisherigen Ordner samt Quests,
+        Charakteren und Bildern in folder_path um. Legacy-Ordner ('<UUID>/') bleiben,
+        wo sie sind. Rückgabe: bisheriger Ordner oder None, wenn nichts verschoben wurde.
+        """
+        current = cls._get_campaign_dirs().get(campaign_id)
+        if (
+            current is None
+            or os.path.basename(current) == campaign_id
+            or os.path.abspath(current) == os.path.abspath(folder_path)
+            or not os.path.isdir(current)
+            or os.path.exists(folder_path)
+        ):
             return None
 
-        image_filename = f"{entity_safe_name} - {entity_id}{ext}"
-        image_target_path = os.path.join(target_folder_path, image_filename)
+        # eingereihte Dateien im alten Ordner vorher schreiben, sonst legt der
+        # Hintergrund-Schreiber ihn danach neu an
+        if cls._writer is not None:
+            cls.flush()
+        old_files = cls._walk_json_files(current)
         try:
-            shutil.copyfile(image_source_path, image_target_path)
-            return image_filename
-        except Exception as e:
-            logger.error(f"Fehler beim Kopieren des Bildes nach {image_target_path}: {e}")
+            os.replace(current, folder_path)
+        except OSError as e:
+            logger.warning(f"Kampagnenordner {current} konnte nicht umbenannt werden: {e}")
             return None
+        cls._watch_forget(current, is_dir=True)
+        cls._forget_deleted(old_files)
+        cls._touch_data()
+        # Quests und Charaktere liegen jetzt unter neuen Pfaden
+        cls._invalidate_indexes()
+        return current
+
+    @classmethod
+    def _remember_campaign_dir(cls, campaign_id: str, folder_path: str) -> None:
+        """
+        Trägt einen neu angelegten Kampagnenordner ein. Ein bereits bekannter Ordner
+        bleibt maßgeblich (dort liegen die Charaktere und Quests der Kampagne).
+        """
+        campaign_dirs = cls._get_campaign_dirs()
+        current = campaign_dirs.get(campaign_id)
+        if current is None or not os.path.isdir(current):
+            campaign_dirs[campaign_id] = folder_path
+        try:
+            cls._campaign_dirs_mtime = io_stats.stat(cls.CAMPAIGNS_DIR).st_mtime_ns
+        except OSError:
+            pass
 
     @classmethod
     def _find_campaign_base_dir(cls, campaign_id: str) -> str:
         """
         Kampagnen können (neu) als Ordner '<Titel> - <UUID>/' oder (legacy) als '<UUID>/' existieren.
         Diese Funktion liefert den passenden Basispfad für kampagnenspezifische Charaktere.
+        Die Ordner werden über eine gemerkte Zuordnung ID -> Ordner aufgelöst
+        (exakter Vergleich der UUID am Ende des Ordnernamens).
         """
         if not campaign_id:
             return cls.CAMPAIGNS_DIR
 
         cls._ensure_dirs()
-
-        # 1) exakte legacy-Struktur: data/campaigns/<campaign_id>/
-        legacy = os.path.join(cls.CAMPAIGNS_DIR, str(campaign_id))
-        if os.path.isdir(legacy):
-            return legacy
-
-        # 2) neue Struktur: Ordner, dessen Name die UUID enthält
-        try:
-            for entry in os.listdir(cls.CAMPAIGNS_DIR):
-                entry_path = os.path.join(cls.CAMPAIGNS_DIR, entry)
-                if os.path.isdir(entry_path) and str(campaign_id) in entry:
-                    return entry_path
-        except Exception:
-            pass
+        campaign_id = str(campaign_id)
+        hit = cls._get_campaign_dirs().get(campaign_id)
+        if hit is not None:
+            return hit
 
         # Fallback: legacy anlegen
+        legacy = os.path.join(cls.CAMPAIGNS_DIR, campaign_id)
         os.makedirs(legacy, exist_ok=True)
+        cls._remember_campaign_dir(campaign_id, legacy)
         return legacy
 
     @classmethod
@@ -106,9 +1628,103 @@ class DataManager:
         os.makedirs(quests_dir, exist_ok=True)
         return quests_dir
 
+    # --- BULK SAVE ---
+
+    @classmethod
+    def _entity_target(
+        cls,
+        kind: str,
+        data: Dict[str, Any],
+        campaign_dirs: Optional[Dict[str, str]] = None,
+    ) -> Tuple[str, str, str]:
+        """
+        Zielordner, JSON-Pfad und bereinigter Name für Items, Zustände und Charaktere:
+        "<Basis>/<Name> - <UUID>/<Name> - <UUID>.json". campaign_dirs merkt sich bereits
+        aufgelöste Kampagnenordner (für viele Charaktere derselben Kampagne).
+        """
+        entity_id = data["id"]
+        safe_name = cls._safe_name(data.get("name", "Unbenannt"), fallback="Unbenannt")
+        if kind == cls.KIND_ITEM:
+            base_dir = cls.ITEMS_DIR
+        elif kind == cls.KIND_CONDITION:
+            base_dir = cls.CONDITIONS_DIR
+        elif kind == cls.KIND_CHARACTER:
+            campaign_id = data.get("campaign_id")
+            if not campaign_id:
+                base_dir = cls.CHARACTERS_DIR
+            elif campaign_dirs is not None and str(campaign_id) in campaign_dirs:
+                base_dir = campaign_dirs[str(campaign_id)]
+            else:
+                base_dir = cls._find_campaign_base_dir(str(campaign_id))
+                if campaign_dirs is not None:
+                    campaign_dirs[str(campaign_id)] = base_dir
+        else:
+            raise ValueError(f"save_many unterstützt den Typ '{kind}' nicht.")
+        folder_path = os.path.join(base_dir, f"{safe_name} - {entity_id}")
+        return folder_path, os.path.join(folder_path, f"{safe_name} - {entity_id}.json"), safe_name
+
+    @classmethod
+    @_instrumented
+    @_backend_method
+    def save_many(cls, kind: str, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Speichert viele Items, Zustände oder Charaktere in einem Durchgang
+        (gleiches Dateilayout wie save_item/save_condition/save_character).
+        Verzeichnisse werden einmal angelegt, ID-Index und Kopfdaten am Ende einmal
+        geschrieben. Fehlende IDs werden wie bei den Einzel-Methoden vergeben.
+
+        Rückgabe pro Datensatz (gleiche Reihenfolge): {"id", "path", "error"};
+        error ist None bei Erfolg, sonst die Fehlermeldung.
+        """
+        if kind not in (cls.KIND_ITEM, cls.KIND_CONDITION, cls.KIND_CHARACTER):
+            raise ValueError(f"save_many unterstützt den Typ '{kind}' nicht.")
+        cls._ensure_dirs()
+
+        results: List[Dict[str, Any]] = []
+        campaign_dirs: Dict[str, str] = {}
+        saved = 0
+        for record in records:
+            result: Dict[str, Any] = {"id": None, "path": None, "error": None}
+            results.append(result)
+            if not isinstance(record, dict):
+                result["error"] = "Datensatz ist kein Dictionary."
+                continue
+            if not record.get("id"):
+                import uuid
+                record["id"] = str(uuid.uuid4())
+            result["id"] = str(record["id"])
+            try:
+                folder_path, expected_path, _ = cls._entity_target(kind, record, campaign_dirs)
+                result["path"] = expected_path
+                try:
+                    os.mkdir(folder_path)
+                except FileExistsError:
+                    pass
+                cls._write_json(expected_path, record, kind)
+                cls._after_save(expected_path, record, kind, persist=False)
+                saved += 1
+            except Exception as e:
+                logger.error(f"Fehler beim Speichern von {result['path'] or result['id']}: {e}")
+                result["error"] = str(e)
+
+        if saved:
+            cls._get_id_index().save()
+            cls._get_summary_store().save()
+            cls._get_image_store().save()
+        return results
+
     # --- QUEST MANAGEMENT ---
 
+    @staticmethod
+    def _quest_display(data: Dict[str, Any]) -> str:
+        qid = data.get("id", "???")
+        title = data.get("title", "(unbenannt)")
+        status = data.get("status", "")
+        return f"{title} [{qid[:8]}...]" + (f" – {status}" if status else "")
+
     @classmethod
+    @_instrumented
+    @_backend_method
     def get_all_quests_meta(cls, campaign_id: str) -> List[Dict[str, Any]]:
         """Lädt alle Quests einer Kampagne inkl. Dateipfad und Anzeigetext."""
         cls._ensure_dirs()
@@ -121,32 +1737,46 @@ class DataManager:
         if not os.path.exists(quests_dir):
             return results
 
-        for root, _, filenames in os.walk(quests_dir):
-            for fname in filenames:
-                if not fname.lower().endswith(".json"):
-                    continue
-                full_path = os.path.join(root, fname)
-                try:
-                    with open(full_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    if "id" not in data or "title" not in data:
-                        continue
-                    qid = data.get("id", "???")
-                    title = data.get("title", "(unbenannt)")
-                    status = data.get("status", "")
-                    display = f"{title} [{qid[:8]}...]" + (f" – {status}" if status else "")
-                    results.append({"data": data, "path": full_path, "display": display})
-                except Exception as e:
-                    logger.error(f"Fehler beim Laden von Quest {full_path}: {e}")
+        for full_path, data in cls._scan_tree(quests_dir).get(cls.KIND_QUEST, []):
+            results.append({"data": data, "path": full_path, "display": cls._quest_display(data)})
 
         return results
 
     @classmethod
+    @_backend_method
+    def iter_quests(
+        cls,
+        campaign_id: str,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        limit: Optional[int] = None,
+        **fields: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Wie get_all_quests_meta, aber als Generator (Dateien werden erst beim Weiterlesen
+        geöffnet). Filter: Feldwerte als Schlüsselwörter (z. B. status="offen") und/oder
+        where(data); limit begrenzt die Anzahl der Treffer.
+        """
+        if cls._backend is not None:
+            entries: Iterable[Dict[str, Any]] = cls.get_all_quests_meta(campaign_id)
+        elif not campaign_id:
+            entries = []
+        else:
+            cls._ensure_dirs()
+            quests_dir = cls._get_campaign_quests_dir(str(campaign_id))
+            entries = (
+                {"data": data, "path": full_path, "display": cls._quest_display(data)}
+                for full_path, data in cls._iter_entities(quests_dir, cls.KIND_QUEST)
+            )
+        return cls._filter_entries(entries, where, limit, fields)
+
+    @classmethod
+    @_instrumented
+    @_backend_method
     def save_quest(cls, quest_data: Dict[str, Any], file_path: str = None, image_source_path: Optional[str] = None) -> str:
         """
         Speichert eine Quest innerhalb der zugewiesenen Kampagne:
         - data/campaigns/<Kampagne>/quests/<Titel> - <UUID>/<Titel> - <UUID>.json
-        - Optional: Bild im selben Ordner, Referenz in "image_filename"
+        - Optional: Bild (im Bildspeicher, siehe _copy_entity_image), Referenz in "image_filename"
         """
         cls._ensure_dirs()
 
@@ -171,11 +1801,14 @@ class DataManager:
         filename = f"{safe_title} - {quest_id}.json"
         expected_path = os.path.join(quest_folder_path, filename)
 
-        if file_path and file_path != expected_path and os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-            except OSError:
-                pass
+        if file_path and file_path != expected_path:
+            # eingereihten Stand immer verwerfen: die alte Datei ist evtl. noch gar nicht geschrieben
+            cls._discard_pending(file_path)
+            if os.path.exists(file_path):
+                try:
+                    os.remove(file_path)
+                except OSError:
+                    pass
 
         copied = cls._copy_entity_image(
             entity_safe_name=safe_title,
@@ -187,8 +1820,9 @@ class DataManager:
             quest_data["image_filename"] = copied
 
         try:
-            with open(expected_path, "w", encoding="utf-8") as f:
-                json.dump(quest_data, f, indent=4, ensure_ascii=False)
+            cls._write_json(expected_path, quest_data, cls.KIND_QUEST)
+            cls._after_save(expected_path, quest_data, cls.KIND_QUEST, old_path=file_path)
+            cls._remove_renamed_folder(file_path, quest_folder_path, str(quest_id))
             return expected_path
         except Exception as e:
             logger.error(f"Fehler beim Speichern der Quest nach {expected_path}: {e}")
@@ -196,109 +1830,166 @@ class DataManager:
 
     # --- CHARACTER MANAGEMENT ---
     
+    @staticmethod
+    def _character_display(data: Dict[str, Any]) -> str:
+        char_name = data.get("name", "(unbenannt)")
+        char_class = data.get("class", "?")
+        char_age = data.get("age", "?")
+        char_id = data.get("id", "???")
+        return f"{char_name} | {char_class}, {char_age} Jahre [{char_id[:8]}...]"
+
+    @staticmethod
+    def _character_role_display(data: Dict[str, Any]) -> str:
+        char_name = data.get("name", "(unbenannt)")
+        char_class = data.get("class", "?")
+        char_hp = data.get("hitpoints", "?")
+        return f"{char_name} [{char_class}] HP:{char_hp}"
+
     @classmethod
-    def _get_all_character_files(cls) -> List[str]:
+    def _get_all_character_entries(cls) -> List[Tuple[str, Dict[str, Any]]]:
         """
-        Sammelt alle Charakter-JSON-Dateien.
+        Sammelt alle Charaktere als (Dateipfad, Daten).
         Berücksichtigt:
         - Einzelne Dateien direkt in data/characters
         - Charakter-Unterordner (Name - UUID/...) in data/characters
         - Kampagnen-Ordner unter data/campaigns (inkl. dortiger Unterordner)
         """
         cls._ensure_dirs()
-        files: List[str] = []
-
-        dirs_to_search = [cls.CHARACTERS_DIR, cls.CAMPAIGNS_DIR]
+        entries: List[Tuple[str, Dict[str, Any]]] = []
+        for base_dir in (cls.CHARACTERS_DIR, cls.CAMPAIGNS_DIR):
+            entries.extend(cls._scan_tree(base_dir).get(cls.KIND_CHARACTER, []))
+        return entries
 
-        for base_dir in dirs_to_search:
-            if not os.path.exists(base_dir):
-                continue
-            # rekursiv durchlaufen, um auch Unterordner mit Charakteren zu finden
-            for root, _, filenames in os.walk(base_dir):
-                for fname in filenames:
-                    if fname.lower().endswith(".json"):
-                        files.append(os.path.join(root, fname))
-        return files
+    @classmethod
+    def _get_all_character_files(cls) -> List[str]:
+        """Sammelt alle Charakter-JSON-Dateien (siehe _get_all_character_entries)."""
+        return [path for path, _ in cls._get_all_character_entries()]
 
     @classmethod
+    @_instrumented
+    @_backend_method
     def get_all_characters(cls) -> List[Dict[str, Any]]:
         """Lädt alle Charaktereigenschaften inklusive Dateipfad und Anzeigetext."""
-        chars = []
-        for full_path in cls._get_all_character_files():
-            try:
-                with open(full_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    
-                # Überspringe eventuell andere JSONs, die in diesen Ordnern liegen (wie Kampagnen-JSONs)
-                if "hitpoints" not in data and "age" not in data:
-                    continue
-                    
-                char_name = data.get("name", "(unbenannt)")
-                char_class = data.get("class", "?")
-                char_age = data.get("age", "?")
-                char_id = data.get("id", "???")
-                
-                display = f"{char_name} | {char_class}, {char_age} Jahre [{char_id[:8]}...]"
-                
-                chars.append({
-                    "data": data,
-                    "path": full_path,
-                    "display": display,
-                })
-            except Exception as e:
-                logger.error(f"Fehler beim Laden von Charakter {full_path}: {e}")
-        return chars
+        return [
+            {"data": data, "path": full_path, "display": cls._character_display(data)}
+            for full_path, data in cls._get_all_character_entries()
+        ]
+
+    @classmethod
+    @_backend_method
+    def iter_characters(
+        cls,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        limit: Optional[int] = None,
+        **fields: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Wie get_all_characters, aber als Generator: Dateien werden erst beim Weiterlesen
+        geöffnet, wer nur den ersten Treffer, eine Anzahl oder eine Seite braucht, bricht
+        früh ab. Filter: Feldwerte als Schlüsselwörter (z. B. role="npc"; fehlende Rolle
+        zählt als "pc") und/oder where(data); limit begrenzt die Anzahl der Treffer.
+        """
+        if cls._backend is not None:
+            entries: Iterable[Dict[str, Any]] = cls.get_all_characters()
+        else:
+            cls._ensure_dirs()
+            entries = (
+                {"data": data, "path": full_path, "display": cls._character_display(data)}
+                for base_dir in (cls.CHARACTERS_DIR, cls.CAMPAIGNS_DIR)
+                for full_path, data in cls._iter_entities(base_dir, cls.KIND_CHARACTER)
+            )
+        return cls._filter_entries(entries, where, limit, fields, {"role": "pc"})
 
     @classmethod
+    @_instrumented
+    @_backend_method
     def get_character_by_id(cls, char_id: str) -> Optional[Dict[str, Any]]:
-        """Sucht einen Charakter anhand seiner ID."""
-        for full_path in cls._get_all_character_files():
-            try:
-                with open(full_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    if data.get("id") == char_id:
-                        return data
-            except Exception as e:
-                logger.error(f"Fehler beim Lesen von {full_path}: {e}")
-        return None
+        """Sucht einen Charakter anhand seiner ID (über den ID-Index, öffnet genau eine Datei)."""
+        hit = cls._load_by_id(char_id, cls.KIND_CHARACTER)
+        return hit[1] if hit else None
+
+    @classmethod
+    def _get_character_index(cls) -> CharacterIndex:
+        """
+        Sekundärindizes über die Kopfdaten aller Charaktere. Aufgebaut wird einmal nach
+        dem Start und nach invalidate_manifest() (nur stat, geöffnet werden allein geänderte
+        Dateien); danach halten save_*/delete_* und im Überwachungsmodus die
+        Dateiereignisse den Index über put()/forget() aktuell.
+        """
+        index = cls._character_index
+        if index is None:
+            index = CharacterIndex(sort_key=lambda path: (not cls._is_within(path, cls.CHARACTERS_DIR), path))
+        if index.generation != cls._index_generation:
+            generation = cls._index_generation
+            summaries = cls.get_summaries(cls.KIND_CHARACTER)
+            index.rebuild((entry["path"], entry["summary"]) for entry in summaries)
+            index.generation = generation
+        cls._character_index = index
+        return index
+
+    @classmethod
+    @_instrumented
+    @_backend_method
+    def query_characters(
+        cls,
+        role: Optional[str] = None,
+        campaign_id: Optional[str] = None,
+        class_: Optional[str] = None,
+        player_id: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Sucht Charaktere über Sekundärindizes (Rolle, Kampagne, Klasse, Spieler,
+        Namensanfang) und lädt nur die passenden Dokumente.
+        Alle Angaben sind optional und werden UND-verknüpft; fehlende Rolle zählt als "pc".
+        where(data) prüft zusätzlich das vollständige Dokument (z. B. Fertigkeitswerte).
+        Liefert {"data", "path", "display"} wie get_all_characters.
+        """
+        criteria = {
+            field: value
+            for field, value in (("role", role), ("campaign_id", campaign_id), ("class", class_), ("player_id", player_id))
+            if value is not None
+        }
+        if cls._backend is not None:
+            entries: Iterable[Dict[str, Any]] = cls.get_all_characters()
+            if name_prefix:
+                prefix = name_prefix.casefold()
+                entries = (e for e in entries if str(e["data"].get("name") or "").casefold().startswith(prefix))
+            return list(cls._filter_entries(entries, where, limit, criteria, {"role": "pc"}))
+
+        cls._ensure_dirs()
+        paths = cls._get_character_index().query(criteria, name_prefix)
+        if where is None and limit is not None:
+            paths = paths[:max(0, int(limit))]
+        entries = (
+            {"data": data, "path": full_path, "display": cls._character_display(data)}
+            for full_path, data in cls._load_many(paths)
+        )
+        # Kopfdaten können veraltet sein (Datei seit dem Abgleich geändert) -> am Dokument nachprüfen
+        return list(cls._filter_entries(entries, where, limit, criteria, {"role": "pc"}))
 
     @classmethod
+    @_instrumented
+    @_backend_method
     def get_characters_by_role(cls, role_filter: str) -> List[Dict[str, Any]]:
         """Gibt alle Charaktere zurück, die eine bestimmte Rolle besitzen (z.B. 'pc' oder 'npc')."""
-        results = []
-        for full_path in cls._get_all_character_files():
-            try:
-                with open(full_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    
-                if "hitpoints" not in data and "age" not in data:
-                    continue
-                    
-                if data.get("role", "pc") != role_filter:
-                    continue
-                    
-                char_name = data.get("name", "(unbenannt)")
-                char_class = data.get("class", "?")
-                char_hp = data.get("hitpoints", "?")
-                display = f"{char_name} [{char_class}] HP:{char_hp}"
-                
-                results.append({
-                    "display": display,
-                    "path": full_path,
-                    "data": data,
-                })
-            except Exception as e:
-                logger.error(f"Fehler beim Laden von {full_path}: {e}")
-        return results
+        return [
+            {"display": cls._character_role_display(entry["data"]), "path": entry["path"], "data": entry["data"]}
+            for entry in cls.query_characters(role=role_filter)
+        ]
 
     @classmethod
+    @_instrumented
+    @_backend_method
     def save_character(cls, character_data: dict, file_path: str = None, image_source_path: Optional[str] = None) -> str:
         """
         Speichert einen Charakter ab.
         - Legt (falls nötig) einen Unterordner für diesen Charakter an: "<Name> - <UUID>/"
         - Speichert die JSON-Datei in diesem Ordner.
-        - Optional: kopiert ein übergebenes Bild in diesen Ordner und merkt sich den Dateinamen
-          im Feld "image_filename" des Charakter-Dictionaries.
+        - Optional: übernimmt ein übergebenes Bild (siehe _copy_entity_image) und merkt sich
+          die Referenz im Feld "image_filename" des Charakter-Dictionaries.
         """
         cls._ensure_dirs()
         char_id = character_data.get("id", "undefined_id")
@@ -323,11 +2014,14 @@ class DataManager:
         expected_path = os.path.join(char_folder_path, filename)
 
         # Aufräumen einer alten JSON-Datei, falls sich Pfad geändert hat
-        if file_path and file_path != expected_path and os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-            except OSError:
-                pass
+        if file_path and file_path != expected_path:
+            # eingereihten Stand immer verwerfen: die alte Datei ist evtl. noch gar nicht geschrieben
+            cls._discard_pending(file_path)
+            if os.path.exists(file_path):
+                try:
+                    os.remove(file_path)
+                except OSError:
+                    pass
 
         # Optional: Bild kopieren
         copied = cls._copy_entity_image(
@@ -340,8 +2034,9 @@ class DataManager:
             character_data["image_filename"] = copied
 
         try:
-            with open(expected_path, "w", encoding="utf-8") as f:
-                json.dump(character_data, f, indent=4, ensure_ascii=False)
+            cls._write_json(expected_path, character_data, cls.KIND_CHARACTER)
+            cls._after_save(expected_path, character_data, cls.KIND_CHARACTER, old_path=file_path)
+            cls._remove_renamed_folder(file_path, char_folder_path, str(char_id))
             return expected_path
         except Exception as e:
             logger.error(f"Fehler beim Speichern des Charakters nach {expected_path}: {e}")
@@ -357,12 +2052,13 @@ class DataManager:
             
         cls._ensure_dirs()
         try:
-            with open(cls.LEGACY_ITEMS_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = cls._read_json(cls.LEGACY_ITEMS_FILE)
                 
             items = data.get("items", [])
-            for item in items:
-                cls.save_item(item)
+            results = cls.save_many(cls.KIND_ITEM, items)
+            failed = [r for r in results if r["error"]]
+            if failed:
+                raise RuntimeError(f"{len(failed)} von {len(items)} Einträgen konnten nicht gespeichert werden.")
                 
             # Nach erfolgreicher Migration umbenennen, um mehrfache Migrationen zu vermeiden
             backup_path = cls.LEGACY_ITEMS_FILE + ".bak"
@@ -373,12 +2069,23 @@ class DataManager:
         except Exception as e:
             logger.error(f"Fehler bei der Migration von items.json: {e}")
 
+    @staticmethod
+    def _named_display(data: Dict[str, Any]) -> str:
+        """Anzeigetext für Items und Zustände."""
+        entity_id = data.get("id", "???")
+        name = data.get("name", "(unbenannt)")
+        return f"{name} [{entity_id[:8]}...]"
+
     @classmethod
+    @_instrumented
+    @_backend_method
     def get_all_items(cls) -> List[Dict[str, Any]]:
         """Lädt alle Items aus dem data/items/ Ordner."""
         return [it["data"] for it in cls.get_all_items_meta()]
 
     @classmethod
+    @_instrumented
+    @_backend_method
     def get_all_items_meta(cls) -> List[Dict[str, Any]]:
         """Lädt alle Items inkl. Dateipfad und Anzeigetext (unterstützt Unterordner)."""
         cls._migrate_items_if_needed()
@@ -388,33 +2095,46 @@ class DataManager:
         if not os.path.exists(cls.ITEMS_DIR):
             return items
 
-        for root, _, filenames in os.walk(cls.ITEMS_DIR):
-            for fname in filenames:
-                if not fname.lower().endswith(".json"):
-                    continue
-                full_path = os.path.join(root, fname)
-                try:
-                    with open(full_path, "r", encoding="utf-8") as f:
-                        item_data = json.load(f)
-                    # Heuristik: Item muss id und name besitzen
-                    if "id" not in item_data or "name" not in item_data:
-                        continue
-                    item_id = item_data.get("id", "???")
-                    item_name = item_data.get("name", "(unbenannt)")
-                    display = f"{item_name} [{item_id[:8]}...]"
-                    items.append({"data": item_data, "path": full_path, "display": display})
-                except Exception as e:
-                    logger.error(f"Fehler beim Laden von Item {full_path}: {e}")
+        for full_path, item_data in cls._load_many(cls._list_json_files(cls.ITEMS_DIR)):
+            # Heuristik: Item muss id und name besitzen
+            if "id" not in item_data or "name" not in item_data:
+                continue
+            items.append({"data": item_data, "path": full_path, "display": cls._named_display(item_data)})
 
         return items
 
     @classmethod
+    @_backend_method
+    def iter_items(
+        cls,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        limit: Optional[int] = None,
+        **fields: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Wie get_all_items_meta, aber als Generator (siehe iter_characters).
+        Filter: Feldwerte als Schlüsselwörter (z. B. name="Seil") und/oder where(data).
+        """
+        if cls._backend is not None:
+            entries: Iterable[Dict[str, Any]] = cls.get_all_items_meta()
+        else:
+            cls._migrate_items_if_needed()
+            cls._ensure_dirs()
+            entries = (
+                {"data": data, "path": full_path, "display": cls._named_display(data)}
+                for full_path, data in cls._iter_entities(cls.ITEMS_DIR, cls.KIND_ITEM)
+            )
+        return cls._filter_entries(entries, where, limit, fields)
+
+    @classmethod
+    @_instrumented
+    @_backend_method
     def save_item(cls, item_data: Dict[str, Any], file_path: str = None, image_source_path: Optional[str] = None) -> str:
         """
         Speichert ein Item:
         - Unterordner pro Item: "<Name> - <UUID>/"
         - JSON in diesem Ordner: "<Name> - <UUID>.json"
-        - Optional: Bild in diesem Ordner, Referenz in "image_filename"
+        - Optional: Bild (im Bildspeicher, siehe _copy_entity_image), Referenz in "image_filename"
         """
         cls._ensure_dirs()
         
@@ -424,21 +2144,17 @@ class DataManager:
             item_id = str(uuid.uuid4())
             item_data["id"] = item_id
             
-        item_name = item_data.get("name", "Unbenannt")
-        safe_name = cls._safe_name(item_name, fallback="Unbenannt")
-
-        item_folder_name = f"{safe_name} - {item_id}"
-        item_folder_path = os.path.join(cls.ITEMS_DIR, item_folder_name)
+        item_folder_path, expected_path, safe_name = cls._entity_target(cls.KIND_ITEM, item_data)
         os.makedirs(item_folder_path, exist_ok=True)
 
-        filename = f"{safe_name} - {item_id}.json"
-        expected_path = os.path.join(item_folder_path, filename)
-
-        if file_path and file_path != expected_path and os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-            except OSError:
-                pass
+        if file_path and file_path != expected_path:
+            # eingereihten Stand immer verwerfen: die alte Datei ist evtl. noch gar nicht geschrieben
+            cls._discard_pending(file_path)
+            if os.path.exists(file_path):
+                try:
+                    os.remove(file_path)
+                except OSError:
+                    pass
 
         copied = cls._copy_entity_image(
             entity_safe_name=safe_name,
@@ -450,31 +2166,20 @@ class DataManager:
             item_data["image_filename"] = copied
         
         try:
-            with open(expected_path, "w", encoding="utf-8") as f:
-                json.dump(item_data, f, indent=4, ensure_ascii=False)
+            cls._write_json(expected_path, item_data, cls.KIND_ITEM)
+            cls._after_save(expected_path, item_data, cls.KIND_ITEM, old_path=file_path)
+            cls._remove_renamed_folder(file_path, item_folder_path, str(item_id))
             return expected_path
         except Exception as e:
             logger.error(f"Fehler beim Speichern des Items nach {expected_path}: {e}")
             raise
 
     @classmethod
+    @_instrumented
+    @_backend_method
     def delete_item(cls, item_id: str) -> bool:
-        """Löscht ein Item anhand seiner ID."""
-        if not os.path.exists(cls.ITEMS_DIR):
-            return False
-            
-        deleted_any = False
-        # rekursiv, da Items nun in Unterordnern liegen können
-        for root, _, filenames in os.walk(cls.ITEMS_DIR):
-            for fname in filenames:
-                if item_id in fname:
-                    filepath = os.path.join(root, fname)
-                    try:
-                        os.remove(filepath)
-                        deleted_any = True
-                    except Exception as e:
-                        logger.error(f"Fehler beim Löschen des Items {filepath}: {e}")
-        return deleted_any
+        """Löscht ein Item anhand seiner ID (JSON, Bild und Ordner)."""
+        return cls._delete_entity(cls.KIND_ITEM, cls.ITEMS_DIR, item_id)
 
     # --- CONDITION MANAGEMENT ---
     
@@ -486,12 +2191,13 @@ class DataManager:
             
         cls._ensure_dirs()
         try:
-            with open(cls.LEGACY_CONDITIONS_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = cls._read_json(cls.LEGACY_CONDITIONS_FILE)
                 
             conditions = data.get("conditions", [])
-            for cond in conditions:
-                cls.save_condition(cond)
+            results = cls.save_many(cls.KIND_CONDITION, conditions)
+            failed = [r for r in results if r["error"]]
+            if failed:
+                raise RuntimeError(f"{len(failed)} von {len(conditions)} Einträgen konnten nicht gespeichert werden.")
                 
             backup_path = cls.LEGACY_CONDITIONS_FILE + ".bak"
             if os.path.exists(backup_path):
@@ -502,11 +2208,15 @@ class DataManager:
             logger.error(f"Fehler bei der Migration von conditions.json: {e}")
 
     @classmethod
+    @_instrumented
+    @_backend_method
     def get_all_conditions(cls) -> List[Dict[str, Any]]:
         """Lädt alle Zustände aus dem data/conditions/ Ordner."""
         return [c["data"] for c in cls.get_all_conditions_meta()]
 
     @classmethod
+    @_instrumented
+    @_backend_method
     def get_all_conditions_meta(cls) -> List[Dict[str, Any]]:
         """Lädt alle Zustände inkl. Dateipfad und Anzeigetext (unterstützt Unterordner)."""
         cls._migrate_conditions_if_needed()
@@ -516,32 +2226,45 @@ class DataManager:
         if not os.path.exists(cls.CONDITIONS_DIR):
             return conditions
 
-        for root, _, filenames in os.walk(cls.CONDITIONS_DIR):
-            for fname in filenames:
-                if not fname.lower().endswith(".json"):
-                    continue
-                full_path = os.path.join(root, fname)
-                try:
-                    with open(full_path, "r", encoding="utf-8") as f:
-                        cond_data = json.load(f)
-                    if "id" not in cond_data or "name" not in cond_data:
-                        continue
-                    cond_id = cond_data.get("id", "???")
-                    cond_name = cond_data.get("name", "(unbenannt)")
-                    display = f"{cond_name} [{cond_id[:8]}...]"
-                    conditions.append({"data": cond_data, "path": full_path, "display": display})
-                except Exception as e:
-                    logger.error(f"Fehler beim Laden von Zustand {full_path}: {e}")
+        for full_path, cond_data in cls._load_many(cls._list_json_files(cls.CONDITIONS_DIR)):
+            if "id" not in cond_data or "name" not in cond_data:
+                continue
+            conditions.append({"data": cond_data, "path": full_path, "display": cls._named_display(cond_data)})
 
         return conditions
 
     @classmethod
+    @_backend_method
+    def iter_conditions(
+        cls,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        limit: Optional[int] = None,
+        **fields: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Wie get_all_conditions_meta, aber als Generator (siehe iter_characters).
+        Filter: Feldwerte als Schlüsselwörter (z. B. id=...) und/oder where(data).
+        """
+        if cls._backend is not None:
+            entries: Iterable[Dict[str, Any]] = cls.get_all_conditions_meta()
+        else:
+            cls._migrate_conditions_if_needed()
+            cls._ensure_dirs()
+            entries = (
+                {"data": data, "path": full_path, "display": cls._named_display(data)}
+                for full_path, data in cls._iter_entities(cls.CONDITIONS_DIR, cls.KIND_CONDITION)
+            )
+        return cls._filter_entries(entries, where, limit, fields)
+
+    @classmethod
+    @_instrumented
+    @_backend_method
     def save_condition(cls, cond_data: Dict[str, Any], file_path: str = None, image_source_path: Optional[str] = None) -> str:
         """
         Speichert einen Zustand:
         - Unterordner pro Zustand: "<Name> - <UUID>/"
         - JSON in diesem Ordner: "<Name> - <UUID>.json"
-        - Optional: Bild in diesem Ordner, Referenz in "image_filename"
+        - Optional: Bild (im Bildspeicher, siehe _copy_entity_image), Referenz in "image_filename"
         """
         cls._ensure_dirs()
         
@@ -551,21 +2274,17 @@ class DataManager:
             cond_id = str(uuid.uuid4())
             cond_data["id"] = cond_id
             
-        cond_name = cond_data.get("name", "Unbenannt")
-        safe_name = cls._safe_name(cond_name, fallback="Unbenannt")
-
-        cond_folder_name = f"{safe_name} - {cond_id}"
-        cond_folder_path = os.path.join(cls.CONDITIONS_DIR, cond_folder_name)
+        cond_folder_path, expected_path, safe_name = cls._entity_target(cls.KIND_CONDITION, cond_data)
         os.makedirs(cond_folder_path, exist_ok=True)
 
-        filename = f"{safe_name} - {cond_id}.json"
-        expected_path = os.path.join(cond_folder_path, filename)
-
-        if file_path and file_path != expected_path and os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-            except OSError:
-                pass
+        if file_path and file_path != expected_path:
+            # eingereihten Stand immer verwerfen: die alte Datei ist evtl. noch gar nicht geschrieben
+            cls._discard_pending(file_path)
+            if os.path.exists(file_path):
+                try:
+                    os.remove(file_path)
+                except OSError:
+                    pass
 
         copied = cls._copy_entity_image(
             entity_safe_name=safe_name,
@@ -577,82 +2296,50 @@ class DataManager:
             cond_data["image_filename"] = copied
         
         try:
-            with open(expected_path, "w", encoding="utf-8") as f:
-                json.dump(cond_data, f, indent=4, ensure_ascii=False)
+            cls._write_json(expected_path, cond_data, cls.KIND_CONDITION)
+            cls._after_save(expected_path, cond_data, cls.KIND_CONDITION, old_path=file_path)
+            cls._remove_renamed_folder(file_path, cond_folder_path, str(cond_id))
             return expected_path
         except Exception as e:
             logger.error(f"Fehler beim Speichern des Zustands nach {expected_path}: {e}")
             raise
 
     @classmethod
+    @_instrumented
+    @_backend_method
     def delete_condition(cls, cond_id: str) -> bool:
-        """Löscht einen Zustand anhand seiner ID."""
-        if not os.path.exists(cls.CONDITIONS_DIR):
-            return False
-            
-        deleted_any = False
-        # rekursiv, da Zustände nun in Unterordnern liegen können
-        for root, _, filenames in os.walk(cls.CONDITIONS_DIR):
-            for fname in filenames:
-                if cond_id in fname:
-                    filepath = os.path.join(root, fname)
-                    try:
-                        os.remove(filepath)
-                        deleted_any = True
-                    except Exception as e:
-                        logger.error(f"Fehler beim Löschen des Zustands {filepath}: {e}")
-        return deleted_any
+        """Löscht einen Zustand anhand seiner ID (JSON, Bild und Ordner)."""
+        return cls._delete_entity(cls.KIND_CONDITION, cls.CONDITIONS_DIR, cond_id)
 
     # --- CAMPAIGN MANAGEMENT ---
     
+    @staticmethod
+    def _campaign_display(data: Dict[str, Any]) -> str:
+        title = data.get("title", "(unbenannt)")
+        c_type = data.get("type", "Unknown")
+        c_id = data.get("id", "???")
+        return f"[{c_type}] {title} ({c_id[:8]}...)"
+
     @classmethod
+    @_instrumented
+    @_backend_method
     def get_all_campaigns(cls) -> List[Dict[str, Any]]:
         """Lädt alle Kampagnen aus dem data/campaigns Ordner."""
         cls._ensure_dirs()
-        campaigns = []
-        if not os.path.exists(cls.CAMPAIGNS_DIR):
-            return campaigns
-
-        for root, _, filenames in os.walk(cls.CAMPAIGNS_DIR):
-            for fname in filenames:
-                if not fname.lower().endswith(".json"):
-                    continue
-
-                full_path = os.path.join(root, fname)
-                try:
-                    with open(full_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-
-                    # Kampagnen von Charakteren unterscheiden
-                    if "title" not in data or "type" not in data or "id" not in data:
-                        continue
-                    if "hitpoints" in data or "age" in data:
-                        continue
-
-                    title = data.get("title", "(unbenannt)")
-                    c_type = data.get("type", "Unknown")
-                    c_id = data.get("id", "???")
-
-                    display = f"[{c_type}] {title} ({c_id[:8]}...)"
-
-                    campaigns.append(
-                        {
-                            "data": data,
-                            "path": full_path,
-                            "display": display,
-                        }
-                    )
-                except Exception as e:
-                    logger.error(f"Fehler beim Laden der Kampagne {full_path}: {e}")
-        return campaigns
+        return [
+            {"data": data, "path": full_path, "display": cls._campaign_display(data)}
+            for full_path, data in cls._scan_tree(cls.CAMPAIGNS_DIR).get(cls.KIND_CAMPAIGN, [])
+        ]
 
     @classmethod
+    @_instrumented
+    @_backend_method
     def save_campaign(cls, campaign_data: dict, file_path: str = None, image_source_path: Optional[str] = None) -> str:
         """
         Speichert eine Kampagne:
         - Unterordner pro Kampagne: "<Titel> - <UUID>/"
         - JSON in diesem Ordner: "<Titel> - <UUID>.json"
-        - Optional: Bild in diesem Ordner, Referenz in "image_filename"
+        - Optional: Bild (im Bildspeicher, siehe _copy_entity_image), Referenz in "image_filename"
         """
         cls._ensure_dirs()
         c_id = campaign_data.get("id", "undefined_id")
@@ -661,16 +2348,27 @@ class DataManager:
         safe_title = cls._safe_name(title, fallback="Unbenannt")
         camp_folder_name = f"{safe_title} - {c_id}"
         camp_folder_path = os.path.join(cls.CAMPAIGNS_DIR, camp_folder_name)
+        moved_from = cls._move_campaign_dir(str(c_id), camp_folder_path)
         os.makedirs(camp_folder_path, exist_ok=True)
+        cls._remember_campaign_dir(str(c_id), camp_folder_path)
 
         filename = f"{safe_title} - {c_id}.json"
         expected_path = os.path.join(camp_folder_path, filename)
 
-        if file_path and file_path != expected_path and os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-            except OSError:
-                pass
+        if moved_from is not None:
+            # die alte Kampagnendatei liegt jetzt im umbenannten Ordner
+            if not (file_path and cls._is_within(file_path, moved_from)):
+                file_path = os.path.join(moved_from, os.path.basename(moved_from) + ".json")
+            file_path = os.path.join(camp_folder_path, os.path.relpath(file_path, moved_from))
+
+        if file_path and file_path != expected_path:
+            # eingereihten Stand immer verwerfen: die alte Datei ist evtl. noch gar nicht geschrieben
+            cls._discard_pending(file_path)
+            if os.path.exists(file_path):
+                try:
+                    os.remove(file_path)
+                except OSError:
+                    pass
 
         copied = cls._copy_entity_image(
             entity_safe_name=safe_title,
@@ -682,16 +2380,100 @@ class DataManager:
             campaign_data["image_filename"] = copied
             
         try:
-            with open(expected_path, "w", encoding="utf-8") as f:
-                json.dump(campaign_data, f, indent=4, ensure_ascii=False)
+            cls._write_json(expected_path, campaign_data, cls.KIND_CAMPAIGN)
+            cls._after_save(expected_path, campaign_data, cls.KIND_CAMPAIGN, old_path=file_path)
             return expected_path
         except Exception as e:
             logger.error(f"Fehler beim Speichern der Kampagne nach {expected_path}: {e}")
             raise
 
+    # --- CAMPAIGN BUNDLES ---
+
+    @classmethod
+    @_instrumented
+    def export_campaign_bundle(cls, campaign_id: str, bundle_path: Optional[str] = None) -> str:
+        """
+        Packt eine Kampagne (Kampagnen-JSON, Charaktere, Quests, Bilder) in eine einzelne
+        Paket-Datei, Standard: data/bundles/<Titel> - <UUID>.pnpbundle.
+        Rückgabe: Pfad der Paket-Datei.
+        """
+        campaign_id = str(campaign_id)
+        cls.flush()
+        hit = cls._load_by_id(campaign_id, cls.KIND_CAMPAIGN)
+        if hit is None:
+            raise ValueError(f"Kampagne {campaign_id} nicht gefunden.")
+        campaign_path, campaign_data = hit
+
+        files: List[Tuple[str, str]] = []
+        folder = cls._get_campaign_dirs().get(campaign_id)
+        if folder is None or not cls._is_within(campaign_path, folder):
+            # ältere Kampagnen: JSON (und Bild) liegen direkt unter data/campaigns
+            files.append((os.path.basename(campaign_path), campaign_path))
+            image_filename = campaign_data.get("image_filename")
+            image_path = cls.resolve_image_path(os.path.dirname(campaign_path), image_filename)
+            if image_path and not image_store.is_ref(image_filename) and os.path.isfile(image_path):
+                files.append((image_filename, image_path))
+        if folder is not None:
+            for root, dirnames, filenames in io_stats.walk(folder):
+                dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+                for fname in sorted(filenames):
+                    if fname.startswith(".") or fname.endswith(".tmp"):
+                        continue
+                    full_path = os.path.join(root, fname)
+                    files.append((os.path.relpath(full_path, folder).replace(os.sep, "/"), full_path))
+
+        # Bilder aus dem Bildspeicher einmal unter images/ mitpacken
+        store_images: Dict[str, str] = {}
+        for _, full_path in list(files):
+            if not full_path.lower().endswith(".json"):
+                continue
+            try:
+                image_filename = cls._load_json(full_path).get("image_filename")
+            except Exception:
+                continue
+            if image_store.is_ref(image_filename) and image_filename not in store_images:
+                image_path = cls.resolve_image_path(None, image_filename)
+                if os.path.isfile(image_path):
+                    store_images[image_filename] = f"images/{os.path.basename(image_path)}"
+                    files.append((store_images[image_filename], image_path))
+
+        if bundle_path is None:
+            safe_title = cls._safe_name(campaign_data.get("title"), fallback="Unbenannt")
+            bundle_path = os.path.join(cls.BUNDLES_DIR, f"{safe_title} - {campaign_id}{cls.BUNDLE_SUFFIX}")
+        count = write_bundle(bundle_path, files, campaign_id, cls._classify_entity, store_images)
+        logger.info(f"Kampagne {campaign_id} mit {count} Dateien nach {bundle_path} gepackt.")
+        return bundle_path
+
+    @staticmethod
+    def open_campaign_bundle(bundle_path: str) -> CampaignBundle:
+        """
+        Öffnet ein Kampagnen-Paket schreibgeschützt (mmap). Entities und Bilder lassen
+        sich dann einzeln lesen, ohne das Paket zu entpacken:
+
+            with DataManager.open_campaign_bundle(path) as bundle:
+                characters = bundle.get_all(DataManager.KIND_CHARACTER)
+        """
+        return CampaignBundle(bundle_path)
+
     # --- PLAYER MANAGEMENT ---
 
+    @staticmethod
+    def _player_display(data: Dict[str, Any]) -> str:
+        player_id = data.get("id", "???")
+        name = data.get("name", "(unbenannt)")
+        nickname = data.get("nickname", "")
+        discord = data.get("discord", "")
+
+        parts = [name]
+        if nickname:
+            parts.append(f"'{nickname}'")
+        if discord:
+            parts.append(f"[{discord}]")
+        return " ".join(parts) + f" ({player_id[:8]}...)"
+
     @classmethod
+    @_instrumented
+    @_backend_method
     def get_all_players(cls) -> List[Dict[str, Any]]:
         """
         Lädt alle Spieler aus dem data/players Ordner und liefert eine Liste von
@@ -703,62 +2485,28 @@ class DataManager:
         if not os.path.exists(cls.PLAYERS_DIR):
             return players
 
-        for fname in os.listdir(cls.PLAYERS_DIR):
-            if not fname.lower().endswith(".json"):
-                continue
-
-            full_path = os.path.join(cls.PLAYERS_DIR, fname)
-            try:
-                with open(full_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                player_id = data.get("id", "???")
-                name = data.get("name", "(unbenannt)")
-                nickname = data.get("nickname", "")
-                discord = data.get("discord", "")
-
-                parts = [name]
-                if nickname:
-                    parts.append(f"'{nickname}'")
-                if discord:
-                    parts.append(f"[{discord}]")
-                display = " ".join(parts) + f" ({player_id[:8]}...)"
-
-                players.append(
-                    {
-                        "data": data,
-                        "path": full_path,
-                        "display": display,
-                    }
-                )
-            except Exception as e:
-                logger.error(f"Fehler beim Laden von Spieler {full_path}: {e}")
+        for full_path, data in cls._load_many(cls._list_json_files(cls.PLAYERS_DIR, recursive=False)):
+            players.append(
+                {
+                    "data": data,
+                    "path": full_path,
+                    "display": cls._player_display(data),
+                }
+            )
 
         return players
 
     @classmethod
+    @_instrumented
+    @_backend_method
     def get_player_by_id(cls, player_id: str) -> Optional[Dict[str, Any]]:
-        """Sucht einen Spieler anhand seiner ID."""
-        cls._ensure_dirs()
-        if not os.path.exists(cls.PLAYERS_DIR):
-            return None
-
-        for fname in os.listdir(cls.PLAYERS_DIR):
-            if not fname.lower().endswith(".json"):
-                continue
-
-            full_path = os.path.join(cls.PLAYERS_DIR, fname)
-            try:
-                with open(full_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                if data.get("id") == player_id:
-                    return data
-            except Exception as e:
-                logger.error(f"Fehler beim Lesen von Spieler {full_path}: {e}")
-
-        return None
+        """Sucht einen Spieler anhand seiner ID (über den ID-Index, öffnet genau eine Datei)."""
+        hit = cls._load_by_id(player_id, cls.KIND_PLAYER)
+        return hit[1] if hit else None
 
     @classmethod
+    @_instrumented
+    @_backend_method
     def save_player(cls, player_data: Dict[str, Any]) -> str:
         """
         Speichert einen Spieler als eigene JSON-Datei in data/players.
@@ -778,17 +2526,34 @@ class DataManager:
         filename = f"{safe_name} - {player_id}.json"
         expected_path = os.path.join(cls.PLAYERS_DIR, filename)
 
-        # Alte Dateien mit derselben ID entfernen (Namensänderung etc.)
-        for fname in os.listdir(cls.PLAYERS_DIR):
-            if player_id in fname and fname != filename:
+        # Alte Dateien mit derselben ID entfernen (Namensänderung etc.), auch noch eingereihte
+        old_paths = [
+            os.path.join(cls.PLAYERS_DIR, fname)
+            for fname in io_stats.listdir(cls.PLAYERS_DIR)
+            if fname.lower().endswith(".json") and cls._entity_id_of_name(fname) == str(player_id)
+        ]
+        if cls._writer is not None:
+            old_paths.extend(
+                path for path in cls._writer.pending_paths()
+                if os.path.dirname(path) == cls.PLAYERS_DIR
+                and cls._entity_id_of_name(os.path.basename(path)) == str(player_id)
+                and path not in old_paths
+            )
+        old_paths = [path for path in old_paths if path != expected_path]
+        for path in old_paths:
+            cls._discard_pending(path)
+            if os.path.exists(path):
                 try:
-                    os.remove(os.path.join(cls.PLAYERS_DIR, fname))
+                    os.remove(path)
                 except OSError:
                     pass
 
         try:
-            with open(expected_path, "w", encoding="utf-8") as f:
-                json.dump(player_data, f, indent=4, ensure_ascii=False)
+            cls._write_json(expected_path, player_data, cls.KIND_PLAYER)
+            cls._after_save(expected_path, player_data, cls.KIND_PLAYER, old_path=old_paths[0] if old_paths else None)
+            for path in old_paths[1:]:
+                cls._watch_forget(path)
+            cls._forget_deleted(old_paths[1:])
             return expected_path
         except Exception as e:
             logger.error(f"Fehler beim Speichern des Spielers nach {expected_path}: {e}")
@@ -0,0 +1,166 @@
+import os
+import sys
+import marshal
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from classes.core import io_stats
+from classes.core.write_queue import atomic_write
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"PNPMANI1"
+# marshal ist nur innerhalb derselben Python-Version stabil -> Version im Kopf mitführen
+_FORMAT_TAG = f"{sys.version_info[0]}.{sys.version_info[1]}:{marshal.version}".encode("ascii")
+
+Signature = Tuple[int, int]
+
+
+class DataManifest:
+    """
+    Binäres Verzeichnis-Manifest des Datenordners: pro Verzeichnis dessen mtime,
+    Unterordner und JSON-Dateien samt Signatur (mtime, Größe).
+
+    Beim Start wird die Datei in einem Stück gelesen (marshal). Ein Verzeichnis,
+    dessen mtime unverändert ist, wird nicht neu gelistet – geprüft wird also nur
+    ein stat pro Verzeichnis statt os.walk mit stat pro Datei. Alle Schreibvorgänge
+    des DataManagers ersetzen Dateien per os.replace und ändern damit die mtime
+    des Ordners; Werkzeuge, die eine Datei an Ort und Stelle überschreiben, fallen
+    erst im Überwachungsmodus oder nach invalidate() auf.
+    """
+
+    def __init__(self, manifest_file: str, data_dir: str):
+        self.manifest_file = manifest_file
+        self.data_dir = data_dir
+        self._lock = threading.RLock()
+        # rel_dir -> (mtime_ns, [Unterordner], {Dateiname: (mtime_ns, Größe)})
+        self._dirs: Dict[str, Tuple[int, List[str], Dict[str, Signature]]] = {}
+        self._loaded = False
+        self._dirty = False
+
+    def _rel(self, path: str) -> str:
+        return os.path.relpath(path, self.data_dir)
+
+    # --- Persistenz ---
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            raw = io_stats.read_file(self.manifest_file)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning(f"Manifest {self.manifest_file} konnte nicht gelesen werden: {e}")
+            return
+        header = MAGIC + _FORMAT_TAG + b"\n"
+        if not raw.startswith(header):
+            # andere Python-Version oder älteres Format -> einmal neu aufbauen
+            return
+        try:
+            self._dirs = marshal.loads(raw[len(header):])
+        except (EOFError, ValueError, TypeError) as e:
+            logger.warning(f"Manifest {self.manifest_file} ist beschädigt, wird neu aufgebaut: {e}")
+            self._dirs = {}
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(os.path.dirname(self.manifest_file), exist_ok=True)
+            try:
+                atomic_write(self.manifest_file, MAGIC + _FORMAT_TAG + b"\n" + marshal.dumps(self._dirs))
+                self._dirty = False
+            except Exception as e:
+                logger.error(f"Fehler beim Speichern des Manifests nach {self.manifest_file}: {e}")
+
+    def invalidate(self) -> None:
+        """Verwirft alle Einträge; der nächste walk() liest jedes Verzeichnis neu."""
+        with self._lock:
+            self._ensure_loaded()
+            self._dirs = {}
+            self._dirty = True
+
+    # --- Abfrage ---
+
+    def walk(self, base_dir: str, recursive: bool = True) -> List[Tuple[str, Signature]]:
+        """
+        Alle JSON-Dateien unterhalb von base_dir (versteckte Ordner ausgenommen) mit
+        Signatur, sortiert nach Pfad. Nur Verzeichnisse mit geänderter mtime werden gelistet.
+        """
+        results: List[Tuple[str, Signature]] = []
+        with self._lock:
+            self._ensure_loaded()
+            self._walk_dir(base_dir, recursive, results)
+        self.save()
+        results.sort()
+        return results
+
+    def _walk_dir(self, dir_path: str, recursive: bool, results: List[Tuple[str, Signature]]) -> None:
+        rel_dir = self._rel(dir_path)
+        try:
+            mtime = io_stats.stat(dir_path).st_mtime_ns
+        except OSError:
+            self._drop(rel_dir)
+            return
+
+        entry = self._dirs.get(rel_dir)
+        if entry is None or entry[0] != mtime:
+            entry = self._scan_dir(dir_path, mtime, entry)
+            if entry is None:
+                return
+            self._dirs[rel_dir] = entry
+            self._dirty = True
+
+        _, subdirs, files = entry
+        for name, signature in files.items():
+            results.append((os.path.join(dir_path, name), tuple(signature)))
+        if recursive:
+            for sub in subdirs:
+                self._walk_dir(os.path.join(dir_path, sub), True, results)
+
+    def _scan_dir(
+        self,
+        dir_path: str,
+        mtime: int,
+        old: Optional[Tuple[int, List[str], Dict[str, Signature]]],
+    ) -> Optional[Tuple[int, List[str], Dict[str, Signature]]]:
+        subdirs: List[str] = []
+        files: Dict[str, Signature] = {}
+        try:
+            with io_stats.scandir(dir_path) as it:
+                for dir_entry in it:
+                    if dir_entry.name.startswith("."):
+                        continue
+                    try:
+                        if dir_entry.is_dir():
+                            subdirs.append(dir_entry.name)
+                        elif dir_entry.name.lower().endswith(".json"):
+                            st = dir_entry.stat()
+                            io_stats.IO_STATS.add(stat_calls=1)
+                            files[dir_entry.name] = (st.st_mtime_ns, st.st_size)
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.error(f"Fehler beim Lesen des Verzeichnisses {dir_path}: {e}")
+            return None
+
+        # entfallene Unterordner samt ihrer Einträge verwerfen
+        if old is not None:
+            rel_dir = self._rel(dir_path)
+            for gone in set(old[1]) - set(subdirs):
+                self._drop(os.path.join(rel_dir, gone))
+        return mtime, sorted(subdirs), files
+
+    def _drop(self, rel_dir: str) -> None:
+        prefix = rel_dir + os.sep
+        for key in [k for k in self._dirs if k == rel_dir or k.startswith(prefix)]:
+            del self._dirs[key]
+            self._dirty = True
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return sum(len(files) for _, _, files in self._dirs.values())
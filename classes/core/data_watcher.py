@@ -0,0 +1,199 @@
+import os
+import logging
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    # Optional: nutzt inotify (Linux), FSEvents (macOS) bzw. ReadDirectoryChangesW (Windows)
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - abhängig von der Installation
+    FileSystemEventHandler = object
+    Observer = None
+
+# Ereignistypen, die an den Callback gemeldet werden
+EVENT_CREATED = "created"
+EVENT_MODIFIED = "modified"
+EVENT_DELETED = "deleted"
+EVENT_DIR_CREATED = "dir_created"
+EVENT_DIR_DELETED = "dir_deleted"
+
+# callback(event_type, path)
+ChangeCallback = Callable[[str, str], None]
+
+
+class _WatchdogHandler(FileSystemEventHandler):
+    """Übersetzt watchdog-Ereignisse in die einfachen Ereignistypen dieses Moduls."""
+
+    def __init__(self, callback: ChangeCallback):
+        super().__init__()
+        self._callback = callback
+
+    def on_created(self, event):
+        self._callback(EVENT_DIR_CREATED if event.is_directory else EVENT_CREATED, event.src_path)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._callback(EVENT_MODIFIED, event.src_path)
+
+    def on_deleted(self, event):
+        self._callback(EVENT_DIR_DELETED if event.is_directory else EVENT_DELETED, event.src_path)
+
+    def on_moved(self, event):
+        if event.is_directory:
+            self._callback(EVENT_DIR_DELETED, event.src_path)
+            self._callback(EVENT_DIR_CREATED, event.dest_path)
+        else:
+            self._callback(EVENT_DELETED, event.src_path)
+            self._callback(EVENT_CREATED, event.dest_path)
+
+
+class _PollingWatcher(threading.Thread):
+    """
+    Fallback ohne watchdog: prüft in festen Abständen die mtimes aller bekannten
+    Verzeichnisse und JSON-Dateien. Geänderte Verzeichnisse werden neu gelistet,
+    ein vollständiger os.walk ist nur beim Start nötig.
+    """
+
+    def __init__(self, roots: List[str], callback: ChangeCallback, interval: float):
+        super().__init__(name="DataWatcher-Polling", daemon=True)
+        self._roots = roots
+        self._callback = callback
+        self._interval = interval
+        self._stop_event = threading.Event()
+        self._dirs: Dict[str, int] = {}
+        self._files: Dict[str, Tuple[int, int]] = {}
+
+    def prime(self) -> None:
+        for root in self._roots:
+            self._scan_dir(root, notify=False)
+
+    def _scan_dir(self, dir_path: str, notify: bool) -> None:
+        try:
+            self._dirs[dir_path] = os.stat(dir_path).st_mtime_ns
+            entries = list(os.scandir(dir_path))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir():
+                if entry.path not in self._dirs:
+                    if notify:
+                        self._callback(EVENT_DIR_CREATED, entry.path)
+                    self._scan_dir(entry.path, notify)
+            elif entry.name.lower().endswith(".json") and entry.path not in self._files:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                self._files[entry.path] = (st.st_mtime_ns, st.st_size)
+                if notify:
+                    self._callback(EVENT_CREATED, entry.path)
+
+    def poll_once(self) -> None:
+        for dir_path, old_mtime in list(self._dirs.items()):
+            try:
+                mtime = os.stat(dir_path).st_mtime_ns
+            except OSError:
+                self._drop_dir(dir_path)
+                continue
+            if mtime != old_mtime:
+                self._scan_dir(dir_path, notify=True)
+
+        for path, old_sig in list(self._files.items()):
+            try:
+                st = os.stat(path)
+            except OSError:
+                del self._files[path]
+                self._callback(EVENT_DELETED, path)
+                continue
+            sig = (st.st_mtime_ns, st.st_size)
+            if sig != old_sig:
+                self._files[path] = sig
+                self._callback(EVENT_MODIFIED, path)
+
+    def _drop_dir(self, dir_path: str) -> None:
+        prefix = dir_path + os.sep
+        for d in [d for d in self._dirs if d == dir_path or d.startswith(prefix)]:
+            del self._dirs[d]
+        for f in [f for f in self._files if f.startswith(prefix)]:
+            del self._files[f]
+        self._callback(EVENT_DIR_DELETED, dir_path)
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.error(f"Fehler beim Überwachen des Datenordners: {e}")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+class DataWatcher:
+    """
+    Überwacht die Datenordner und meldet Änderungen an JSON-Dateien per Callback.
+    Nutzt watchdog (inotify & Co.), falls installiert, sonst einen Polling-Thread.
+    Der Callback läuft im Watcher-Thread.
+    """
+
+    def __init__(self, roots: Iterable[str], callback: ChangeCallback, poll_interval: float = 2.0):
+        self.roots = [r for r in roots if os.path.isdir(r)]
+        self._callback = callback
+        self.poll_interval = poll_interval
+        self._observer = None
+        self._poller: Optional[_PollingWatcher] = None
+
+    @property
+    def backend(self) -> str:
+        if self._observer is not None:
+            return "watchdog"
+        if self._poller is not None:
+            return "polling"
+        return "stopped"
+
+    def _dispatch(self, event_type: str, path: str) -> None:
+        name = os.path.basename(path)
+        if name.startswith("."):
+            return
+        if event_type in (EVENT_CREATED, EVENT_MODIFIED, EVENT_DELETED) and not name.lower().endswith(".json"):
+            return
+        try:
+            self._callback(event_type, path)
+        except Exception as e:
+            logger.error(f"Fehler beim Verarbeiten der Dateiänderung {path}: {e}")
+
+    def start(self) -> None:
+        if self.backend != "stopped":
+            return
+        if Observer is not None:
+            try:
+                observer = Observer()
+                handler = _WatchdogHandler(self._dispatch)
+                for root in self.roots:
+                    observer.schedule(handler, root, recursive=True)
+                observer.daemon = True
+                observer.start()
+                self._observer = observer
+                return
+            except Exception as e:
+                logger.warning(f"Dateiüberwachung per watchdog nicht möglich, nutze Polling: {e}")
+
+        poller = _PollingWatcher(self.roots, self._dispatch, self.poll_interval)
+        poller.prime()
+        poller.start()
+        self._poller = poller
+
+    def stop(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+        if self._poller is not None:
+            self._poller.stop()
+            self._poller.join(timeout=5)
+            self._poller = None
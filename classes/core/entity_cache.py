@@ -0,0 +1,90 @@
+import marshal
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# (st_mtime_ns, st_size) – ändert sich beides nicht, gilt die Datei als unverändert
+Signature = Tuple[int, int]
+
+_MISSING = object()
+
+
+class EntityCache:
+    """
+    Prozessweiter LRU-Cache für geparste JSON-Dokumente, Schlüssel ist der Dateipfad.
+
+    Ein Eintrag ist nur gültig, solange (mtime, size) der Datei übereinstimmen.
+    Gespeichert wird das Dokument marshal-serialisiert: jeder Treffer liefert so eine
+    frische Kopie (Aufrufer dürfen das Ergebnis verändern), und das Entpacken ist
+    deutlich billiger als erneutes JSON-Parsen.
+    """
+
+    MISSING = _MISSING
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Signature, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, path: str, signature: Optional[Signature]) -> Any:
+        """
+        Liefert eine Kopie des gecachten Dokuments oder EntityCache.MISSING.
+        signature=None bedeutet: Gültigkeit nicht prüfen (Aufrufer weiß, dass die Datei unverändert ist).
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or (signature is not None and entry[0] != signature):
+                self.misses += 1
+                return _MISSING
+            self._entries.move_to_end(path)
+            self.hits += 1
+            blob = entry[1]
+        return marshal.loads(blob)
+
+    def put(self, path: str, signature: Signature, data: Any) -> None:
+        try:
+            blob = marshal.dumps(data)
+        except ValueError:
+            return
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self._bytes -= len(old[1])
+            self._entries[path] = (signature, blob)
+            self._bytes += len(blob)
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Verwirft einen einzelnen Eintrag oder (ohne Pfad) den ganzen Cache."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self._bytes -= len(old[1])
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
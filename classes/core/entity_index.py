@@ -0,0 +1,241 @@
+import os
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from classes.core import io_stats
+from classes.core.json_codec import DEFAULT_CODEC
+
+logger = logging.getLogger(__name__)
+
+
+class EntityIndex:
+    """
+    Persistenter Index von Entity-ID auf Dateipfad und Entity-Typ.
+
+    Der Index merkt sich pro Verzeichnis dessen mtime und die darin gefundenen
+    JSON-Dateien. Beim Auffrischen werden nur die Verzeichnisse per stat geprüft;
+    neu gelesen werden ausschließlich Verzeichnisse, deren mtime sich geändert hat –
+    und darin nur Dateien, die der Index noch nicht kennt.
+
+    Pfade werden relativ zu data_dir gespeichert, damit der Index ein Verschieben
+    des Datenordners übersteht.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        index_file: str,
+        data_dir: str,
+        roots: Iterable[str],
+        classify: Callable[[str, Dict[str, Any]], Optional[str]],
+        load: Callable[[str], Any],
+    ):
+        self.index_file = index_file
+        self.data_dir = data_dir
+        self.roots = list(roots)
+        self._classify = classify
+        self._load = load
+        self._lock = threading.RLock()
+
+        # rel_dir -> {"mtime": float, "files": {fname: [entity_id, kind]}}
+        self._dirs: Dict[str, Dict[str, Any]] = {}
+        # entity_id -> (rel_path, kind)
+        self._by_id: Dict[str, Tuple[str, str]] = {}
+        self._loaded = False
+
+    # --- Persistenz ---
+
+    def _rel(self, path: str) -> str:
+        return os.path.relpath(path, self.data_dir)
+
+    def _abs(self, rel_path: str) -> str:
+        return os.path.join(self.data_dir, rel_path)
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not os.path.exists(self.index_file):
+            return
+        try:
+            raw = DEFAULT_CODEC.loads(io_stats.read_file(self.index_file))
+            if raw.get("version") != self.VERSION:
+                return
+            self._dirs = raw.get("dirs", {})
+            self._rebuild_id_map()
+        except Exception as e:
+            logger.warning(f"ID-Index {self.index_file} konnte nicht gelesen werden, wird neu aufgebaut: {e}")
+            self._dirs = {}
+            self._by_id = {}
+
+    def _rebuild_id_map(self) -> None:
+        self._by_id = {}
+        for rel_dir, entry in self._dirs.items():
+            for fname, (entity_id, kind) in entry.get("files", {}).items():
+                self._by_id[entity_id] = (os.path.join(rel_dir, fname), kind)
+
+    def save(self) -> None:
+        """Schreibt den Index atomar (temp-Datei + os.replace) auf die Platte."""
+        with self._lock:
+            os.makedirs(os.path.dirname(self.index_file), exist_ok=True)
+            tmp_path = self.index_file + ".tmp"
+            try:
+                DEFAULT_CODEC.dump_file(tmp_path, {"version": self.VERSION, "dirs": self._dirs}, compact=True)
+                os.replace(tmp_path, self.index_file)
+            except Exception as e:
+                logger.error(f"Fehler beim Speichern des ID-Index nach {self.index_file}: {e}")
+
+    # --- Abfragen ---
+
+    def get(self, entity_id: str) -> Optional[Tuple[str, str]]:
+        """Liefert (absoluter Pfad, Typ) zur ID oder None, ohne das Dateisystem zu berühren."""
+        with self._lock:
+            self._ensure_loaded()
+            hit = self._by_id.get(entity_id)
+            if not hit:
+                return None
+            return self._abs(hit[0]), hit[1]
+
+    def ids_of_kind(self, kind: str) -> List[str]:
+        with self._lock:
+            self._ensure_loaded()
+            return [eid for eid, (_, k) in self._by_id.items() if k == kind]
+
+    # --- Aktualisierung ---
+
+    def refresh(self) -> bool:
+        """
+        Gleicht den Index mit den Verzeichnis-mtimes ab.
+        Rückgabe: True, wenn sich etwas geändert hat (Index wurde dann gespeichert).
+        """
+        with self._lock:
+            self._ensure_loaded()
+            changed = False
+            seen_dirs = set()
+            for root in self.roots:
+                if not os.path.isdir(root):
+                    continue
+                changed |= self._refresh_dir(root, seen_dirs)
+
+            # Verzeichnisse, die es nicht mehr gibt, verwerfen
+            for rel_dir in [d for d in self._dirs if d not in seen_dirs]:
+                del self._dirs[rel_dir]
+                changed = True
+
+            if changed:
+                self._rebuild_id_map()
+                self.save()
+            return changed
+
+    def _refresh_dir(self, dir_path: str, seen_dirs: set) -> bool:
+        rel_dir = self._rel(dir_path)
+        seen_dirs.add(rel_dir)
+        try:
+            mtime = io_stats.stat(dir_path).st_mtime
+        except OSError:
+            return False
+
+        entry = self._dirs.get(rel_dir)
+        changed = False
+
+        if entry is None or entry.get("mtime") != mtime:
+            changed = True
+            try:
+                names = io_stats.listdir(dir_path)
+            except OSError as e:
+                logger.error(f"Fehler beim Lesen des Verzeichnisses {dir_path}: {e}")
+                return False
+
+            old_files = entry.get("files", {}) if entry else {}
+            old_subdirs = entry.get("subdirs", []) if entry else []
+            files: Dict[str, List[str]] = {}
+            subdirs: List[str] = []
+            for name in names:
+                if name.startswith("."):
+                    continue
+                full_path = os.path.join(dir_path, name)
+                if os.path.isdir(full_path):
+                    subdirs.append(name)
+                elif name.lower().endswith(".json"):
+                    if name in old_files:
+                        files[name] = old_files[name]
+                        continue
+                    classified = self._classify_file(full_path)
+                    if classified:
+                        files[name] = list(classified)
+            entry = {"mtime": mtime, "files": files, "subdirs": sorted(subdirs)}
+            self._dirs[rel_dir] = entry
+            if old_subdirs != entry["subdirs"]:
+                changed = True
+
+        for sub in entry.get("subdirs", []):
+            changed |= self._refresh_dir(os.path.join(dir_path, sub), seen_dirs)
+        return changed
+
+    def _classify_file(self, full_path: str) -> Optional[Tuple[str, str]]:
+        try:
+            data = self._load(full_path)
+        except Exception as e:
+            logger.error(f"Fehler beim Indizieren von {full_path}: {e}")
+            return None
+        if not isinstance(data, dict) or not data.get("id"):
+            return None
+        kind = self._classify(full_path, data)
+        if not kind:
+            return None
+        return str(data["id"]), kind
+
+    def record(self, path: str, entity_id: str, kind: str, persist: bool = True) -> None:
+        """
+        Trägt eine gerade gespeicherte Datei in den Index ein.
+        persist=False spart das Schreiben der Indexdatei (z. B. bei vielen Watcher-Ereignissen);
+        der nächste refresh() holt verpasste Änderungen über die mtimes ohnehin nach.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            self._drop_id(entity_id, keep_path=path)
+            rel_dir, fname = os.path.split(self._rel(path))
+            entry = self._dirs.get(rel_dir)
+            if entry is not None:
+                entry["files"][fname] = [entity_id, kind]
+            # Unbekannte Verzeichnisse werden beim nächsten refresh() komplett gelesen;
+            # bis dahin trägt die ID-Map die Datei alleine.
+            self._by_id[entity_id] = (os.path.join(rel_dir, fname), kind)
+            if persist:
+                self.save()
+
+    def forget_path(self, path: str, persist: bool = True) -> None:
+        """Entfernt eine (gelöschte oder umbenannte) Datei aus dem Index."""
+        with self._lock:
+            self._ensure_loaded()
+            rel_dir, fname = os.path.split(self._rel(path))
+            entry = self._dirs.get(rel_dir)
+            hit = entry["files"].pop(fname, None) if entry else None
+            if hit:
+                current = self._by_id.get(hit[0])
+                if current and current[0] == os.path.join(rel_dir, fname):
+                    del self._by_id[hit[0]]
+                if persist:
+                    self.save()
+
+    def forget_id(self, entity_id: str) -> None:
+        """Entfernt alle Einträge zu einer ID."""
+        with self._lock:
+            self._ensure_loaded()
+            if self._drop_id(entity_id):
+                self.save()
+
+    def _drop_id(self, entity_id: str, keep_path: Optional[str] = None) -> bool:
+        hit = self._by_id.pop(entity_id, None)
+        if not hit:
+            return False
+        rel_path = hit[0]
+        if keep_path and rel_path == self._rel(keep_path):
+            return True
+        rel_dir, fname = os.path.split(rel_path)
+        entry = self._dirs.get(rel_dir)
+        if entry:
+            entry.get("files", {}).pop(fname, None)
+        return True
@@ -0,0 +1,197 @@
+import os
+import hashlib
+import logging
+import shutil
+import threading
+from typing import Dict, Iterable, Optional
+
+from classes.core import io_stats
+from classes.core.json_codec import DEFAULT_CODEC
+from classes.core.write_queue import atomic_write
+
+logger = logging.getLogger(__name__)
+
+# Präfix für Bild-Referenzen im Feld "image_filename"; ältere Einträge enthalten
+# einen Dateinamen im Entity-Ordner.
+REF_PREFIX = "sha256:"
+
+
+def is_ref(image_filename: Optional[str]) -> bool:
+    return bool(image_filename) and image_filename.startswith(REF_PREFIX)
+
+
+class ImageStore:
+    """
+    Inhaltsadressierter Bildspeicher: jedes Bild liegt genau einmal unter
+    <store_dir>/<xx>/<sha256><ext>, Entities verweisen per "sha256:<hash><ext>" darauf.
+
+    Pro Referenz wird festgehalten, welche Entities sie verwenden (Referenzzähler).
+    Fällt ein Zähler auf 0, wird das Bild sofort gelöscht, sofern die Referenzen
+    vollständig bekannt sind; collect_garbage() räumt alles Übrige auf.
+    """
+
+    VERSION = 1
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+        self.refs_file = os.path.join(store_dir, "refs.json")
+        self._lock = threading.RLock()
+        # entity_id -> ref
+        self._owner_ref: Dict[str, str] = {}
+        # ref -> Anzahl Entities
+        self._counts: Dict[str, int] = {}
+        self._loaded = False
+        # False, solange Bilder ohne erfasste Besitzer liegen könnten (refs.json fehlt oder
+        # ist defekt) -> dann nur collect_unused_images() nach vollständiger Zählung löschen
+        self._complete = True
+
+    # --- Referenzen ---
+
+    def path_of(self, ref: str) -> str:
+        name = ref[len(REF_PREFIX):]
+        return os.path.join(self.store_dir, name[:2], name)
+
+    def add(self, source_path: str) -> str:
+        """Übernimmt ein Bild in den Speicher (falls noch nicht vorhanden) und liefert die Referenz."""
+        # Referenzen vor dem ersten neuen Bild laden, sonst zählt es als Bild ohne erfassten Besitzer
+        with self._lock:
+            self._ensure_loaded()
+        _, ext = os.path.splitext(source_path)
+        # Bild liegt bereits im Speicher (z. B. erneut ausgewählt)
+        if os.path.dirname(os.path.dirname(os.path.abspath(source_path))) == os.path.abspath(self.store_dir):
+            return REF_PREFIX + os.path.basename(source_path)
+
+        digest = hashlib.sha256()
+        with open(source_path, "rb") as f:
+            for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b""):
+                digest.update(chunk)
+        ref = f"{REF_PREFIX}{digest.hexdigest()}{ext.lower()}"
+
+        target = self.path_of(ref)
+        if not os.path.exists(target):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            tmp_path = target + ".tmp"
+            shutil.copyfile(source_path, tmp_path)
+            os.replace(tmp_path, target)
+        return ref
+
+    # --- Referenzzähler ---
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not os.path.exists(self.refs_file):
+            self._complete = not self._has_images()
+            return
+        try:
+            raw = DEFAULT_CODEC.loads(io_stats.read_file(self.refs_file))
+            if raw.get("version") == self.VERSION:
+                self._set_owners(raw.get("owners", {}))
+            else:
+                self._complete = False
+        except Exception as e:
+            logger.warning(f"Bild-Referenzen {self.refs_file} konnten nicht gelesen werden: {e}")
+            self._set_owners({})
+            self._complete = False
+
+    def _set_owners(self, owner_ref: Dict[str, str]) -> None:
+        self._owner_ref = owner_ref
+        self._counts = {}
+        for ref in owner_ref.values():
+            self._counts[ref] = self._counts.get(ref, 0) + 1
+
+    def _has_images(self) -> bool:
+        if not os.path.isdir(self.store_dir):
+            return False
+        for shard in os.scandir(self.store_dir):
+            if shard.is_dir() and not shard.name.startswith(".") and any(os.scandir(shard.path)):
+                return True
+        return False
+
+    def save(self) -> None:
+        with self._lock:
+            os.makedirs(self.store_dir, exist_ok=True)
+            try:
+                atomic_write(
+                    self.refs_file,
+                    DEFAULT_CODEC.dumps({"version": self.VERSION, "owners": self._owner_ref}, compact=True),
+                )
+            except Exception as e:
+                logger.error(f"Fehler beim Speichern der Bild-Referenzen nach {self.refs_file}: {e}")
+
+    def assign(self, owner_id: str, image_filename: Optional[str], persist: bool = True) -> None:
+        """
+        Merkt sich, welches Bild ein Entity verwendet (None/Dateiname = keines aus dem Speicher).
+        Ein vorher verwendetes Bild, das danach niemand mehr referenziert, wird gelöscht.
+        """
+        ref = image_filename if is_ref(image_filename) else None
+        with self._lock:
+            self._ensure_loaded()
+            old_ref = self._owner_ref.get(owner_id)
+            if old_ref == ref:
+                return
+            if ref is None:
+                del self._owner_ref[owner_id]
+            else:
+                self._owner_ref[owner_id] = ref
+                self._counts[ref] = self._counts.get(ref, 0) + 1
+            if persist:
+                self.save()
+            if old_ref is not None:
+                self._release(old_ref)
+
+    def _release(self, ref: str) -> None:
+        count = self._counts.get(ref, 0) - 1
+        if count > 0:
+            self._counts[ref] = count
+            return
+        self._counts.pop(ref, None)
+        if not self._complete:
+            return
+        path = self.path_of(ref)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Fehler beim Entfernen von {path}: {e}")
+
+    def refcounts(self) -> Dict[str, int]:
+        with self._lock:
+            self._ensure_loaded()
+            return dict(self._counts)
+
+    def rebuild(self, owners: Iterable) -> None:
+        """Setzt die Referenzen aus (entity_id, image_filename)-Paaren komplett neu."""
+        with self._lock:
+            self._set_owners({str(oid): fname for oid, fname in owners if is_ref(fname)})
+            self._loaded = True
+            self._complete = True
+            self.save()
+
+    def collect_garbage(self, keep: Iterable[str] = ()) -> int:
+        """
+        Löscht Bilder ohne Referenz; keep enthält weitere Referenzen, die erhalten
+        bleiben (z. B. von Entities mit gleicher ID in einem zweiten Bestand).
+        Rückgabe: Anzahl entfernter Dateien.
+        """
+        with self._lock:
+            used = set(self.refcounts())
+            used.update(ref for ref in keep if is_ref(ref))
+            removed = 0
+            if not os.path.isdir(self.store_dir):
+                return 0
+            for shard in os.scandir(self.store_dir):
+                if not shard.is_dir() or shard.name.startswith("."):
+                    continue
+                for entry in os.scandir(shard.path):
+                    if REF_PREFIX + entry.name in used or not entry.is_file():
+                        continue
+                    try:
+                        os.remove(entry.path)
+                        removed += 1
+                    except OSError as e:
+                        logger.error(f"Fehler beim Entfernen von {entry.path}: {e}")
+            return removed
@@ -0,0 +1,101 @@
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Zählerstände: Dateisystem-Abfragen, gelesene und geschriebene Dateien, Zeit für (De-)Serialisierung
+COUNTERS = (
+    "stat_calls", "dir_listings",
+    "files_opened", "bytes_read", "parse_s",
+    "files_written", "bytes_written", "encode_s",
+)
+
+
+class IOStats:
+    """
+    Threadsichere Zähler für die Dateizugriffe des DataManagers und seiner Indizes
+    sowie Laufzeiten einzelner öffentlicher Aufrufe (Anzahl, Summe, Maximum).
+
+    Die Zähler sind prozessweit: Laufen mehrere Threads gleichzeitig, enthält der
+    Unterschied zweier counters()-Stände auch deren Zugriffe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = dict.fromkeys(COUNTERS, 0)
+        # Name -> [Aufrufe, Summe in s, Maximum in s]
+        self._calls: Dict[str, List[float]] = {}
+
+    def add(self, **deltas: float) -> None:
+        with self._lock:
+            for key, value in deltas.items():
+                self._counters[key] += value
+
+    def record_call(self, name: str, seconds: float) -> None:
+        with self._lock:
+            entry = self._calls.get(name)
+            if entry is None:
+                self._calls[name] = [1, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                if seconds > entry[2]:
+                    entry[2] = seconds
+
+    def counters(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._counters)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """{"io": Zählerstände, "calls": {Name: {"calls", "total_ms", "avg_ms", "max_ms"}}}."""
+        with self._lock:
+            io = {key: round(value, 6) if key.endswith("_s") else int(value) for key, value in self._counters.items()}
+            calls = {
+                name: {
+                    "calls": int(count),
+                    "total_ms": round(total * 1000.0, 3),
+                    "avg_ms": round(total * 1000.0 / count, 3),
+                    "max_ms": round(peak * 1000.0, 3),
+                }
+                for name, (count, total, peak) in sorted(self._calls.items())
+            }
+        return {"io": io, "calls": calls}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters = dict.fromkeys(COUNTERS, 0)
+            self._calls = {}
+
+
+# Gemeinsame Instanz für DataManager, Manifest, Indizes und Hintergrund-Schreiber
+IO_STATS = IOStats()
+
+
+# --- gezählte Dateisystem-Zugriffe ---
+
+def stat(path: str) -> os.stat_result:
+    IO_STATS.add(stat_calls=1)
+    return os.stat(path)
+
+
+def listdir(path: str) -> List[str]:
+    IO_STATS.add(dir_listings=1)
+    return os.listdir(path)
+
+
+def scandir(path: str):
+    IO_STATS.add(dir_listings=1)
+    return os.scandir(path)
+
+
+def walk(top: str) -> Iterator[Tuple[str, List[str], List[str]]]:
+    """Wie os.walk (von oben nach unten; dirnames darf weiterhin verändert werden)."""
+    for entry in os.walk(top):
+        IO_STATS.add(dir_listings=1)
+        yield entry
+
+
+def read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        raw = f.read()
+    IO_STATS.add(files_opened=1, bytes_read=len(raw))
+    return raw
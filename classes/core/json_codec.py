@@ -0,0 +1,86 @@
+import os
+import json
+import logging
+from typing import Any, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+try:
+    # Optional: deutlich schnelleres Parsen/Serialisieren
+    import orjson
+except ImportError:  # pragma: no cover - abhängig von der Installation
+    orjson = None
+
+BACKEND_ORJSON = "orjson"
+BACKEND_STDLIB = "json"
+
+
+class JsonCodec:
+    """
+    Liest und schreibt JSON über orjson, falls installiert, sonst über das json-Modul.
+
+    Lesbarer Modus (Standard): exakt dieselben Bytes wie
+    json.dump(data, f, indent=4, ensure_ascii=False) – orjson kennt keine Einrückung
+    mit 4 Leerzeichen, daher wird hier immer die Standardbibliothek verwendet.
+    Kompakter Modus: ohne Einrückung und Leerzeichen, für Massendaten und interne Dateien.
+    """
+
+    def __init__(self, backend: Optional[str] = None):
+        if backend is None:
+            backend = BACKEND_ORJSON if orjson is not None else BACKEND_STDLIB
+        if backend == BACKEND_ORJSON and orjson is None:
+            logger.warning("orjson ist nicht installiert, nutze das json-Modul.")
+            backend = BACKEND_STDLIB
+        if backend not in (BACKEND_ORJSON, BACKEND_STDLIB):
+            raise ValueError(f"Unbekanntes JSON-Backend: {backend}")
+        self.backend = backend
+
+    def loads(self, raw: Union[bytes, str]) -> Any:
+        if self.backend == BACKEND_ORJSON:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # z. B. NaN/Infinity, die das json-Modul akzeptiert
+                pass
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        return json.loads(raw)
+
+    def dumps(self, data: Any, compact: bool = False) -> bytes:
+        """Serialisiert data als UTF-8-Bytes."""
+        if compact and self.backend == BACKEND_ORJSON:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                # z. B. Ganzzahlen jenseits von 64 Bit
+                pass
+        if compact:
+            text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        else:
+            text = json.dumps(data, indent=4, ensure_ascii=False)
+        return text.encode("utf-8")
+
+    def encode_file(self, data: Any, compact: bool = False) -> bytes:
+        """
+        Dateiinhalt als Bytes. Im lesbaren Modus mit den Zeilenenden, die bisher der
+        Textmodus von open() geschrieben hat (os.linesep) – so bleibt die Datei bytegleich.
+        """
+        if compact:
+            return self.dumps(data, compact=True)
+        text = json.dumps(data, indent=4, ensure_ascii=False)
+        if os.linesep != "\n":
+            text = text.replace("\n", os.linesep)
+        return text.encode("utf-8")
+
+    def load_file(self, path: str) -> Any:
+        with open(path, "rb") as f:
+            return self.loads(f.read())
+
+    def dump_file(self, path: str, data: Any, compact: bool = False) -> None:
+        payload = self.encode_file(data, compact=compact)
+        with open(path, "wb") as f:
+            f.write(payload)
+
+
+# Gemeinsame Instanz für Module ohne eigene Konfiguration (Index, Kopfdaten, SQLite)
+DEFAULT_CODEC = JsonCodec()
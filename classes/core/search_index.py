@@ -0,0 +1,232 @@
+import os
+import re
+import bisect
+import math
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from classes.core import io_stats
+from classes.core.json_codec import DEFAULT_CODEC
+from classes.core.write_queue import atomic_write
+
+logger = logging.getLogger(__name__)
+
+Signature = Tuple[int, int]
+
+_TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+# Tokens kürzer als das werden nicht indiziert
+MIN_TOKEN_LENGTH = 2
+# Gewichtung eines Treffers, bei dem der Suchbegriff nur Anfang eines Worts ist
+PREFIX_FACTOR = 0.7
+
+
+def tokenize(text: str) -> List[str]:
+    """Zerlegt Text in kleingeschriebene Wörter (Buchstaben/Ziffern, Unicode)."""
+    return [t for t in _TOKEN_RE.findall(text.casefold()) if len(t) >= MIN_TOKEN_LENGTH]
+
+
+class SearchIndex:
+    """
+    Invertierter Volltext-Index (Wort -> Dokumente) über die Entity-Dateien.
+
+    Pro Datei werden Signatur (mtime, Größe), Typ, ID, Anzeigetext und die gewichteten
+    Wörter gespeichert; die Sidecar-Datei erlaubt es, nach einem Neustart nur geänderte
+    Dateien neu zu lesen (index_file=None: nur im Speicher). Die Wortlisten (Postings)
+    entstehen beim Laden im Speicher.
+
+    search() verknüpft alle Suchwörter mit UND; jedes Suchwort trifft auch Wörter,
+    die mit ihm beginnen (Suche während der Eingabe). Bewertet wird nach Gewicht im
+    Dokument (Name/Titel zählt mehr) und Seltenheit des Worts (IDF).
+    """
+
+    VERSION = 1
+
+    def __init__(self, index_file: Optional[str], data_dir: str):
+        self.index_file = index_file
+        self.data_dir = data_dir
+        self._lock = threading.RLock()
+        # rel_path -> {"sig": [mtime_ns, size], "kind", "id", "display", "terms": {wort: gewicht}}
+        self._docs: Dict[str, Dict[str, Any]] = {}
+        # wort -> {rel_path: gewicht}
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._sorted_terms: Optional[List[str]] = None
+        self._loaded = False
+        self._dirty = False
+        # Stand (DataManager._index_generation) des letzten Abgleichs mit dem Datenordner
+        self.generation: Optional[int] = None
+
+    def _rel(self, path: str) -> str:
+        return os.path.relpath(path, self.data_dir)
+
+    def _abs(self, rel_path: str) -> str:
+        return os.path.join(self.data_dir, rel_path)
+
+    # --- Persistenz ---
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.index_file or not os.path.exists(self.index_file):
+            return
+        try:
+            raw = DEFAULT_CODEC.loads(io_stats.read_file(self.index_file))
+            if raw.get("version") != self.VERSION:
+                return
+            self._docs = raw.get("docs", {})
+        except Exception as e:
+            logger.warning(f"Suchindex {self.index_file} konnte nicht gelesen werden, wird neu aufgebaut: {e}")
+            self._docs = {}
+        for rel_path, doc in self._docs.items():
+            self._add_postings(rel_path, doc.get("terms", {}))
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty or not self.index_file:
+                return
+            os.makedirs(os.path.dirname(self.index_file), exist_ok=True)
+            try:
+                atomic_write(
+                    self.index_file,
+                    DEFAULT_CODEC.dumps({"version": self.VERSION, "docs": self._docs}, compact=True),
+                )
+                self._dirty = False
+            except Exception as e:
+                logger.error(f"Fehler beim Speichern des Suchindex nach {self.index_file}: {e}")
+
+    # --- Pflege ---
+
+    def _add_postings(self, rel_path: str, terms: Dict[str, float]) -> None:
+        for term, weight in terms.items():
+            self._postings.setdefault(term, {})[rel_path] = weight
+        if terms:
+            self._sorted_terms = None
+
+    def _remove_postings(self, rel_path: str, terms: Dict[str, float]) -> None:
+        for term in terms:
+            docs = self._postings.get(term)
+            if docs is None:
+                continue
+            docs.pop(rel_path, None)
+            if not docs:
+                del self._postings[term]
+                self._sorted_terms = None
+
+    def is_current(self, path: str, signature: Signature) -> bool:
+        with self._lock:
+            self._ensure_loaded()
+            doc = self._docs.get(self._rel(path))
+            return doc is not None and tuple(doc["sig"]) == tuple(signature)
+
+    def put(
+        self,
+        path: str,
+        signature: Signature,
+        kind: Optional[str],
+        entity_id: Optional[str] = None,
+        display: str = "",
+        terms: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """Nimmt eine Datei auf (kind=None bzw. ohne terms: bekannt, aber nicht durchsuchbar)."""
+        terms = terms or {}
+        with self._lock:
+            self._ensure_loaded()
+            rel_path = self._rel(path)
+            old = self._docs.get(rel_path)
+            if old is not None:
+                self._remove_postings(rel_path, old.get("terms", {}))
+            self._docs[rel_path] = {
+                "sig": list(signature),
+                "kind": kind,
+                "id": entity_id,
+                "display": display,
+                "terms": terms,
+            }
+            self._add_postings(rel_path, terms)
+            self._dirty = True
+
+    def forget(self, path: str) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            rel_path = self._rel(path)
+            doc = self._docs.pop(rel_path, None)
+            if doc is not None:
+                self._remove_postings(rel_path, doc.get("terms", {}))
+                self._dirty = True
+
+    def prune(self, base_dir: str, seen_paths: Iterable[str]) -> None:
+        """Verwirft Dateien unterhalb von base_dir, die beim letzten Abgleich fehlten."""
+        with self._lock:
+            self._ensure_loaded()
+            prefix = self._rel(base_dir) + os.sep
+            seen_rel = {self._rel(p) for p in seen_paths}
+            for rel_path in [r for r in self._docs if r.startswith(prefix) and r not in seen_rel]:
+                self.forget(self._abs(rel_path))
+
+    # --- Suche ---
+
+    def _expand(self, token: str) -> List[Tuple[str, float]]:
+        """Index-Wörter zu einem Suchwort: exakter Treffer und Wörter mit diesem Anfang."""
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        terms = self._sorted_terms
+        matches = []
+        pos = bisect.bisect_left(terms, token)
+        while pos < len(terms) and terms[pos].startswith(token):
+            term = terms[pos]
+            matches.append((term, 1.0 if term == token else PREFIX_FACTOR))
+            pos += 1
+        return matches
+
+    def search(self, text: str, kinds: Optional[Iterable[str]] = None, limit: Optional[int] = 50) -> List[Dict[str, Any]]:
+        """
+        Liefert Treffer als {"kind", "id", "path", "display", "score"}, bestbewertete zuerst.
+        kinds schränkt auf Entity-Typen ein.
+        """
+        tokens = list(dict.fromkeys(tokenize(text)))
+        if not tokens:
+            return []
+        kinds = set(kinds) if kinds is not None else None
+
+        with self._lock:
+            self._ensure_loaded()
+            total = max(1, len(self._docs))
+            scores: Optional[Dict[str, float]] = None
+            # seltene Suchwörter zuerst, damit die Schnittmenge schnell klein wird
+            expanded = sorted(
+                ((token, self._expand(token)) for token in tokens),
+                key=lambda item: sum(len(self._postings[t]) for t, _ in item[1]),
+            )
+            for _token, matches in expanded:
+                token_scores: Dict[str, float] = {}
+                for term, factor in matches:
+                    docs = self._postings[term]
+                    idf = math.log(1.0 + total / len(docs))
+                    for rel_path, weight in docs.items():
+                        if scores is not None and rel_path not in scores:
+                            continue
+                        score = weight * idf * factor
+                        if score > token_scores.get(rel_path, 0.0):
+                            token_scores[rel_path] = score
+                if scores is None:
+                    scores = token_scores
+                else:
+                    scores = {p: scores[p] + s for p, s in token_scores.items()}
+                if not scores:
+                    return []
+
+            results = []
+            for rel_path, score in scores.items():
+                doc = self._docs[rel_path]
+                if kinds is not None and doc["kind"] not in kinds:
+                    continue
+                results.append({
+                    "kind": doc["kind"],
+                    "id": doc["id"],
+                    "path": self._abs(rel_path),
+                    "display": doc["display"],
+                    "score": round(score, 4),
+                })
+        results.sort(key=lambda r: (-r["score"], r["display"].casefold()))
+        return results[:limit] if limit is not None else results
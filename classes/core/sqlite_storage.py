@@ -0,0 +1,464 @@
+import os
+import time
+import uuid
+import shutil
+import sqlite3
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from classes.core.data_manager import DataManager
+from classes.core.json_codec import DEFAULT_CODEC
+
+logger = logging.getLogger(__name__)
+
+# Bild-Besitzer aus der Datenbank; getrennt von Entities gleicher ID in der Ordnerstruktur,
+# damit das Löschen des einen nicht das Bild des anderen freigibt
+IMAGE_OWNER_PREFIX = "sqlite:"
+
+
+class SQLiteStorage:
+    """
+    Alternatives Storage-Backend: alle Entities in einer lokalen SQLite-Datei.
+
+    Bietet dieselben get_all_*/get_*_by_id/save_*/delete_*-Methoden wie der DataManager
+    und kann per DataManager.use_backend(SQLiteStorage(...)) eingehängt werden.
+    Die Dokumente liegen unverändert als JSON in der Spalte "doc"; id, name, role,
+    campaign_id und type sind zusätzlich als indizierte Spalten geführt.
+
+    Bilder liegen weiterhin als Dateien in einem Asset-Ordner neben der Datenbank
+    (<db>_assets/<kind>/<id>/). Das "path"-Feld der Ergebnisse zeigt auf eine
+    (virtuelle) JSON-Datei in diesem Ordner, damit os.path.dirname(path) – wie bei der
+    Ordnerstruktur – den Bildordner liefert.
+
+    import_from_folders() und export_to_folders() übertragen den Bestand zwischen
+    der Ordnerstruktur unter data/ und der Datenbank.
+    """
+
+    SCHEMA_VERSION = 1
+    # Zeilen pro fetchmany() in den iter_*-Methoden
+    ITER_BATCH = 256
+    # Filterfelder, die als indizierte Spalte direkt in SQL geprüft werden
+    ITER_COLUMNS = ("role", "campaign_id", "type")
+
+    def __init__(self, db_path: str, assets_dir: Optional[str] = None):
+        self.db_path = db_path
+        self.assets_dir = assets_dir or os.path.splitext(db_path)[0] + "_assets"
+        db_dir = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(db_dir, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entities (
+                    kind        TEXT NOT NULL,
+                    id          TEXT NOT NULL,
+                    name        TEXT,
+                    role        TEXT,
+                    campaign_id TEXT,
+                    type        TEXT,
+                    doc         TEXT NOT NULL,
+                    updated_at  REAL NOT NULL,
+                    PRIMARY KEY (kind, id)
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entities_id ON entities(id)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entities_name ON entities(kind, name)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entities_role ON entities(kind, role)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entities_campaign ON entities(kind, campaign_id)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entities_type ON entities(kind, type)")
+            self._conn.execute(f"PRAGMA user_version={self.SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # --- helpers ---
+
+    def _entity_folder(self, kind: str, entity_id: str) -> str:
+        return os.path.join(self.assets_dir, kind, str(entity_id))
+
+    def _virtual_path(self, kind: str, entity_id: str) -> str:
+        return os.path.join(self._entity_folder(kind, entity_id), f"{entity_id}.json")
+
+    def _rows(self, sql: str, params: Iterable[Any] = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, tuple(params)).fetchall()
+
+    def _docs(self, kind: str, where: str = "", params: Iterable[Any] = ()) -> List[Tuple[str, Dict[str, Any]]]:
+        sql = "SELECT id, doc FROM entities WHERE kind = ?"
+        if where:
+            sql += f" AND {where}"
+        sql += " ORDER BY name COLLATE NOCASE, id"
+        return [(row["id"], DEFAULT_CODEC.loads(row["doc"])) for row in self._rows(sql, [kind, *params])]
+
+    def _meta(self, kind: str, display, where: str = "", params: Iterable[Any] = ()) -> List[Dict[str, Any]]:
+        return [
+            {"data": data, "path": self._virtual_path(kind, entity_id), "display": display(data)}
+            for entity_id, data in self._docs(kind, where, params)
+        ]
+
+    def _iter_meta(
+        self,
+        kind: str,
+        display,
+        where: Optional[Callable[[Dict[str, Any]], bool]],
+        limit: Optional[int],
+        fields: Dict[str, Any],
+        extra_where: str = "",
+        extra_params: Iterable[Any] = (),
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Gegenstück zu DataManager._filter_entries: liest die Zeilen blockweise per
+        fetchmany(); Filter auf indizierten Spalten werden in SQL ausgewertet.
+        """
+        clauses = [extra_where] if extra_where else []
+        params = list(extra_params)
+        remaining: Dict[str, Any] = {}
+        for key, value in fields.items():
+            if key in self.ITER_COLUMNS and isinstance(value, str):
+                clauses.append(f"{key} = ?")
+                params.append(value)
+            else:
+                remaining[key] = value
+        sql = "SELECT id, doc FROM entities WHERE kind = ?"
+        if clauses:
+            sql += " AND " + " AND ".join(clauses)
+        sql += " ORDER BY name COLLATE NOCASE, id"
+
+        defaults = {"role": "pc"} if kind == DataManager.KIND_CHARACTER else None
+        return DataManager._filter_entries(
+            self._iter_rows(kind, display, sql, [kind, *params]), where, limit, remaining, defaults
+        )
+
+    def _iter_rows(self, kind: str, display, sql: str, params: List[Any]) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            cursor = self._conn.execute(sql, tuple(params))
+        try:
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(self.ITER_BATCH)
+                if not rows:
+                    return
+                for row in rows:
+                    data = DEFAULT_CODEC.loads(row["doc"])
+                    yield {"data": data, "path": self._virtual_path(kind, row["id"]), "display": display(data)}
+        finally:
+            cursor.close()
+
+    def _get(self, kind: str, entity_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._rows("SELECT doc FROM entities WHERE kind = ? AND id = ?", [kind, str(entity_id)])
+        return DEFAULT_CODEC.loads(rows[0]["doc"]) if rows else None
+
+    def _upsert(self, kind: str, data: Dict[str, Any], image_source_path: Optional[str] = None) -> str:
+        entity_id = data.get("id")
+        if not entity_id:
+            entity_id = str(uuid.uuid4())
+            data["id"] = entity_id
+        entity_id = str(entity_id)
+
+        folder = self._entity_folder(kind, entity_id)
+        if image_source_path:
+            os.makedirs(folder, exist_ok=True)
+            safe_name = DataManager._safe_name(data.get("name") or data.get("title"), fallback="Unbenannt")
+            copied = DataManager._copy_entity_image(
+                entity_safe_name=safe_name,
+                entity_id=entity_id,
+                target_folder_path=folder,
+                image_source_path=image_source_path,
+            )
+            if copied:
+                data["image_filename"] = copied
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entities (kind, id, name, role, campaign_id, type, doc, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                self._row(kind, data),
+            )
+        DataManager._get_image_store().assign(IMAGE_OWNER_PREFIX + str(entity_id), data.get("image_filename"))
+        return self._virtual_path(kind, entity_id)
+
+    @staticmethod
+    def _row(kind: str, data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Tabellenzeile für ein Dokument; vergibt eine ID, falls noch keine gesetzt ist."""
+        if not data.get("id"):
+            data["id"] = str(uuid.uuid4())
+        return (
+            kind,
+            str(data["id"]),
+            data.get("name") or data.get("title"),
+            data.get("role", "pc") if kind == DataManager.KIND_CHARACTER else data.get("role"),
+            data.get("campaign_id"),
+            data.get("type"),
+            DEFAULT_CODEC.dumps(data, compact=True).decode("utf-8"),
+            time.time(),
+        )
+
+    def save_many(self, kind: str, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Gegenstück zu DataManager.save_many: alle Datensätze in einer Transaktion."""
+        results: List[Dict[str, Any]] = []
+        rows = []
+        for record in records:
+            if not isinstance(record, dict):
+                results.append({"id": None, "path": None, "error": "Datensatz ist kein Dictionary."})
+                continue
+            row = self._row(kind, record)
+            rows.append(row)
+            results.append({"id": row[1], "path": self._virtual_path(kind, row[1]), "error": None})
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entities (kind, id, name, role, campaign_id, type, doc, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        if rows:
+            store = DataManager._get_image_store()
+            for record in records:
+                if isinstance(record, dict):
+                    store.assign(IMAGE_OWNER_PREFIX + str(record["id"]), record.get("image_filename"), persist=False)
+            store.save()
+        return results
+
+    def delete_entity(self, kind: str, entity_id: str) -> bool:
+        """Löscht ein Entity samt Asset-Ordner."""
+        with self._lock, self._conn:
+            cur = self._conn.execute("DELETE FROM entities WHERE kind = ? AND id = ?", (kind, str(entity_id)))
+        folder = self._entity_folder(kind, entity_id)
+        if os.path.isdir(folder):
+            shutil.rmtree(folder, ignore_errors=True)
+        if cur.rowcount > 0:
+            DataManager._get_image_store().assign(IMAGE_OWNER_PREFIX + str(entity_id), None)
+        return cur.rowcount > 0
+
+    def image_owners(self) -> List[Tuple[str, Optional[str]]]:
+        """(ID, image_filename) aller Entities der Datenbank, siehe DataManager.collect_unused_images()."""
+        rows = self._rows("SELECT id, json_extract(doc, '$.image_filename') AS image_filename FROM entities")
+        return [(IMAGE_OWNER_PREFIX + row["id"], row["image_filename"]) for row in rows]
+
+    # --- SUMMARIES ---
+
+    def get_summaries(self, kind: str, campaign_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        if kind == DataManager.KIND_QUEST:
+            if not campaign_id:
+                return []
+            docs = self._docs(kind, "campaign_id = ?", [str(campaign_id)])
+        else:
+            docs = self._docs(kind)
+        results = []
+        for entity_id, data in docs:
+            summary = DataManager._summarize(data)
+            results.append({
+                "path": self._virtual_path(kind, entity_id),
+                "display": DataManager._display_for(kind, summary),
+                "summary": summary,
+            })
+        return results
+
+    def load_entity_data(self, path: str) -> Optional[Dict[str, Any]]:
+        """Gegenstück zu DataManager.load_entity_data für die (virtuellen) Pfade dieses Backends."""
+        folder = os.path.dirname(path)
+        entity_id = os.path.basename(folder)
+        kind = os.path.basename(os.path.dirname(folder))
+        return self._get(kind, entity_id)
+
+    # --- QUEST MANAGEMENT ---
+
+    def get_all_quests_meta(self, campaign_id: str) -> List[Dict[str, Any]]:
+        if not campaign_id:
+            return []
+        return self._meta(DataManager.KIND_QUEST, DataManager._quest_display, "campaign_id = ?", [str(campaign_id)])
+
+    def iter_quests(self, campaign_id: str, where=None, limit: Optional[int] = None, **fields: Any) -> Iterator[Dict[str, Any]]:
+        if not campaign_id:
+            return iter(())
+        return self._iter_meta(
+            DataManager.KIND_QUEST, DataManager._quest_display, where, limit, fields,
+            "campaign_id = ?", [str(campaign_id)],
+        )
+
+    def save_quest(self, quest_data: Dict[str, Any], file_path: str = None, image_source_path: Optional[str] = None) -> str:
+        if not quest_data.get("campaign_id"):
+            raise ValueError("Quest muss einer Kampagne zugewiesen sein (campaign_id fehlt).")
+        return self._upsert(DataManager.KIND_QUEST, quest_data, image_source_path)
+
+    # --- CHARACTER MANAGEMENT ---
+
+    def get_all_characters(self) -> List[Dict[str, Any]]:
+        return self._meta(DataManager.KIND_CHARACTER, DataManager._character_display)
+
+    def iter_characters(self, where=None, limit: Optional[int] = None, **fields: Any) -> Iterator[Dict[str, Any]]:
+        return self._iter_meta(DataManager.KIND_CHARACTER, DataManager._character_display, where, limit, fields)
+
+    def get_character_by_id(self, char_id: str) -> Optional[Dict[str, Any]]:
+        return self._get(DataManager.KIND_CHARACTER, char_id)
+
+    def query_characters(
+        self,
+        role: Optional[str] = None,
+        campaign_id: Optional[str] = None,
+        class_: Optional[str] = None,
+        player_id: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        where=None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        clauses, params = [], []
+        if role is not None:
+            clauses.append("role = ?")
+            params.append(role)
+        if campaign_id is not None:
+            clauses.append("campaign_id = ?")
+            params.append(str(campaign_id))
+        if class_ is not None:
+            clauses.append("json_extract(doc, '$.class') = ?")
+            params.append(class_)
+        if player_id is not None:
+            clauses.append("json_extract(doc, '$.player_id') = ?")
+            params.append(str(player_id))
+        if name_prefix:
+            escaped = name_prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            clauses.append("name LIKE ? ESCAPE '\\'")
+            params.append(escaped + "%")
+        return list(self._iter_meta(
+            DataManager.KIND_CHARACTER, DataManager._character_display, where, limit, {},
+            " AND ".join(clauses), params,
+        ))
+
+    def get_characters_by_role(self, role_filter: str) -> List[Dict[str, Any]]:
+        return self._meta(DataManager.KIND_CHARACTER, DataManager._character_role_display, "role = ?", [role_filter])
+
+    def save_character(self, character_data: dict, file_path: str = None, image_source_path: Optional[str] = None) -> str:
+        return self._upsert(DataManager.KIND_CHARACTER, character_data, image_source_path)
+
+    # --- ITEM MANAGEMENT ---
+
+    def get_all_items(self) -> List[Dict[str, Any]]:
+        return [data for _, data in self._docs(DataManager.KIND_ITEM)]
+
+    def get_all_items_meta(self) -> List[Dict[str, Any]]:
+        return self._meta(DataManager.KIND_ITEM, DataManager._named_display)
+
+    def iter_items(self, where=None, limit: Optional[int] = None, **fields: Any) -> Iterator[Dict[str, Any]]:
+        return self._iter_meta(DataManager.KIND_ITEM, DataManager._named_display, where, limit, fields)
+
+    def save_item(self, item_data: Dict[str, Any], file_path: str = None, image_source_path: Optional[str] = None) -> str:
+        return self._upsert(DataManager.KIND_ITEM, item_data, image_source_path)
+
+    def delete_item(self, item_id: str) -> bool:
+        return self.delete_entity(DataManager.KIND_ITEM, item_id)
+
+    # --- CONDITION MANAGEMENT ---
+
+    def get_all_conditions(self) -> List[Dict[str, Any]]:
+        return [data for _, data in self._docs(DataManager.KIND_CONDITION)]
+
+    def get_all_conditions_meta(self) -> List[Dict[str, Any]]:
+        return self._meta(DataManager.KIND_CONDITION, DataManager._named_display)
+
+    def iter_conditions(self, where=None, limit: Optional[int] = None, **fields: Any) -> Iterator[Dict[str, Any]]:
+        return self._iter_meta(DataManager.KIND_CONDITION, DataManager._named_display, where, limit, fields)
+
+    def save_condition(self, cond_data: Dict[str, Any], file_path: str = None, image_source_path: Optional[str] = None) -> str:
+        return self._upsert(DataManager.KIND_CONDITION, cond_data, image_source_path)
+
+    def delete_condition(self, cond_id: str) -> bool:
+        return self.delete_entity(DataManager.KIND_CONDITION, cond_id)
+
+    # --- CAMPAIGN MANAGEMENT ---
+
+    def get_all_campaigns(self) -> List[Dict[str, Any]]:
+        return self._meta(DataManager.KIND_CAMPAIGN, DataManager._campaign_display)
+
+    def save_campaign(self, campaign_data: dict, file_path: str = None, image_source_path: Optional[str] = None) -> str:
+        return self._upsert(DataManager.KIND_CAMPAIGN, campaign_data, image_source_path)
+
+    # --- PLAYER MANAGEMENT ---
+
+    def get_all_players(self) -> List[Dict[str, Any]]:
+        return self._meta(DataManager.KIND_PLAYER, DataManager._player_display)
+
+    def get_player_by_id(self, player_id: str) -> Optional[Dict[str, Any]]:
+        return self._get(DataManager.KIND_PLAYER, player_id)
+
+    def save_player(self, player_data: Dict[str, Any]) -> str:
+        return self._upsert(DataManager.KIND_PLAYER, player_data)
+
+    # --- IMPORT / EXPORT ---
+
+    def _folder_entries(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Alle Entities der Ordnerstruktur als (Pfad, Daten) – unabhängig vom gesetzten Backend."""
+        previous = DataManager.use_backend(None)
+        try:
+            sources = [
+                DataManager.get_all_characters(),
+                DataManager.get_all_campaigns(),
+                DataManager.get_all_items_meta(),
+                DataManager.get_all_conditions_meta(),
+                DataManager.get_all_players(),
+            ]
+            entries = [(m["path"], m["data"]) for metas in sources for m in metas]
+            for campaign in sources[1]:
+                campaign_id = campaign["data"].get("id")
+                entries.extend((q["path"], q["data"]) for q in DataManager.get_all_quests_meta(str(campaign_id)))
+            return entries
+        finally:
+            DataManager.use_backend(previous)
+
+    def import_from_folders(self) -> int:
+        """
+        Übernimmt alle Entities aus der Ordnerstruktur unter data/ in die Datenbank
+        (bestehende Einträge mit gleicher ID werden überschrieben). Bilder werden in den
+        Asset-Ordner kopiert. Rückgabe: Anzahl importierter Entities.
+        """
+        count = 0
+        for path, data in self._folder_entries():
+            kind = DataManager._classify_entity(path, data)
+            if not kind:
+                continue
+            image_filename = data.get("image_filename")
+            image_path = DataManager.resolve_image_path(os.path.dirname(path), image_filename)
+            self._upsert(kind, data, image_path if image_path and os.path.exists(image_path) else None)
+            count += 1
+        logger.info(f"{count} Entities nach {self.db_path} importiert.")
+        return count
+
+    def export_to_folders(self) -> int:
+        """
+        Schreibt alle Entities der Datenbank über die regulären save_*-Methoden in die
+        Ordnerstruktur unter data/ (inkl. Bilder). Rückgabe: Anzahl exportierter Entities.
+        """
+        savers = {
+            DataManager.KIND_CAMPAIGN: DataManager.save_campaign,
+            DataManager.KIND_CHARACTER: DataManager.save_character,
+            DataManager.KIND_QUEST: DataManager.save_quest,
+            DataManager.KIND_ITEM: DataManager.save_item,
+            DataManager.KIND_CONDITION: DataManager.save_condition,
+        }
+        count = 0
+        previous = DataManager.use_backend(None)
+        try:
+            # Kampagnen zuerst, damit kampagnenspezifische Charaktere/Quests ihren Ordner finden
+            for kind in (DataManager.KIND_CAMPAIGN, DataManager.KIND_CHARACTER, DataManager.KIND_QUEST,
+                         DataManager.KIND_ITEM, DataManager.KIND_CONDITION, DataManager.KIND_PLAYER):
+                for entity_id, data in self._docs(kind):
+                    if kind == DataManager.KIND_PLAYER:
+                        DataManager.save_player(data)
+                    else:
+                        image_path = DataManager.resolve_image_path(
+                            self._entity_folder(kind, entity_id), data.get("image_filename")
+                        )
+                        savers[kind](data, image_source_path=image_path)
+                    count += 1
+        finally:
+            DataManager.use_backend(previous)
+        logger.info(f"{count} Entities aus {self.db_path} exportiert.")
+        return count
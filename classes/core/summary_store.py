@@ -0,0 +1,95 @@
+import os
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from classes.core import io_stats
+from classes.core.json_codec import DEFAULT_CODEC
+
+logger = logging.getLogger(__name__)
+
+Signature = Tuple[int, int]
+
+
+class SummaryStore:
+    """
+    Sidecar-Datei mit den Kopfdaten (Name, Klasse, Alter, ID, Rolle, Status …) aller
+    Entity-Dateien. Auswahllisten brauchen nur diese Felder; solange sich eine Datei
+    nicht geändert hat (gleiche mtime und Größe), muss sie dafür nicht geöffnet werden.
+    """
+
+    VERSION = 1
+
+    def __init__(self, store_file: str, data_dir: str):
+        self.store_file = store_file
+        self.data_dir = data_dir
+        self._lock = threading.RLock()
+        # rel_path -> {"sig": [mtime_ns, size], "kind": str, "summary": {...}}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._dirty = False
+
+    def _rel(self, path: str) -> str:
+        return os.path.relpath(path, self.data_dir)
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not os.path.exists(self.store_file):
+            return
+        try:
+            raw = DEFAULT_CODEC.loads(io_stats.read_file(self.store_file))
+            if raw.get("version") == self.VERSION:
+                self._entries = raw.get("entries", {})
+        except Exception as e:
+            logger.warning(f"Kopfdaten-Datei {self.store_file} konnte nicht gelesen werden, wird neu aufgebaut: {e}")
+            self._entries = {}
+
+    def get(self, path: str, signature: Signature) -> Optional[Tuple[Optional[str], Dict[str, Any]]]:
+        """Liefert (kind, summary), wenn für path ein Eintrag mit passender Signatur existiert."""
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(self._rel(path))
+            if entry is None or tuple(entry["sig"]) != tuple(signature):
+                return None
+            return entry["kind"], dict(entry["summary"])
+
+    def put(self, path: str, signature: Signature, kind: Optional[str], summary: Dict[str, Any]) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[self._rel(path)] = {"sig": list(signature), "kind": kind, "summary": summary}
+            self._dirty = True
+
+    def forget(self, path: str) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            if self._entries.pop(self._rel(path), None) is not None:
+                self._dirty = True
+
+    def prune(self, base_dir: str, seen_paths: set) -> None:
+        """Verwirft Einträge unterhalb von base_dir, deren Datei beim letzten Durchlauf fehlte."""
+        with self._lock:
+            self._ensure_loaded()
+            rel_base = self._rel(base_dir)
+            prefix = rel_base + os.sep
+            seen_rel = {self._rel(p) for p in seen_paths}
+            stale = [r for r in self._entries if r.startswith(prefix) and r not in seen_rel]
+            for rel in stale:
+                del self._entries[rel]
+            if stale:
+                self._dirty = True
+
+    def save(self) -> None:
+        """Schreibt die Sidecar-Datei, falls sich seit dem letzten Speichern etwas geändert hat."""
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(os.path.dirname(self.store_file), exist_ok=True)
+            tmp_path = self.store_file + ".tmp"
+            try:
+                DEFAULT_CODEC.dump_file(tmp_path, {"version": self.VERSION, "entries": self._entries}, compact=True)
+                os.replace(tmp_path, self.store_file)
+                self._dirty = False
+            except Exception as e:
+                logger.error(f"Fehler beim Speichern der Kopfdaten nach {self.store_file}: {e}")
@@ -0,0 +1,244 @@
+import os
+import time
+import marshal
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from classes.core.io_stats import IO_STATS
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# on_written(path, data, context) – wird nach erfolgreichem Ersetzen der Datei aufgerufen
+WrittenCallback = Callable[[str, Any, Any], None]
+
+
+def atomic_write(path: str, payload: bytes, fsync: bool = False) -> None:
+    """
+    Schreibt payload zuerst in eine temporäre Datei neben path und ersetzt path dann
+    per os.replace. Ein Absturz mitten im Schreiben hinterlässt so nie eine halbe Datei.
+    """
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        _remove_quietly(tmp_path)
+        raise
+    IO_STATS.add(files_written=1, bytes_written=len(payload))
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _fsync_dir(dir_path: str) -> None:
+    """Macht os.replace im Verzeichnis dauerhaft (POSIX; unter Windows nicht möglich)."""
+    try:
+        fd = os.open(dir_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class WriteBehindQueue:
+    """
+    Schreibt Dokumente in einem Hintergrund-Thread.
+
+    - Mehrfaches Speichern desselben Pfads vor dem Schreiben wird zusammengefasst
+      (nur der letzte Stand landet auf der Platte).
+    - Jede Datei wird über eine temporäre Datei + os.replace ersetzt.
+    - fsync erfolgt gesammelt am Ende eines Batches (Dateien, dann Verzeichnisse).
+    - flush() wartet, bis alles geschrieben ist (z. B. beim Beenden).
+
+    Beim Einreihen wird ein marshal-Schnappschuss genommen; spätere Änderungen des
+    Aufrufers am Dictionary wirken sich also nicht auf den geschriebenen Stand aus.
+    """
+
+    MISSING = _MISSING
+
+    def __init__(
+        self,
+        encode: Callable[[Any], bytes],
+        on_written: Optional[WrittenCallback] = None,
+        delay: float = 0.2,
+        max_batch: int = 64,
+        fsync: bool = True,
+    ):
+        self._encode = encode
+        self._on_written = on_written
+        self.delay = delay
+        self.max_batch = max_batch
+        self.fsync = fsync
+
+        self._cond = threading.Condition()
+        # path -> (marshal-Schnappschuss, context)
+        self._pending: "OrderedDict[str, Tuple[bytes, Any]]" = OrderedDict()
+        self._in_flight: Dict[str, Tuple[bytes, Any]] = {}
+        self._failed: Dict[str, Exception] = {}
+        self._urgent = False
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="DataManager-Writer", daemon=True)
+        self._thread.start()
+
+    # --- Einreihen / Abfragen ---
+
+    def submit(self, path: str, data: Any, context: Any = None) -> None:
+        blob = marshal.dumps(data)
+        with self._cond:
+            if self._stopping:
+                raise RuntimeError("Schreib-Warteschlange wurde bereits beendet.")
+            self._pending.pop(path, None)
+            self._pending[path] = (blob, context)
+            self._cond.notify_all()
+
+    def pending(self, path: str) -> Any:
+        """Noch nicht geschriebener Stand zu path (als Kopie) oder MISSING."""
+        with self._cond:
+            entry = self._pending.get(path) or self._in_flight.get(path)
+        if entry is None:
+            return _MISSING
+        return marshal.loads(entry[0])
+
+    def pending_paths(self) -> List[str]:
+        with self._cond:
+            return list(self._pending) + [p for p in self._in_flight if p not in self._pending]
+
+    def discard(self, path: str) -> None:
+        """
+        Verwirft einen noch nicht geschriebenen Stand, z. B. vor dem Löschen der Datei.
+        Läuft für path gerade ein Schreibvorgang, wird dessen Ende abgewartet.
+        """
+        with self._cond:
+            self._pending.pop(path, None)
+            while path in self._in_flight:
+                self._cond.wait()
+
+    def flush(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        Wartet, bis alle eingereihten Dokumente geschrieben sind.
+        Rückgabe: Pfade, deren Schreiben seit dem letzten flush() fehlgeschlagen ist.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._urgent = True
+            self._cond.notify_all()
+            while self._pending or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    logger.warning(f"Nicht alle Dateien rechtzeitig geschrieben ({len(self._pending)} ausstehend).")
+                    break
+                self._cond.wait(remaining)
+            failed = list(self._failed)
+            self._failed = {}
+        return failed
+
+    def stop(self, timeout: Optional[float] = None) -> List[str]:
+        """Schreibt alles Ausstehende und beendet den Thread."""
+        failed = self.flush(timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return failed
+
+    # --- Hintergrund-Thread ---
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopping:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                # kurz sammeln, damit schnell aufeinanderfolgende Saves zusammenfallen
+                deadline = time.monotonic() + self.delay
+                while not (self._urgent or self._stopping):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = []
+                while self._pending and len(batch) < self.max_batch:
+                    batch.append(self._pending.popitem(last=False))
+                self._in_flight = dict(batch)
+
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                logger.error(f"Fehler im Hintergrund-Schreiber: {e}")
+            finally:
+                with self._cond:
+                    self._in_flight = {}
+                    if not self._pending:
+                        self._urgent = False
+                    self._cond.notify_all()
+
+    def _write_batch(self, batch: List[Tuple[str, Tuple[bytes, Any]]]) -> None:
+        opened = []
+        for path, (blob, context) in batch:
+            tmp_path = path + ".tmp"
+            try:
+                data = marshal.loads(blob)
+                payload = self._encode(data)
+                f = open(tmp_path, "wb")
+                try:
+                    f.write(payload)
+                    f.flush()
+                except BaseException:
+                    f.close()
+                    raise
+                opened.append((path, tmp_path, f, data, context, len(payload)))
+            except Exception as e:
+                logger.error(f"Fehler beim Schreiben von {path}: {e}")
+                self._record_failure(path, e)
+                _remove_quietly(tmp_path)
+
+        written = []
+        dirs = set()
+        for path, tmp_path, f, data, context, size in opened:
+            try:
+                try:
+                    if self.fsync:
+                        os.fsync(f.fileno())
+                finally:
+                    f.close()
+                os.replace(tmp_path, path)
+                IO_STATS.add(files_written=1, bytes_written=size)
+                dirs.add(os.path.dirname(path))
+                written.append((path, data, context))
+            except Exception as e:
+                logger.error(f"Fehler beim Schreiben von {path}: {e}")
+                self._record_failure(path, e)
+                _remove_quietly(tmp_path)
+
+        if self.fsync:
+            for dir_path in dirs:
+                _fsync_dir(dir_path)
+
+        if self._on_written is not None:
+            for path, data, context in written:
+                try:
+                    self._on_written(path, data, context)
+                except Exception as e:
+                    logger.error(f"Fehler nach dem Schreiben von {path}: {e}")
+
+    def _record_failure(self, path: str, error: Exception) -> None:
+        with self._cond:
+            self._failed[path] = error
+
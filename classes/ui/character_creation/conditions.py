@@ -65,9 +65,8 @@ class CharacterCreationDialogConditions:
             return
 
         # Zustand speichern oder rekonstruieren
-        cond_list = DataManager.get_all_conditions()
-
-        saved_cond = next((c for c in cond_list if c.get("id") == dlg.condition_id), None)
+        saved = next(DataManager.iter_conditions(id=dlg.condition_id, limit=1), None)
+        saved_cond = saved["data"] if saved else None
         if not saved_cond:
             saved_cond = {
                 "id": dlg.condition_id,
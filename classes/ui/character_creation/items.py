@@ -167,14 +167,10 @@ class CharacterCreationDialogItems:
             "weapon_state": weapon_state,
         }
 
-        # 🗃️ Vorhandene Items laden
-        items_list = DataManager.get_all_items()
-
-        # Doppelte vermeiden
-        for existing in items_list:
-            if existing.get("name") == item_name:
-                QMessageBox.information(parent, "Hinweis", f"Item '{item_name}' existiert bereits in der Bibliothek.")
-                return
+        # Doppelte vermeiden (bricht beim ersten Treffer ab)
+        if next(DataManager.iter_items(name=item_name, limit=1), None):
+            QMessageBox.information(parent, "Hinweis", f"Item '{item_name}' existiert bereits in der Bibliothek.")
+            return
 
         try:
             DataManager.save_item(item_obj)
@@ -236,6 +232,7 @@ class CharacterCreationDialogItems:
         by_name = {it.get("name"): it for it in items_list if it.get("name")}
 
         changed = False
+        records = []
 
         for item_name, data in parent.item_groups.items():
             # UI-Felder auslesen, wenn vorhanden
@@ -272,9 +269,18 @@ class CharacterCreationDialogItems:
 
             if target:
                 target.update(record)
-                DataManager.save_item(target)
+                records.append(target)
             else:
-                DataManager.save_item(record)
+                records.append(record)
+
+        # alle Items in einem Durchgang schreiben
+        results = DataManager.save_many(DataManager.KIND_ITEM, records)
+        failed = [rec.get("name", "?") for rec, res in zip(records, results) if res["error"]]
+        if failed:
+            QMessageBox.warning(
+                parent, "Fehler",
+                "Folgende Items konnten nicht in die Bibliothek gespeichert werden:\n" + "\n".join(failed),
+            )
 
     # -----------------------------------------------------
     # 🧩 Item aus Bibliothek hinzufügen
@@ -6,16 +6,15 @@ import uuid
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QLabel, QPushButton, QVBoxLayout, QWidget,
     QDialog, QLineEdit, QComboBox, QFormLayout, QMessageBox, QGroupBox,
-    QInputDialog, QHBoxLayout, QFileDialog, QTextEdit, QCheckBox, QScrollArea, QSpinBox
+    QInputDialog, QHBoxLayout, QTextEdit, QCheckBox, QScrollArea, QSpinBox
 )
-from PyQt6.QtCore import Qt, QEvent, QTimer
-from PyQt6.QtGui import QPixmap
 
 ## eigene Funktionen
 from utils.functions.math import kaufmaennisch_runden
 ## eigene Klassen
 from classes.core.data_manager import DataManager
 from classes.core.character_builder import CharacterBuilder
+from classes.ui.image_selector_widget import ImageSelectorWidget
 
 from classes.ui.character_creation.base_stats_widget import BaseStatsWidget
 from classes.ui.character_creation.armor_widget import ArmorWidget
@@ -31,10 +30,7 @@ class CharacterCreationDialog(QDialog):
     def __init__(self, parent=None):
         self.loaded_file = None
         self.char_id = None          # UUID des Charakters
-        self._selected_image_source_path = None  # lokaler Pfad, den der User gewählt hat
-        self._current_image_filename = None  # Dateiname im Charakter-Ordner (aus geladenem Charakter)
-        self._portrait_original_pixmap = None  # Originalbild für dynamisches Resizing
-        self._portrait_last_target_size = None  # QSize, um unnötiges Rescaling zu vermeiden
+        self._current_image_filename = None  # "image_filename" des geladenen Charakters (Bildspeicher-Referenz oder Dateiname)
 
         super().__init__(parent)
         self.setWindowTitle("Neuen Charakter erstellen")
@@ -76,20 +72,13 @@ class CharacterCreationDialog(QDialog):
         # Charakterbild
         image_group = QGroupBox("Charakterbild")
         image_layout = QVBoxLayout()
-        self.portrait_label = QLabel("Kein Bild ausgewählt.")
-        self.portrait_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        # Etwas höhere Mindesthöhe, damit das Bild seltener „abgeschnitten“ wirkt
-        self.portrait_label.setMinimumHeight(220)
-        self.portrait_label.setStyleSheet("border: 1px solid gray;")
-        self.portrait_label.setWordWrap(True)
-        # Reagiere auf Größenänderungen des Labels (Layout/ScrollArea), nicht nur auf Dialog-Resize
-        self.portrait_label.installEventFilter(self)
-
-        self.select_image_button = QPushButton("Bild auswählen …")
-        self.select_image_button.clicked.connect(self.choose_character_image)
-
-        image_layout.addWidget(self.portrait_label)
-        image_layout.addWidget(self.select_image_button)
+        # Auswahl, Vorschau und Laden im Hintergrund übernimmt das gemeinsame Bild-Widget
+        self.image_widget = ImageSelectorWidget(
+            self,
+            placeholder_text="Kein Bild verfügbar.",
+            dialog_title="Charakterbild auswählen",
+        )
+        image_layout.addWidget(self.image_widget)
         image_group.setLayout(image_layout)
         main_layout.addWidget(image_group)
 
@@ -123,80 +112,6 @@ class CharacterCreationDialog(QDialog):
         main_layout.addStretch()
 
 
-    def _show_placeholder_image(self, text: str = "Kein Bild verfügbar."):
-        """Zeigt einen einfachen Platzhaltertext im Bildbereich."""
-        self._portrait_original_pixmap = None
-        self._portrait_last_target_size = None
-        self.portrait_label.setPixmap(QPixmap())
-        self.portrait_label.setText(text)
-
-    def _show_image_from_path(self, path: str):
-        """Lädt ein Bild von einem Pfad und zeigt es skaliert in der Vorschau an."""
-        pixmap = QPixmap(path)
-        if pixmap.isNull():
-            self._show_placeholder_image("Bild konnte nicht geladen werden.")
-            return
-        self._portrait_original_pixmap = pixmap
-        self._portrait_last_target_size = None
-        self.portrait_label.setText("")
-        # Layout kann nach dem Setzen noch nachziehen -> einmal sofort und einmal im nächsten Event-Loop
-        self._update_portrait_pixmap()
-        QTimer.singleShot(0, self._update_portrait_pixmap)
-
-    def _update_portrait_pixmap(self):
-        """
-        Skaliert das aktuell geladene Bild auf die Größe des Labels,
-        wobei das Seitenverhältnis erhalten bleibt und das komplette Bild sichtbar bleibt.
-        """
-        if not self._portrait_original_pixmap:
-            return
-
-        label_size = self.portrait_label.size()
-        if label_size.width() <= 0 or label_size.height() <= 0:
-            return
-
-        # Nur neu skalieren, wenn sich das Zielmaß geändert hat (Performance bei großen Bildern)
-        if self._portrait_last_target_size == label_size:
-            return
-        self._portrait_last_target_size = label_size
-
-        scaled = self._portrait_original_pixmap.scaled(
-            label_size,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        self.portrait_label.setPixmap(scaled)
-
-    def choose_character_image(self):
-        """Öffnet einen File-Chooser, um ein Charakterbild auszuwählen."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Charakterbild auswählen",
-            "",
-            "Bilder (*.png *.jpg *.jpeg *.webp)",
-        )
-        if not file_path:
-            return
-
-        self._selected_image_source_path = file_path
-        # Wenn ein neues Bild gewählt wird, überschreiben wir bewusst die alte Referenz
-        self._current_image_filename = None
-        self._show_image_from_path(file_path)
-
-    def resizeEvent(self, event):
-        """
-        Reagiere auf Größenänderungen des Dialogs und skaliere das Portrait neu,
-        sodass es immer vollständig im sichtbaren Bereich bleibt.
-        """
-        super().resizeEvent(event)
-        self._update_portrait_pixmap()
-
-    def eventFilter(self, obj, event):
-        # Wenn das Portrait-Label durch Layout/ScrollArea resized wird, neu skalieren
-        if obj is self.portrait_label and event.type() == QEvent.Type.Resize:
-            self._update_portrait_pixmap()
-        return super().eventFilter(obj, event)
-
     def _reload_players_into_combo(self, selected_player_id: str = None):
         """
         Lädt die Liste aller Spieler und befüllt die ComboBox.
@@ -411,13 +326,13 @@ class CharacterCreationDialog(QDialog):
         try:
             # Falls kein neues Bild ausgewählt wurde, aber ein Bild bereits existiert,
             # muss die Referenz in der JSON erhalten bleiben.
-            if not self._selected_image_source_path and self._current_image_filename:
+            if not self.image_widget.selected_source_path and self._current_image_filename:
                 character["image_filename"] = self._current_image_filename
 
             target_path = DataManager.save_character(
                 character,
                 file_path=target_path,
-                image_source_path=self._selected_image_source_path,
+                image_source_path=self.image_widget.selected_source_path,
             )
             # Das merken wir uns für zukünftige Saves in dieser Session
             self.loaded_file = target_path
@@ -443,22 +358,12 @@ class CharacterCreationDialog(QDialog):
         char_player_id = character.get("player_id")
         self._reload_players_into_combo(selected_player_id=char_player_id)
 
-        # Charakterbild laden (falls vorhanden)
-        image_filename = character.get("image_filename")
-        if image_filename:
-            char_dir = os.path.dirname(file_path)
-            image_path = os.path.join(char_dir, image_filename)
-            if os.path.exists(image_path):
-                self._show_image_from_path(image_path)
-                self._current_image_filename = image_filename
-                self._selected_image_source_path = None
-                # keine neue Quelle gesetzt -> vorhandenes Bild bleibt, solange der User nichts Neues auswählt
-            else:
-                self._show_placeholder_image("Bilddatei nicht gefunden.")
-                self._current_image_filename = None
-        else:
-            self._show_placeholder_image("Kein Bild verfügbar.")
-            self._current_image_filename = None
+        # Charakterbild laden (falls vorhanden); ohne neue Auswahl bleibt die Referenz beim Speichern erhalten
+        self._current_image_filename = character.get("image_filename")
+        self.image_widget.set_existing_image(
+            folder_path=os.path.dirname(file_path),
+            filename=self._current_image_filename,
+        )
 
         # Basisfelder via Component laden
         self.base_stats.load_data(character)
@@ -104,7 +104,7 @@ class CombatActionHandler:
         attacker_name = attacker["display_name"]
         target_name = target["display_name"]
 
-        # Access DataManager via main_dialog's helper if needed, or directly
+        # Charakterdaten aus dem Schnappschuss des Kampfes (kein Dateizugriff)
         char_data = self.main_dialog.load_character_data(attacker["source_char_id"])
         base_damage = char_data.get("base_damage", "1W6")
 
@@ -181,48 +181,43 @@ class CombatActionHandler:
         )
 
     def select_skill_dialog(self, actor):
-        char = self.main_dialog.load_character_data(actor["source_char_id"])
-        if not char:
+        manager = self.main_dialog.combat_manager
+        effective = manager.get_effective_values(actor["source_char_id"])
+        if not effective:
             QMessageBox.warning(self.main_dialog, "Fehler", "Charakterdaten konnten nicht geladen werden.")
             return None
 
         skill_names = []
-        for cat, skills in char.get("skills", {}).items():
+        for cat in effective["categories"]:
             skill_names.append(cat)
-            skill_names.extend(skills.keys())
+            skill_names.extend(
+                skill for skill in effective["skills"]
+                if manager.get_skill_category(actor["source_char_id"], skill) == cat
+            )
 
         choice, ok = QInputDialog.getItem(self.main_dialog, "Fertigkeit wählen", "Angriffs-Fertigkeit:", skill_names, 0, False)
         return choice if ok else None
 
     def perform_roll(self, actor, skill_name):
-        char = self.main_dialog.load_character_data(actor["source_char_id"])
-        if not char:
+        manager = self.main_dialog.combat_manager
+        # effektive Werte (inkl. missionsweiter Zustände) aus dem Schnappschuss des Kampfes
+        effective = manager.get_effective_values(actor["source_char_id"])
+        if not effective:
             QMessageBox.warning(self.main_dialog, "Fehler", f"Konnte Charakterdaten für {actor['display_name']} nicht laden.")
             return False, False
 
-        char.setdefault("skills", {})
-        char.setdefault("category_scores", {})
-        skills = char["skills"]
-
-        if skill_name in char["category_scores"]:
+        if skill_name in effective["categories"]:
             category = skill_name
-            skill_val = 0
-            category_val = char["category_scores"].get(category, 0)
+            is_skill = False
+            base_val = effective["categories"][category]
+        elif skill_name in effective["skills"]:
+            category = manager.get_skill_category(actor["source_char_id"], skill_name)
+            is_skill = True
+            # effektiver Fertigkeitswert enthält bereits den Kategoriewert
+            base_val = effective["skills"][skill_name]
         else:
-            category = None
-            for cat, skillset in skills.items():
-                if skill_name in skillset:
-                    category = cat
-                    break
-
-            if category is None:
-                QMessageBox.warning(self.main_dialog, "Fehler", f"Fertigkeit oder Kategorie '{skill_name}' nicht im Charakter gefunden.")
-                return False, False
-
-            skill_val = skills[category].get(skill_name, 0)
-            category_val = char["category_scores"].get(category, 0)
-
-        base_val = skill_val + category_val
+            QMessageBox.warning(self.main_dialog, "Fehler", f"Fertigkeit oder Kategorie '{skill_name}' nicht im Charakter gefunden.")
+            return False, False
 
         roll_str, ok = QInputDialog.getText(
             self.main_dialog,
@@ -252,7 +247,7 @@ class CombatActionHandler:
         # Roll-Wert für Anzeige normalisieren (0 → 100)
         display_roll = 100 if roll == 0 else roll
 
-        if skill_val > 0:
+        if is_skill:
             details = f"Wurf auf {skill_name} ({category})"
         else:
             details = f"Wurf auf Kategorie {category}"
@@ -118,7 +118,7 @@ class CombatSetupWidget(QWidget):
                 "unconscious": False, # Bewusstlos-Status
                 "dead": False,  # Neu: Tot-Status
             }
-            self.main_dialog.combat_manager.add_combatant(actor)
+            self.main_dialog.combat_manager.add_combatant(actor, chosen_char)
 
         # UI neu aufbauen auf dem main_dialog (oder via list widget)
         self.main_dialog.refresh_actor_list()
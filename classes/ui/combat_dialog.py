@@ -4,7 +4,6 @@ from PyQt6.QtWidgets import (
 
 from classes.ui.surprise_dialog import SurpriseDialog
 from classes.ui.initiative_dialog import InitiativeDialog
-from classes.core.data_manager import DataManager
 from classes.core.combat_manager import CombatManager
 
 # Neue Komponenten
@@ -48,6 +47,10 @@ class CombatDialog(QDialog):
         self.start_battle_button.clicked.connect(self.start_battle)
         middle_layout.addWidget(self.start_battle_button)
 
+        self.reload_characters_button = QPushButton("Charakterdaten neu laden")
+        self.reload_characters_button.clicked.connect(self.reload_character_data)
+        middle_layout.addWidget(self.reload_characters_button)
+
         top_layout.addLayout(middle_layout)
 
         # 3. Turn Widget (Rechts)
@@ -62,8 +65,13 @@ class CombatDialog(QDialog):
 
 
     def load_character_data(self, char_id):
-        """Hilfsfunktion: Lädt Charakterdaten über den DataManager anhand der ID."""
-        return DataManager.get_character_by_id(char_id)
+        """Hilfsfunktion: Charakterdaten aus dem Schnappschuss des Kampfes (kein Dateizugriff pro Wurf)."""
+        return self.combat_manager.get_character(char_id)
+
+    def reload_character_data(self):
+        """Übernimmt zwischenzeitlich gespeicherte Änderungen an den beteiligten Charakteren."""
+        count = self.combat_manager.reload_characters()
+        self.log_message(f"Charakterdaten neu geladen ({count}).")
 
     def log_message(self, text: str):
         """Delegiert an das Log-Widget."""
@@ -102,7 +110,11 @@ class CombatDialog(QDialog):
             QMessageBox.information(self, "Hinweis", "Keine Kämpfer im Kampf.")
             return
 
-        dlg = InitiativeDialog(self.combat_manager.battle_actors, self, surprised_ids=self.combat_manager.surprised_ids)
+        dlg = InitiativeDialog(
+            self.combat_manager.battle_actors, self,
+            surprised_ids=self.combat_manager.surprised_ids,
+            character_lookup=self.load_character_data,
+        )
         if dlg.exec():
             order = dlg.get_sorted_initiative()
             if order:
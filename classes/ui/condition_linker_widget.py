@@ -131,12 +131,10 @@ class ConditionLinkerWidget(QWidget):
 
         # Versuchen, den zuletzt gespeicherten Zustand zu verknüpfen
         try:
-            conditions = DataManager.get_all_conditions()
-            if conditions:
-                # Suche gezielt nach der ID, die wir vergeben haben
-                saved = next((c for c in conditions if c.get("id") == new_id), None)
-                if saved and new_id not in self.linked_conditions:
-                    self.linked_conditions.append(new_id)
+            # Suche gezielt nach der ID, die wir vergeben haben
+            saved = next(DataManager.iter_conditions(id=new_id, limit=1), None)
+            if saved and new_id not in self.linked_conditions:
+                self.linked_conditions.append(new_id)
         except Exception as e:
             QMessageBox.warning(self, "Fehler", f"Konnte neuen Zustand nicht verknüpfen:\n{e}")
 
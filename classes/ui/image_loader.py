@@ -0,0 +1,78 @@
+"""
+Dekodiert Bilder in einem Worker-Thread, damit Editor-Dialoge beim Öffnen nicht
+blockieren (große Scans können mehrere Hundert Millisekunden kosten).
+"""
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+
+from classes.ui.thumbnail_cache import ThumbnailCache
+
+
+class _LoadSignals(QObject):
+    # token, Bild, ist_original
+    finished = pyqtSignal(int, QImage, bool)
+
+
+class _LoadTask(QRunnable):
+    def __init__(self, token: int, path: str, edge: int, use_thumbnail: bool):
+        super().__init__()
+        self.token = token
+        self.path = path
+        self.edge = edge
+        self.use_thumbnail = use_thumbnail
+        self.cancelled = False
+        self.signals = _LoadSignals()
+
+    def run(self) -> None:
+        # bereits überholt, bevor der Thread frei wurde -> gar nicht erst dekodieren
+        if self.cancelled:
+            return
+        try:
+            image, is_full = ThumbnailCache.load_image(self.path, self.edge, self.use_thumbnail)
+        except Exception:
+            image, is_full = QImage(), True
+        if not self.cancelled:
+            self.signals.finished.emit(self.token, image, is_full)
+
+
+class AsyncImageLoader(QObject):
+    """
+    Lädt jeweils ein Bild im globalen QThreadPool und liefert es als QPixmap im
+    GUI-Thread. Ein neuer request() (oder cancel()) verwirft das vorherige
+    Ergebnis – schnelles Umschalten zwischen Entities zeigt nie ein veraltetes Bild.
+    """
+
+    # Pixmap, ist_original
+    loaded = pyqtSignal(QPixmap, bool)
+    failed = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._token = 0
+        self._task = None
+
+    def request(self, path: str, edge: int, use_thumbnail: bool = True) -> None:
+        self.cancel()
+        task = _LoadTask(self._token, path, edge, use_thumbnail)
+        task.signals.finished.connect(self._on_finished)
+        self._task = task
+        QThreadPool.globalInstance().start(task)
+
+    def cancel(self) -> None:
+        self._token += 1
+        if self._task is not None:
+            self._task.cancelled = True
+            self._task = None
+
+    def is_loading(self) -> bool:
+        return self._task is not None
+
+    def _on_finished(self, token: int, image: QImage, is_full: bool) -> None:
+        if token != self._token:
+            return
+        path = self._task.path if self._task is not None else ""
+        self._task = None
+        if image.isNull():
+            self.failed.emit(path)
+            return
+        self.loaded.emit(QPixmap.fromImage(image), is_full)
@@ -7,6 +7,9 @@ from PyQt6.QtCore import Qt, QEvent, QTimer
 from PyQt6.QtGui import QPixmap
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog
 
+from classes.core.data_manager import DataManager
+from classes.ui.image_loader import AsyncImageLoader
+
 
 class ImageSelectorWidget(QWidget):
     """
@@ -15,7 +18,7 @@ class ImageSelectorWidget(QWidget):
     - Vorschau (immer vollständig sichtbar, KeepAspectRatio)
     - Merkt sich:
       - selected_source_path (vom Client-PC)
-      - current_filename (Dateiname im Entity-Ordner, wenn aus gespeicherten Daten geladen)
+      - current_filename (Wert aus "image_filename": Bildspeicher-Referenz oder Dateiname im Entity-Ordner)
     """
 
     def __init__(
@@ -24,16 +27,27 @@ class ImageSelectorWidget(QWidget):
         *,
         placeholder_text: str = "Kein Bild verfügbar.",
         button_text: str = "Bild auswählen …",
+        dialog_title: str = "Bild auswählen",
         min_height: int = 220,
     ):
         super().__init__(parent)
 
         self.placeholder_text = placeholder_text
+        self.dialog_title = dialog_title
         self.selected_source_path: Optional[str] = None
         self.current_filename: Optional[str] = None
 
         self._original_pixmap: Optional[QPixmap] = None
         self._last_target_size = None
+        # Gespeichertes Bild wird als Vorschaubild geladen; Original nur bei Bedarf
+        self._image_path: Optional[str] = None
+        self._is_full_image = True
+        # Dekodieren im Hintergrund; ein neuer Auftrag verwirft den vorherigen
+        self._loader = AsyncImageLoader(self)
+        self._loader.loaded.connect(self._on_image_loaded)
+        self._loader.failed.connect(self._on_image_failed)
+        self._loading_path: Optional[str] = None
+        self._upgrading = False
 
         layout = QVBoxLayout(self)
 
@@ -51,18 +65,46 @@ class ImageSelectorWidget(QWidget):
         layout.addWidget(self.select_button)
 
     def _set_placeholder(self, text: Optional[str] = None) -> None:
+        self._loader.cancel()
+        self._loading_path = None
+        self._upgrading = False
         self._original_pixmap = None
+        self._image_path = None
         self._last_target_size = None
         self.preview_label.setPixmap(QPixmap())
         self.preview_label.setText(text or self.placeholder_text)
 
-    def _set_pixmap(self, pixmap: QPixmap) -> None:
+    def _target_edge(self) -> int:
+        size = self.preview_label.size()
+        edge = max(size.width(), size.height(), self.preview_label.minimumHeight())
+        return int(edge * self.devicePixelRatioF())
+
+    def _set_image_file(self, image_path: str, use_thumbnail: bool = True) -> None:
+        """Lädt ein Bild im Hintergrund; bis dahin wird ein Platzhalter angezeigt."""
+        self._set_placeholder("Bild wird geladen …")
+        self._loading_path = image_path
+        self._loader.request(image_path, self._target_edge(), use_thumbnail)
+
+    def _on_image_loaded(self, pixmap: QPixmap, is_full: bool) -> None:
         self._original_pixmap = pixmap
+        self._image_path = self._loading_path
+        self._is_full_image = is_full
+        self._loading_path = None
+        self._upgrading = False
         self._last_target_size = None
         self.preview_label.setText("")
         self._update_scaled_pixmap()
         QTimer.singleShot(0, self._update_scaled_pixmap)
 
+    def _on_image_failed(self, _path: str) -> None:
+        if self._upgrading:
+            # größere Variante nicht lesbar -> beim bisherigen Vorschaubild bleiben
+            self._upgrading = False
+            self._loading_path = None
+            self._is_full_image = True
+            return
+        self._set_placeholder("Bild konnte nicht geladen werden.")
+
     def _update_scaled_pixmap(self) -> None:
         if not self._original_pixmap:
             return
@@ -72,6 +114,19 @@ class ImageSelectorWidget(QWidget):
         if self._last_target_size == size:
             return
         self._last_target_size = size
+
+        # Vorschaufläche größer als das geladene Vorschaubild -> größeres bzw. Original nachladen
+        edge = self._target_edge()
+        if (
+            self._image_path
+            and not self._is_full_image
+            and edge > max(self._original_pixmap.width(), self._original_pixmap.height())
+        ):
+            # bis zum Eintreffen wird das bisherige Vorschaubild hochskaliert angezeigt
+            self._upgrading = True
+            self._loading_path = self._image_path
+            self._loader.request(self._image_path, edge)
+
         scaled = self._original_pixmap.scaled(
             size,
             Qt.AspectRatioMode.KeepAspectRatio,
@@ -82,7 +137,7 @@ class ImageSelectorWidget(QWidget):
     def choose_image(self) -> None:
         file_path, _ = QFileDialog.getOpenFileName(
             self,
-            "Bild auswählen",
+            self.dialog_title,
             "",
             "Bilder (*.png *.jpg *.jpeg *.webp)",
         )
@@ -92,15 +147,12 @@ class ImageSelectorWidget(QWidget):
         self.selected_source_path = file_path
         self.current_filename = None  # bewusst überschreiben
 
-        pixmap = QPixmap(file_path)
-        if pixmap.isNull():
-            self._set_placeholder("Bild konnte nicht geladen werden.")
-            return
-        self._set_pixmap(pixmap)
+        # Original vom Client-PC: ohne Vorschaubild-Cache, aber ebenfalls im Hintergrund
+        self._set_image_file(file_path, use_thumbnail=False)
 
     def set_existing_image(self, *, folder_path: str, filename: Optional[str]) -> None:
         """
-        Lädt ein bestehendes Bild aus einem Entity-Ordner (z. B. beim Laden eines Items).
+        Lädt ein bestehendes Bild (Bildspeicher oder Entity-Ordner, z. B. beim Laden eines Items).
         """
         self.selected_source_path = None
         self.current_filename = filename
@@ -109,17 +161,12 @@ class ImageSelectorWidget(QWidget):
             self._set_placeholder()
             return
 
-        image_path = os.path.join(folder_path, filename)
-        if not os.path.exists(image_path):
+        image_path = DataManager.resolve_image_path(folder_path, filename)
+        if not image_path or not os.path.exists(image_path):
             self._set_placeholder("Bilddatei nicht gefunden.")
             return
 
-        pixmap = QPixmap(image_path)
-        if pixmap.isNull():
-            self._set_placeholder("Bild konnte nicht geladen werden.")
-            return
-
-        self._set_pixmap(pixmap)
+        self._set_image_file(image_path)
 
     def clear(self) -> None:
         """Entfernt Auswahl/Referenz und zeigt Platzhalter."""
@@ -9,13 +9,15 @@ from classes.core.data_manager import DataManager
 
 
 class InitiativeDialog(QDialog):
-    def __init__(self, battle_actors, parent=None, surprised_ids=None):
+    def __init__(self, battle_actors, parent=None, surprised_ids=None, character_lookup=None):
         super().__init__(parent)
         self.setWindowTitle("Initiative bestimmen")
         self.setGeometry(300, 200, 600, 500)
 
         self.battle_actors = battle_actors  # aus CombatDialog
         self.surprised_ids = surprised_ids or set()
+        # char_id -> Charakterdaten (im Kampf: Schnappschuss des CombatManagers)
+        self.character_lookup = character_lookup or DataManager.get_character_by_id
         self.initiatives = {}  # instance_id → total_initiative
 
         layout = QVBoxLayout(self)
@@ -163,7 +165,7 @@ class InitiativeDialog(QDialog):
 
     def get_handeln_value(self, char_id):
         """Lädt den Charakter und berechnet den aktuellen Handeln-Wert"""
-        char_file = DataManager.get_character_by_id(char_id)
+        char_file = self.character_lookup(char_id)
         if not char_file:
             return 0
 
@@ -178,7 +180,7 @@ class InitiativeDialog(QDialog):
 
     def get_character_role(self, char_id):
         """Liest aus dem gespeicherten Charakter, ob es ein PC oder NSC ist"""
-        char_data = DataManager.get_character_by_id(char_id)
+        char_data = self.character_lookup(char_id)
         if char_data:
             return char_data.get("role", "npc")
         return "npc"
@@ -38,10 +38,9 @@ class SurpriseDialog(QDialog):
             def make_handler(tn=team_name):
                 def handler(state):
                     checked = state == Qt.CheckState.Checked.value
-                    for aid, cb in self.checkboxes.items():
-                        for a in self.battle_actors:
-                            if a["instance_id"] == aid and a["team"] == tn:
-                                cb.setChecked(checked)
+                    for a in self.battle_actors:
+                        if a["team"] == tn:
+                            self.checkboxes[a["instance_id"]].setChecked(checked)
                 return handler
 
             team_cb.stateChanged.connect(make_handler())
@@ -0,0 +1,122 @@
+"""
+Vorskalierte Vorschaubilder für Portraits und Entity-Bilder.
+
+Editoren laden statt des Originals ein kleines Vorschaubild in einer von wenigen
+festen Größen; das Original wird nur dekodiert, wenn die Vorschaufläche größer ist
+als das größte Vorschaubild.
+"""
+import os
+import glob
+import hashlib
+import logging
+import threading
+from typing import Optional, Tuple
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImage, QImageReader, QPixmap
+
+from classes.core.data_manager import DataManager
+
+logger = logging.getLogger(__name__)
+
+
+class ThumbnailCache:
+    """
+    Vorschaubilder liegen unter data/.cache/thumbnails. Der Dateiname enthält einen Hash
+    aus Quellpfad, mtime und Größe der Quelle – ändert sich das Original, wird
+    automatisch ein neues Vorschaubild erzeugt und das veraltete entfernt.
+    """
+
+    # längste Kante in Pixeln
+    SIZES = (128, 256, 512)
+    SUBDIR = "thumbnails"
+
+    @classmethod
+    def cache_dir(cls) -> str:
+        return os.path.join(DataManager.CACHE_DIR, cls.SUBDIR)
+
+    @classmethod
+    def bucket_for(cls, edge: int) -> Optional[int]:
+        """Kleinste feste Größe, die edge abdeckt (None: größer als alle Vorschaubilder)."""
+        for size in cls.SIZES:
+            if edge <= size:
+                return size
+        return None
+
+    @classmethod
+    def thumbnail_path(cls, source_path: str, size: int) -> Optional[str]:
+        """
+        Pfad des Vorschaubilds für source_path in der Größe size (wird bei Bedarf erzeugt).
+        None, wenn das Original ohnehin nicht größer ist oder nicht gelesen werden kann.
+        """
+        st = os.stat(source_path)
+        path_key = hashlib.sha1(os.path.abspath(source_path).encode("utf-8")).hexdigest()[:16]
+        sig_key = hashlib.sha1(f"{st.st_mtime_ns}:{st.st_size}".encode("ascii")).hexdigest()[:8]
+        thumb_path = os.path.join(cls.cache_dir(), f"{path_key}-{sig_key}-{size}.png")
+        if os.path.exists(thumb_path):
+            return thumb_path
+
+        reader = QImageReader(source_path)
+        reader.setAutoTransform(True)
+        source_size = reader.size()
+        if not source_size.isValid() or max(source_size.width(), source_size.height()) <= size:
+            return None
+        # direkt verkleinert dekodieren (bei JPEG deutlich schneller als erst voll zu laden)
+        reader.setScaledSize(source_size.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio))
+        image = reader.read()
+        if image.isNull():
+            logger.warning(f"Vorschaubild für {source_path} konnte nicht erzeugt werden: {reader.errorString()}")
+            return None
+
+        os.makedirs(cls.cache_dir(), exist_ok=True)
+        # eindeutiger Name: mehrere Worker können dasselbe Vorschaubild gleichzeitig erzeugen
+        tmp_path = f"{thumb_path}.{threading.get_ident()}.tmp"
+        if not image.save(tmp_path, "PNG"):
+            return None
+        os.replace(tmp_path, thumb_path)
+
+        # Vorschaubilder älterer Stände derselben Quelle entfernen
+        for stale in glob.glob(os.path.join(cls.cache_dir(), f"{path_key}-*-{size}.png")):
+            if stale != thumb_path:
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+        return thumb_path
+
+    @classmethod
+    def load_image(cls, source_path: str, edge: int, use_thumbnail: bool = True) -> Tuple[QImage, bool]:
+        """
+        Dekodiert ein Bild, dessen längste Kante mindestens edge Pixel abdeckt – aus dem
+        Vorschaubild-Cache, sonst das Original. Nutzt nur QImage und darf daher auch in
+        einem Worker-Thread laufen. Rückgabe: (Bild, ist_original).
+        """
+        bucket = cls.bucket_for(edge) if use_thumbnail else None
+        if bucket is not None:
+            try:
+                thumb_path = cls.thumbnail_path(source_path, bucket)
+            except Exception as e:
+                logger.warning(f"Vorschaubild für {source_path} nicht verfügbar: {e}")
+                thumb_path = None
+            if thumb_path:
+                image = QImage(thumb_path)
+                if not image.isNull():
+                    return image, False
+        reader = QImageReader(source_path)
+        reader.setAutoTransform(True)
+        return reader.read(), True
+
+    @classmethod
+    def load_pixmap(cls, source_path: str, edge: int) -> Tuple[QPixmap, bool]:
+        """Wie load_image, aber als QPixmap (nur im GUI-Thread verwenden)."""
+        image, is_full = cls.load_image(source_path, edge)
+        return QPixmap.fromImage(image), is_full
+
+    @classmethod
+    def clear(cls) -> None:
+        """Verwirft alle Vorschaubilder (werden bei Bedarf neu erzeugt)."""
+        for path in glob.glob(os.path.join(cls.cache_dir(), "*.png")):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
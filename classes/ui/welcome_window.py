@@ -6,9 +6,10 @@ import uuid
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QLabel, QPushButton, QVBoxLayout, QWidget,
     QDialog, QLineEdit, QComboBox, QFormLayout, QMessageBox, QGroupBox,
-    QInputDialog, QHBoxLayout, QFileDialog, QTextEdit, QCheckBox, QScrollArea
+    QInputDialog, QHBoxLayout, QFileDialog, QTextEdit, QCheckBox, QScrollArea,
+    QListWidget, QListWidgetItem
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 
 ## eigene Klassen
 ### Untermenüs (einzelne Buttons)
@@ -46,6 +47,15 @@ class WelcomeWindow(QMainWindow):
     ]
     # Titel des Fensters in der UI
     WINDOW_TITLE = "How To Be A Hero Charakterverwaltung"
+    # Wartezeit nach dem letzten Tastendruck, bevor gesucht wird (ms)
+    SEARCH_DELAY_MS = 200
+    # Beschriftung der Entity-Typen in der Trefferliste
+    SEARCH_KIND_LABELS = {
+        DataManager.KIND_CHARACTER: "Charakter",
+        DataManager.KIND_ITEM: "Item",
+        DataManager.KIND_CONDITION: "Zustand",
+        DataManager.KIND_QUEST: "Quest",
+    }
 
     ## METHODEN ZUM DARSTELLEN DAS HAUPTMENÜS
     def __init__(self):
@@ -69,6 +79,7 @@ class WelcomeWindow(QMainWindow):
         self.setCentralWidget(central_widget)
         layout = QVBoxLayout(central_widget)
         self._add_header_labels(layout)
+        self._add_search_box(layout)
         self._add_configured_buttons(layout)
         layout.addStretch()
     def _add_header_labels(self, layout: QVBoxLayout) -> None:
@@ -84,6 +95,85 @@ class WelcomeWindow(QMainWindow):
         subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(subtitle_label)
 
+    def _add_search_box(self, layout: QVBoxLayout) -> None:
+        """Fügt das Suchfeld samt Trefferliste (Volltextsuche über DataManager.search) hinzu."""
+        self.search_input = QLineEdit(self)
+        self.search_input.setPlaceholderText("Suchen in Charakteren, Items, Zuständen und Quests …")
+        self.search_input.setClearButtonEnabled(True)
+        layout.addWidget(self.search_input)
+
+        self.search_results = QListWidget(self)
+        self.search_results.setMaximumHeight(180)
+        self.search_results.hide()
+        self.search_results.itemActivated.connect(self._open_search_result)
+        layout.addWidget(self.search_results)
+
+        # erst nach einer kurzen Tipppause suchen
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._run_search)
+        self.search_input.textChanged.connect(self._search_timer.start)
+        self.search_input.returnPressed.connect(self._run_search)
+
+    def _run_search(self) -> None:
+        self._search_timer.stop()
+        text = self.search_input.text().strip()
+        self.search_results.clear()
+        if not text:
+            self.search_results.hide()
+            return
+
+        results = DataManager.search(text)
+        if not results:
+            placeholder = QListWidgetItem("Keine Treffer.")
+            placeholder.setFlags(Qt.ItemFlag.NoItemFlags)
+            self.search_results.addItem(placeholder)
+        for result in results:
+            label = self.SEARCH_KIND_LABELS.get(result["kind"], result["kind"])
+            item = QListWidgetItem(f"{label}: {result['display']}")
+            item.setData(Qt.ItemDataRole.UserRole, result)
+            self.search_results.addItem(item)
+        self.search_results.show()
+
+    def _open_search_result(self, item: QListWidgetItem) -> None:
+        """Öffnet den Treffer im passenden Editor."""
+        result = item.data(Qt.ItemDataRole.UserRole)
+        if not result:
+            return
+        data = self._load_chosen_entity(result)
+        if data is None:
+            return
+
+        kind = result["kind"]
+        if kind == DataManager.KIND_CHARACTER:
+            dialog = CharacterCreationDialog(self)
+            dialog.load_character_data(data, result["path"])
+        elif kind == DataManager.KIND_ITEM:
+            dialog = ItemEditorDialog(self)
+            dialog.load_item_data(data, result["path"])
+        elif kind == DataManager.KIND_CONDITION:
+            skill_targets, cat_targets, insp_targets = self._collect_all_condition_targets_from_all_characters()
+            dialog = ConditionEditorDialog(
+                parent=self,
+                available_skill_targets=skill_targets,
+                available_category_targets=cat_targets,
+                available_inspiration_targets=insp_targets
+            )
+            dialog.load_condition_data(data, result["path"])
+        elif kind == DataManager.KIND_QUEST:
+            dialog = QuestEditorDialog(
+                self,
+                campaign_id=str(data.get("campaign_id")),
+                quest_data=data,
+                file_path=result["path"],
+            )
+        else:
+            return
+        dialog.exec()
+        # Änderungen im Editor sollen in der Trefferliste sichtbar werden
+        self._run_search()
+
     def _add_configured_buttons(self, layout: QVBoxLayout) -> None:
         """Erstellt und fügt alle Buttons basierend auf BUTTON_CONFIG hinzu."""
         for button_text, callback_name in self.BUTTON_CONFIG:
@@ -140,6 +230,16 @@ class WelcomeWindow(QMainWindow):
 
         return skill_targets, category_targets, inspiration_targets
 
+    def _load_chosen_entity(self, entry):
+        """
+        Lädt das vollständige Dokument zu einem Listeneintrag aus DataManager.get_summaries().
+        Zeigt eine Fehlermeldung und liefert None, falls die Datei nicht (mehr) lesbar ist.
+        """
+        data = DataManager.load_entity_data(entry["path"])
+        if data is None:
+            QMessageBox.warning(self, "Fehler", f"Datei konnte nicht geladen werden:\n{entry['path']}")
+        return data
+
     ## METHODEN ZUM AUFRUF DER MENÜS HINTER EINEM BUTTON
     def start_combat(self):
         dlg = CombatDialog(self)
@@ -267,7 +367,7 @@ class WelcomeWindow(QMainWindow):
 
     def load_player(self):
         """Lädt alle Spieler aus dem data/players/ Ordner, lässt den Nutzer einen wählen und öffnet ihn im Editor."""
-        players_list = DataManager.get_all_players()
+        players_list = DataManager.get_summaries(DataManager.KIND_PLAYER)
         if not players_list:
             QMessageBox.information(
                 self,
@@ -290,13 +390,17 @@ class WelcomeWindow(QMainWindow):
 
         chosen_index = player_names.index(choice)
         chosen_player = players_list[chosen_index]
+        # Vollständiges Dokument erst jetzt laden (Liste enthält nur Kopfdaten)
+        player_data = self._load_chosen_entity(chosen_player)
+        if player_data is None:
+            return
 
         dlg = PlayerEditorDialog(self)
-        dlg.load_player_data(chosen_player["data"], chosen_player["path"])
+        dlg.load_player_data(player_data, chosen_player["path"])
         dlg.exec()
 
     def load_character(self):
-        candidates = DataManager.get_all_characters()
+        candidates = DataManager.get_summaries(DataManager.KIND_CHARACTER)
         if not candidates:
             QMessageBox.information(self, "Hinweis", "Es wurden noch keine Charaktere gespeichert oder sie konnten nicht geladen werden.")
             return
@@ -317,7 +421,10 @@ class WelcomeWindow(QMainWindow):
 
         idx = display_names.index(choice)
         chosen = candidates[idx]
-        chosen_display, chosen_path, chosen_data = chosen["display"], chosen["path"], chosen["data"]
+        chosen_path = chosen["path"]
+        chosen_data = self._load_chosen_entity(chosen)
+        if chosen_data is None:
+            return
 
         # Dialog öffnen und Daten rein
         dialog = CharacterCreationDialog(self)
@@ -338,7 +445,7 @@ class WelcomeWindow(QMainWindow):
 
     def load_item(self):
         """Lädt alle Items aus dem data/items/ Ordner, lässt den Nutzer eines auswählen und öffnet es im Editor."""
-        items_list = DataManager.get_all_items_meta()
+        items_list = DataManager.get_summaries(DataManager.KIND_ITEM)
         if not items_list:
             QMessageBox.information(self, "Hinweis", "Es wurden noch keine Items gespeichert oder sie konnten nicht geladen werden.")
             return
@@ -358,10 +465,13 @@ class WelcomeWindow(QMainWindow):
 
         chosen_index = item_names.index(choice)
         chosen_item = items_list[chosen_index]
+        item_data = self._load_chosen_entity(chosen_item)
+        if item_data is None:
+            return
 
         # Editor öffnen und Item laden
         dlg = ItemEditorDialog(self)
-        dlg.load_item_data(chosen_item["data"], chosen_item["path"])
+        dlg.load_item_data(item_data, chosen_item["path"])
         dlg.exec()
 
     def create_new_condition(self):
@@ -382,7 +492,7 @@ class WelcomeWindow(QMainWindow):
 
     def load_condition(self):
         """Lädt alle Zustände aus dem data/conditions/ Ordner, lässt den Nutzer einen wählen und öffnet ihn im Editor."""
-        conditions_list = DataManager.get_all_conditions_meta()
+        conditions_list = DataManager.get_summaries(DataManager.KIND_CONDITION)
         if not conditions_list:
             QMessageBox.information(self, "Hinweis", "Es wurden noch keine Zustände gespeichert oder sie konnten nicht geladen werden.")
             return
@@ -403,6 +513,9 @@ class WelcomeWindow(QMainWindow):
 
         chosen_index = cond_choices.index(choice)
         chosen_condition = conditions_list[chosen_index]
+        condition_data = self._load_chosen_entity(chosen_condition)
+        if condition_data is None:
+            return
 
         # Ziele für den ConditionEditorDialog sammeln
         skill_targets, cat_targets, insp_targets = self._collect_all_condition_targets_from_all_characters()
@@ -413,5 +526,5 @@ class WelcomeWindow(QMainWindow):
             available_category_targets=cat_targets,
             available_inspiration_targets=insp_targets
         )
-        dlg.load_condition_data(chosen_condition["data"], chosen_condition["path"])
+        dlg.load_condition_data(condition_data, chosen_condition["path"])
         dlg.exec()
\ No newline at end of file
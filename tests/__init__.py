@@ -0,0 +1,29 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from classes.core.data_manager import DataManager
+
+
+class DataDirTestCase(unittest.TestCase):
+    """
+    Basisklasse für Tests gegen den DataManager: jeder Test bekommt einen frischen
+    Datenordner unter self.tmp, danach wird der ursprüngliche wiederhergestellt.
+    """
+
+    def setUp(self):
+        self.original_data_dir = DataManager.DATA_DIR
+        self.tmp = tempfile.mkdtemp()
+        DataManager.set_data_dir(os.path.join(self.tmp, "data"))
+
+    def tearDown(self):
+        DataManager.set_data_dir(self.original_data_dir)
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def write_file(self, name: str, content: bytes) -> str:
+        """Legt eine Datei (z. B. ein Bild) in self.tmp an und liefert ihren Pfad."""
+        path = os.path.join(self.tmp, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
@@ -0,0 +1,51 @@
+import os
+import unittest
+
+from classes.core.data_manager import DataManager
+from tests import DataDirTestCase
+
+
+class CampaignBundleTest(DataDirTestCase):
+    """Kampagnen-Paket: Export und Lesen ohne Entpacken (user-013)."""
+
+    def setUp(self):
+        super().setUp()
+        self.portrait = self.write_file("portrait.png", b"\x89PNG-portrait")
+        DataManager.save_campaign({"id": "camp-1", "title": "Alpha", "type": "Sandbox"})
+        DataManager.save_quest({"id": "q1", "campaign_id": "camp-1", "title": "Der Bunker"})
+        DataManager.save_character(
+            {"id": "c1", "name": "Maya", "age": 30, "campaign_id": "camp-1"}, image_source_path=self.portrait
+        )
+        DataManager.save_character({"id": "c2", "name": "Bert", "age": 20, "campaign_id": "camp-1"})
+        # gehört nicht zur Kampagne
+        DataManager.save_character({"id": "c3", "name": "Fremd", "age": 50})
+
+    def test_export_and_read(self):
+        path = DataManager.export_campaign_bundle("camp-1", os.path.join(self.tmp, "alpha.pnpbundle"))
+
+        with DataManager.open_campaign_bundle(path) as bundle:
+            self.assertEqual(bundle.campaign_id, "camp-1")
+            self.assertEqual(bundle.get("camp-1")["title"], "Alpha")
+            self.assertEqual(sorted(bundle.ids(DataManager.KIND_CHARACTER)), ["c1", "c2"])
+            self.assertEqual([q["title"] for q in bundle.get_all(DataManager.KIND_QUEST)], ["Der Bunker"])
+            self.assertIsNone(bundle.get("c3"))
+            self.assertEqual(bundle.read_image("c1"), b"\x89PNG-portrait")
+            self.assertIsNone(bundle.read_image("c2"))
+
+    def test_default_path_and_unknown_campaign(self):
+        path = DataManager.export_campaign_bundle("camp-1")
+
+        self.assertEqual(path, os.path.join(DataManager.BUNDLES_DIR, "Alpha - camp-1" + DataManager.BUNDLE_SUFFIX))
+        self.assertTrue(os.path.isfile(path))
+        with self.assertRaises(ValueError):
+            DataManager.export_campaign_bundle("gibt-es-nicht")
+
+    def test_rejects_foreign_file(self):
+        path = self.write_file("kein.pnpbundle", b"NOTABUNDLE" + b"\0" * 16)
+
+        with self.assertRaises(ValueError):
+            DataManager.open_campaign_bundle(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import unittest
+
+from classes.core.data_manager import DataManager
+from tests import DataDirTestCase
+
+
+class CampaignRenameTest(DataDirTestCase):
+    """Kampagnenordner nach dem Umbenennen (Quests und Charaktere ziehen mit um)."""
+
+    def _campaign_with_quest(self, title: str):
+        campaign = {"id": "camp-1", "title": title, "type": "Sandbox"}
+        path = DataManager.save_campaign(campaign)
+        DataManager.save_quest({"campaign_id": "camp-1", "title": "Bunker", "status": "offen"})
+        DataManager.save_character({"id": "char-1", "name": "Maya", "age": 30, "campaign_id": "camp-1"})
+        return campaign, path
+
+    def _assert_single_campaign(self):
+        folders = sorted(os.listdir(DataManager.CAMPAIGNS_DIR))
+        self.assertEqual(folders, ["Alpha - camp-1"])
+        self.assertEqual([q["data"]["title"] for q in DataManager.get_all_quests_meta("camp-1")], ["Bunker"])
+        self.assertEqual([c["data"]["title"] for c in DataManager.get_all_campaigns()], ["Alpha"])
+        self.assertEqual(DataManager.get_character_by_id("char-1")["name"], "Maya")
+
+    def test_rename_to_earlier_title(self):
+        campaign, path = self._campaign_with_quest("Zeta")
+        campaign["title"] = "Alpha"
+        DataManager.save_campaign(campaign, file_path=path)
+
+        self._assert_single_campaign()
+        DataManager.reset_state()
+        self._assert_single_campaign()
+
+    def test_rename_without_file_path(self):
+        campaign, _ = self._campaign_with_quest("Zeta")
+        campaign["title"] = "Alpha"
+        DataManager.save_campaign(campaign)
+
+        self._assert_single_campaign()
+
+    def test_rename_with_write_behind(self):
+        DataManager.enable_write_behind(delay=0.5, fsync=False)
+        try:
+            campaign, path = self._campaign_with_quest("Zeta")
+            campaign["title"] = "Alpha"
+            DataManager.save_campaign(campaign, file_path=path)
+            DataManager.flush()
+        finally:
+            DataManager.disable_write_behind()
+
+        self._assert_single_campaign()
+
+    def test_duplicate_folders_prefer_the_one_with_quests(self):
+        self._campaign_with_quest("Zeta")
+        # zweiter, leerer Ordner mit derselben ID, alphabetisch vorne
+        os.makedirs(os.path.join(DataManager.CAMPAIGNS_DIR, "Alpha - camp-1"))
+        DataManager.reset_state()
+
+        self.assertEqual(
+            os.path.basename(DataManager._find_campaign_base_dir("camp-1")), "Zeta - camp-1"
+        )
+        self.assertEqual(len(DataManager.get_all_quests_meta("camp-1")), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import tempfile
+import time
+import unittest
+
+from classes.core.change_journal import OP_DELETE, OP_SAVE, ChangeJournal, apply_diff, diff
+from classes.core.data_manager import DataManager
+from tests import DataDirTestCase
+
+
+class ChangeJournalTest(unittest.TestCase):
+    """Append-only Änderungsprotokoll (user-021)."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.journal_file = os.path.join(tmp.name, ".journal", "changes.jsonl")
+        self.journal = ChangeJournal(self.journal_file)
+        self.addCleanup(self.journal.close)
+
+    def test_diff_roundtrip(self):
+        old = {"name": "A", "hp": 10, "tmp": True}
+        new = {"name": "A", "hp": 7, "xp": 3}
+        changes = diff(old, new)
+
+        self.assertEqual(changes, {"set": {"hp": 7, "xp": 3}, "unset": ["tmp"]})
+        self.assertEqual(apply_diff(old, changes), new)
+
+    def test_first_save_is_snapshot_then_diffs(self):
+        self.journal.record_save("item", "i1", "items/a.json", {"name": "A", "hp": 10})
+        self.journal.record_save("item", "i1", "items/a.json", {"name": "A", "hp": 7})
+        # unveränderter Stand erzeugt keinen Eintrag
+        self.journal.record_save("item", "i1", "items/a.json", {"name": "A", "hp": 7})
+
+        records = list(self.journal.read())
+        self.assertEqual([r["seq"] for r in records], [1, 2])
+        self.assertEqual(records[0]["snapshot"], {"name": "A", "hp": 10})
+        self.assertEqual(records[1]["diff"], {"set": {"hp": 7}})
+        self.assertEqual([r["seq"] for r in self.journal.read(since_seq=1)], [2])
+
+    def test_caller_may_mutate_saved_dict(self):
+        data = {"name": "A", "tags": ["x"]}
+        self.journal.record_save("item", "i1", "items/a.json", data)
+        data["tags"].append("y")
+
+        self.assertEqual(self.journal.state_at("i1"), {"name": "A", "tags": ["x"]})
+
+    def test_state_at_and_delete(self):
+        self.journal.record_save("item", "i1", "items/a.json", {"hp": 10})
+        first_ts = list(self.journal.read())[0]["ts"]
+        time.sleep(0.01)
+        self.journal.record_save("item", "i1", "items/a.json", {"hp": 5})
+        self.journal.record_delete("item", "i1", "items/a.json")
+
+        self.assertEqual(self.journal.state_at("i1", first_ts), {"hp": 10})
+        self.assertIsNone(self.journal.state_at("i1"))
+        self.assertEqual([h["op"] for h in self.journal.history("i1")], [OP_SAVE, OP_SAVE, OP_DELETE])
+
+    def test_seq_continues_after_reopen_and_truncated_line(self):
+        self.journal.record_save("item", "i1", "items/a.json", {"hp": 10})
+        self.journal.record_save("item", "i2", "items/b.json", {"hp": 3})
+        self.journal.close()
+        with open(self.journal_file, "ab") as f:
+            f.write(b'{"seq": 3, "ts": 1')
+
+        reopened = ChangeJournal(self.journal_file)
+        self.addCleanup(reopened.close)
+        self.assertEqual(reopened.record_delete("item", "i2"), 3)
+        self.assertEqual([r["seq"] for r in reopened.read()], [1, 2, 3])
+
+    def test_compact_folds_old_entries(self):
+        self.journal.record_save("item", "i1", "items/a.json", {"hp": 10})
+        self.journal.record_save("item", "i1", "items/a.json", {"hp": 5})
+        self.journal.record_save("item", "i2", "items/b.json", {"hp": 1})
+        self.journal.record_delete("item", "i2")
+
+        self.assertEqual(self.journal.compact(before=time.time() + 1), 1)
+        records = list(self.journal.read())
+        self.assertEqual(records[0]["snapshot"], {"hp": 5})
+        self.assertEqual(records[0]["seq"], 2)
+        # seq läuft nach dem Verdichten weiter
+        self.assertEqual(self.journal.record_save("item", "i3", "items/c.json", {"hp": 2}), 5)
+
+
+class DataManagerJournalTest(DataDirTestCase):
+    """Speichern und Löschen schreiben ins Änderungsprotokoll."""
+
+    def test_save_and_delete_are_recorded(self):
+        DataManager.save_item({"id": "i1", "name": "Fackel"})
+        DataManager.save_item({"id": "i1", "name": "Fackel", "description": "hell"},
+                              file_path=os.path.join(DataManager.ITEMS_DIR, "Fackel - i1", "Fackel - i1.json"))
+        # ts hat Millisekunden-Auflösung
+        time.sleep(0.01)
+        DataManager.delete_item("i1")
+
+        records = [r for r in DataManager.read_journal() if r["id"] == "i1"]
+        self.assertEqual([r["op"] for r in records], [OP_SAVE, OP_SAVE, OP_DELETE])
+        self.assertEqual(records[0]["path"], os.path.join("items", "Fackel - i1", "Fackel - i1.json"))
+        self.assertEqual(records[1]["diff"], {"set": {"description": "hell"}})
+        self.assertEqual(DataManager.entity_state_at("i1", records[1]["ts"])["description"], "hell")
+        self.assertIsNone(DataManager.entity_state_at("i1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
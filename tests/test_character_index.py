@@ -0,0 +1,70 @@
+import json
+import os
+import unittest
+
+from classes.core.data_manager import DataManager
+from classes.core.io_stats import IO_STATS
+from tests import DataDirTestCase
+
+
+class QueryCharactersTest(DataDirTestCase):
+    """query_characters über den Charakterindex (user-018)."""
+
+    def setUp(self):
+        super().setUp()
+        DataManager.save_character({"id": "c1", "name": "Maya", "age": 30, "class": "Magier"})
+        DataManager.save_character({"id": "c2", "name": "Marek", "age": 40, "role": "npc", "class": "Krieger"})
+        DataManager.save_character({"id": "c3", "name": "Bert", "age": 20, "class": "Magier", "player_id": "p1"})
+
+    @staticmethod
+    def _ids(entries):
+        return sorted(entry["data"]["id"] for entry in entries)
+
+    def test_filters(self):
+        self.assertEqual(self._ids(DataManager.query_characters(role="pc")), ["c1", "c3"])
+        self.assertEqual(self._ids(DataManager.query_characters(class_="Magier", player_id="p1")), ["c3"])
+        self.assertEqual(self._ids(DataManager.query_characters(name_prefix="ma")), ["c1", "c2"])
+        self.assertEqual(self._ids(DataManager.query_characters(role="npc", name_prefix="ma")), ["c2"])
+        self.assertEqual(DataManager.query_characters(name_prefix="zz"), [])
+
+    def test_where_and_limit(self):
+        older = DataManager.query_characters(where=lambda data: data["age"] >= 30)
+        self.assertEqual(self._ids(older), ["c1", "c2"])
+        self.assertEqual(len(DataManager.query_characters(class_="Magier", limit=1)), 1)
+
+    def test_warm_query_does_not_rescan(self):
+        DataManager.query_characters()
+        IO_STATS.reset()
+
+        self.assertEqual(DataManager.query_characters(name_prefix="zz"), [])
+        io = IO_STATS.snapshot()["io"]
+        self.assertEqual(io["stat_calls"], 0)
+        self.assertEqual(io["dir_listings"], 0)
+
+    def test_save_and_rename_update_index(self):
+        DataManager.query_characters()
+        DataManager.save_character({"id": "c4", "name": "Mira", "age": 25, "class": "Magier"})
+        path = DataManager.query_characters(name_prefix="maya")[0]["path"]
+        DataManager.save_character({"id": "c1", "name": "Ylva", "age": 30, "class": "Krieger"}, file_path=path)
+
+        self.assertEqual(self._ids(DataManager.query_characters(class_="Magier")), ["c3", "c4"])
+        self.assertEqual(self._ids(DataManager.query_characters(name_prefix="y")), ["c1"])
+        self.assertEqual(DataManager.query_characters(name_prefix="maya"), [])
+
+    def test_external_edit_after_invalidate(self):
+        path = DataManager.query_characters(name_prefix="bert")[0]["path"]
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        data["class"] = "Dieb"
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(path + ".tmp", path)
+
+        # geladenes Dokument wird gegen die Kriterien geprüft -> kein falscher Treffer
+        self.assertEqual(self._ids(DataManager.query_characters(class_="Magier")), ["c1"])
+        DataManager.invalidate_manifest()
+        self.assertEqual(self._ids(DataManager.query_characters(class_="Dieb")), ["c3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import unittest
+
+from classes.core.combat_manager import CombatManager
+
+
+def _actor(instance_id: str) -> dict:
+    return {
+        "instance_id": instance_id, "source_char_id": None, "display_name": instance_id,
+        "team": "A", "current_hp": 50, "max_hp": 50, "unconscious": False, "dead": False,
+    }
+
+
+class TurnOrderTest(unittest.TestCase):
+    """Initiative-Reihenfolge beim Entfernen von Kämpfern."""
+
+    def setUp(self):
+        self.manager = CombatManager()
+        self.actors = [_actor(f"a{i}") for i in range(5)]
+        for actor in self.actors:
+            self.manager.add_combatant(actor)
+        self.manager.set_initiative_order(self.actors, set())
+
+    def _order(self):
+        return [a["instance_id"] for a in self.manager.turn_order]
+
+    def test_add_duplicate_instance_id_raises(self):
+        with self.assertRaises(ValueError):
+            self.manager.add_combatant(_actor("a0"))
+        self.assertIs(self.manager.get_actor("a0"), self.actors[0])
+
+    def test_remove_before_current_keeps_current_actor(self):
+        self.manager.next_turn()
+        self.manager.next_turn()
+        self.manager.remove_combatant("a0")
+
+        self.assertEqual(self.manager.get_current_actor()["instance_id"], "a2")
+        self.assertEqual(self.manager.current_turn_index, 1)
+        self.assertEqual(self._order(), ["a1", "a2", "a3", "a4"])
+        self.assertEqual(self.manager.turn_position("a4"), 3)
+
+    def test_remove_current_moves_to_next(self):
+        self.manager.next_turn()
+        self.manager.remove_combatant("a1")
+
+        self.assertEqual(self.manager.get_current_actor()["instance_id"], "a2")
+        self.assertIsNone(self.manager.turn_position("a1"))
+        self.assertIsNone(self.manager.get_actor("a1"))
+
+    def test_remove_last_current_keeps_round_until_next_turn(self):
+        for _ in range(4):
+            self.manager.next_turn()
+        self.manager.round_damage["a0"] = 3
+        self.manager.parry_used["a0"] = True
+        self.manager.remove_combatant("a4")
+
+        # Runde läuft noch: niemand am Zug, Schaden und Paraden bleiben erhalten
+        self.assertEqual(self.manager.round_number, 1)
+        self.assertIsNone(self.manager.get_current_actor())
+        self.assertEqual(self.manager.round_damage, {"a0": 3})
+        self.assertTrue(self.manager.parry_used["a0"])
+
+        self.assertTrue(self.manager.next_turn())
+        self.assertEqual(self.manager.round_number, 2)
+        self.assertEqual(self.manager.get_current_actor()["instance_id"], "a0")
+        self.assertEqual(self.manager.round_damage, {})
+
+    def test_next_turn_skips_removed(self):
+        self.manager.remove_combatant("a1")
+        self.manager.remove_combatant("a2")
+
+        self.assertFalse(self.manager.next_turn())
+        self.assertEqual(self.manager.get_current_actor()["instance_id"], "a3")
+        self.manager.next_turn()
+        self.assertTrue(self.manager.next_turn())
+        self.assertEqual(self.manager.get_current_actor()["instance_id"], "a0")
+
+    def test_remove_everyone(self):
+        for actor in self.actors:
+            self.manager.remove_combatant(actor["instance_id"])
+
+        self.assertIsNone(self.manager.get_current_actor())
+        self.assertEqual(self.manager.turn_order, [])
+        self.assertFalse(self.manager.next_turn())
+
+    def test_many_removals_compact(self):
+        actors = [_actor(f"b{i}") for i in range(100)]
+        manager = CombatManager()
+        for actor in actors:
+            manager.add_combatant(actor)
+        manager.set_initiative_order(actors, set())
+        for actor in actors[:90]:
+            manager.remove_combatant(actor["instance_id"])
+
+        self.assertLessEqual(len(manager._turn_slots), 2 * 10 + 8)
+        self.assertEqual(manager.get_current_actor()["instance_id"], "b90")
+        self.assertEqual(manager.turn_position("b99"), 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+class CharacterSnapshotTest(unittest.TestCase):
+    """Schnappschuss der Charakterdaten: effektive Werte und Schutz vor Änderungen."""
+
+    CHARACTER = {
+        "id": "char-1",
+        "name": "Maya",
+        "skills": {"Handeln": {"Schießen": 40, "Nahkampf": 20}, "Wissen": {"Medizin": 30}},
+        "category_scores": {"Handeln": 6, "Wissen": 3},
+        "conditions": {
+            "motiviert": {"effect_type": "missionsweit", "effect_target": "Kategoriewert: Handeln", "effect_value": 5},
+        },
+    }
+
+    def setUp(self):
+        self.manager = CombatManager()
+        actor = _actor("a0")
+        actor["source_char_id"] = "char-1"
+        self.manager.add_combatant(actor, self.CHARACTER)
+
+    def test_effective_values_include_conditions(self):
+        effective = self.manager.get_effective_values("char-1")
+
+        self.assertEqual(effective["categories"], {"Handeln": 11, "Wissen": 3})
+        self.assertEqual(effective["skills"]["Schießen"], 51)
+        self.assertEqual(self.manager.get_skill_category("char-1", "Medizin"), "Wissen")
+        self.assertIsNone(self.manager.get_skill_category("char-1", "Fliegen"))
+
+    def test_returned_values_are_copies(self):
+        self.manager.get_effective_values("char-1")["skills"]["Schießen"] = 99
+        character = self.manager.get_character("char-1")
+        character["skills"]["Handeln"]["Schießen"] = 99
+        character.setdefault("category_scores", {})["Soziales"] = 1
+
+        self.assertEqual(self.manager.get_effective_values("char-1")["skills"]["Schießen"], 51)
+        self.assertEqual(self.manager.get_character("char-1")["skills"]["Handeln"]["Schießen"], 40)
+        self.assertNotIn("Soziales", self.manager.get_character("char-1")["category_scores"])
+        self.assertEqual(self.CHARACTER["skills"]["Handeln"]["Schießen"], 40)
@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+
+from classes.core.data_manifest import DataManifest
+from classes.core.io_stats import IO_STATS
+
+
+class DataManifestTest(unittest.TestCase):
+    """Binäres Verzeichnis-Manifest (user-020)."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.data_dir = os.path.join(tmp.name, "data")
+        self.items_dir = os.path.join(self.data_dir, "items")
+        self.manifest_file = os.path.join(self.data_dir, ".cache", "manifest.bin")
+        os.makedirs(os.path.join(self.items_dir, "A - i1"))
+        os.makedirs(os.path.join(self.items_dir, ".hidden"))
+        self._write(os.path.join(self.items_dir, "A - i1", "A - i1.json"), b'{"id": "i1"}')
+        self._write(os.path.join(self.items_dir, "flat.json"), b'{"id": "i2"}')
+        self._write(os.path.join(self.items_dir, ".hidden", "x.json"), b"{}")
+        self._write(os.path.join(self.items_dir, "notes.txt"), b"")
+
+    @staticmethod
+    def _write(path: str, content: bytes) -> None:
+        with open(path, "wb") as f:
+            f.write(content)
+        # Ordner-mtime sicher weiterschieben (grobe Zeitauflösung mancher Dateisysteme)
+        folder = os.path.dirname(path)
+        st = os.stat(folder)
+        os.utime(folder, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    def _manifest(self) -> DataManifest:
+        return DataManifest(self.manifest_file, self.data_dir)
+
+    def _names(self, manifest: DataManifest, recursive: bool = True):
+        return [os.path.relpath(path, self.items_dir) for path, _ in manifest.walk(self.items_dir, recursive)]
+
+    def test_walk_lists_json_with_signature(self):
+        results = self._manifest().walk(self.items_dir)
+
+        self.assertEqual(
+            [os.path.relpath(path, self.items_dir) for path, _ in results],
+            [os.path.join("A - i1", "A - i1.json"), "flat.json"],
+        )
+        st = os.stat(os.path.join(self.items_dir, "flat.json"))
+        self.assertEqual(results[1][1], (st.st_mtime_ns, st.st_size))
+        self.assertEqual(self._names(self._manifest(), recursive=False), ["flat.json"])
+
+    def test_reload_skips_unchanged_dirs(self):
+        self._manifest().walk(self.items_dir)
+        IO_STATS.reset()
+
+        self.assertEqual(len(self._names(self._manifest())), 2)
+        self.assertEqual(IO_STATS.snapshot()["io"]["dir_listings"], 0)
+
+    def test_changes_are_picked_up(self):
+        manifest = self._manifest()
+        manifest.walk(self.items_dir)
+        self._write(os.path.join(self.items_dir, "new.json"), b"{}")
+        os.remove(os.path.join(self.items_dir, "A - i1", "A - i1.json"))
+        os.rmdir(os.path.join(self.items_dir, "A - i1"))
+        st = os.stat(self.items_dir)
+        os.utime(self.items_dir, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(self._names(manifest), ["flat.json", "new.json"])
+        self.assertEqual(self._names(self._manifest()), ["flat.json", "new.json"])
+
+    def test_invalidate_relists_in_place_edits(self):
+        manifest = self._manifest()
+        manifest.walk(self.items_dir)
+        path = os.path.join(self.items_dir, "flat.json")
+        folder_mtime = os.stat(self.items_dir).st_mtime_ns
+        # an Ort und Stelle überschrieben: Ordner-mtime bleibt gleich
+        with open(path, "ab") as f:
+            f.write(b"  ")
+        os.utime(self.items_dir, ns=(folder_mtime, folder_mtime))
+
+        stale = dict(manifest.walk(self.items_dir))[path]
+        self.assertNotEqual(stale[1], os.path.getsize(path))
+        manifest.invalidate()
+        self.assertEqual(dict(manifest.walk(self.items_dir))[path][1], os.path.getsize(path))
+
+    def test_corrupt_file_is_rebuilt(self):
+        self._manifest().walk(self.items_dir)
+        with open(self.manifest_file, "wb") as f:
+            f.write(b"kaputt")
+
+        self.assertEqual(len(self._names(self._manifest())), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import shutil
+import unittest
+
+from classes.core.data_manager import DataManager
+from tests import DataDirTestCase
+
+
+class DeleteAndRenameFoldersTest(DataDirTestCase):
+    """Keine übrig gebliebenen Ordner nach Umbenennen und Löschen."""
+
+    def test_rename_removes_old_folder(self):
+        path = DataManager.save_item({"id": "i1", "name": "A"})
+        DataManager.save_item({"id": "i1", "name": "B"}, file_path=path)
+
+        self.assertEqual(os.listdir(DataManager.ITEMS_DIR), ["B - i1"])
+
+    def test_rename_keeps_legacy_image(self):
+        path = DataManager.save_character({"id": "c1", "name": "Hans", "age": 30})
+        with open(os.path.join(os.path.dirname(path), "Hans - c1.png"), "wb") as f:
+            f.write(b"png")
+        new_path = DataManager.save_character(
+            {"id": "c1", "name": "Franz", "age": 30, "image_filename": "Hans - c1.png"}, file_path=path
+        )
+
+        self.assertEqual(os.listdir(DataManager.CHARACTERS_DIR), ["Franz - c1"])
+        image_path = DataManager.resolve_image_path(os.path.dirname(new_path), "Hans - c1.png")
+        self.assertTrue(os.path.isfile(image_path))
+
+    def test_delete_removes_every_folder_with_the_id(self):
+        path = DataManager.save_condition({"id": "k1", "name": "A"})
+        # Rest einer früheren Umbenennung, von der der ID-Index nichts weiß
+        stale = os.path.join(DataManager.CONDITIONS_DIR, "Alt - k1")
+        os.makedirs(stale)
+        shutil.copyfile(path, os.path.join(stale, "Alt - k1.json"))
+        # anderes Entity, dessen ID die gesuchte nur enthält
+        DataManager.save_condition({"id": "xk1", "name": "C"})
+
+        self.assertTrue(DataManager.delete_condition("k1"))
+        self.assertEqual(os.listdir(DataManager.CONDITIONS_DIR), ["C - xk1"])
+        self.assertEqual([c["id"] for c in DataManager.get_all_conditions()], ["xk1"])
+
+    def test_delete_after_rename(self):
+        path = DataManager.save_item({"id": "i2", "name": "A"})
+        DataManager.save_item({"id": "i2", "name": "B"}, file_path=path)
+
+        self.assertTrue(DataManager.delete_item("i2"))
+        self.assertEqual(os.listdir(DataManager.ITEMS_DIR), [])
+        self.assertFalse(DataManager.delete_item("i2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
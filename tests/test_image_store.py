@@ -0,0 +1,133 @@
+import os
+import unittest
+
+from classes.core.data_manager import DataManager
+from classes.core.sqlite_storage import SQLiteStorage
+from tests import DataDirTestCase
+
+
+class ImageStoreBackendTest(DataDirTestCase):
+    """Bildspeicher und Aufräumen (collect_unused_images) mit gesetztem SQLite-Backend."""
+
+    def setUp(self):
+        super().setUp()
+        self.storage = SQLiteStorage(os.path.join(self.tmp, "campaign.db"))
+        DataManager.use_backend(self.storage)
+
+    def tearDown(self):
+        DataManager.use_backend(None)
+        self.storage.close()
+        super().tearDown()
+
+    def test_backend_images_survive_collect(self):
+        DataManager.save_item({"id": "it-1", "name": "Schwert"}, image_source_path=self.write_file("a.png", b"png-a"))
+        ref = DataManager._backend.get_all_items()[0]["image_filename"]
+        image_path = DataManager.resolve_image_path(None, ref)
+
+        self.assertEqual(DataManager._get_image_store().refcounts(), {ref: 1})
+        self.assertEqual(DataManager.collect_unused_images(), 0)
+        self.assertTrue(os.path.isfile(image_path))
+
+    def test_backend_save_many_assigns_refs(self):
+        ref = DataManager._copy_entity_image(
+            entity_safe_name="x", entity_id="x", target_folder_path=self.tmp,
+            image_source_path=self.write_file("b.png", b"png-b"),
+        )
+        DataManager.save_many(DataManager.KIND_CONDITION, [{"id": "c-1", "name": "müde", "image_filename": ref}])
+
+        self.assertEqual(DataManager._get_image_store().refcounts(), {ref: 1})
+        self.assertEqual(DataManager.collect_unused_images(), 0)
+
+    def test_backend_delete_releases_image(self):
+        DataManager.save_item({"id": "it-2", "name": "Axt"}, image_source_path=self.write_file("c.png", b"png-c"))
+        ref = DataManager._backend.get_all_items()[0]["image_filename"]
+
+        self.assertTrue(DataManager.delete_item("it-2"))
+        self.assertEqual(DataManager._get_image_store().refcounts(), {})
+        self.assertFalse(os.path.exists(DataManager.resolve_image_path(None, ref)))
+        self.assertEqual(DataManager.collect_unused_images(), 0)
+
+    def test_folder_and_backend_share_store(self):
+        DataManager.use_backend(None)
+        DataManager.save_item({"id": "it-3", "name": "Seil"}, image_source_path=self.write_file("d.png", b"png-d"))
+        DataManager.use_backend(self.storage)
+        DataManager.save_item({"id": "it-3", "name": "Seil"}, image_source_path=self.write_file("e.png", b"png-e"))
+
+        # gleiche ID in Ordnerstruktur und Datenbank, aber unterschiedliche Bilder
+        self.assertEqual(DataManager.collect_unused_images(), 0)
+        self.assertEqual(len(DataManager._get_image_store().refcounts()), 2)
+
+    def test_folder_delete_keeps_backend_image_with_same_id(self):
+        image = self.write_file("g.png", b"png-g")
+        DataManager.save_item({"id": "it-5", "name": "Fackel"}, image_source_path=image)
+        ref = DataManager._backend.get_all_items()[0]["image_filename"]
+        DataManager.use_backend(None)
+        DataManager.save_item({"id": "it-5", "name": "Fackel"}, image_source_path=image)
+
+        self.assertTrue(DataManager.delete_item("it-5"))
+        self.assertTrue(os.path.isfile(DataManager.resolve_image_path(None, ref)))
+
+    def test_backend_without_image_owners_skips_collect(self):
+        class Backend:
+            pass
+
+        DataManager.use_backend(None)
+        # Bild im Speicher, das kein Entity verwendet
+        DataManager._copy_entity_image(
+            entity_safe_name="x", entity_id="x", target_folder_path=self.tmp,
+            image_source_path=self.write_file("f.png", b"png-f"),
+        )
+        DataManager.use_backend(Backend())
+        self.assertEqual(DataManager.collect_unused_images(), 0)
+        DataManager.use_backend(None)
+        self.assertEqual(DataManager.collect_unused_images(), 1)
+
+
+class ImageStoreReleaseTest(DataDirTestCase):
+    """Bilder werden gelöscht, sobald sie kein Entity mehr verwendet."""
+
+    def setUp(self):
+        super().setUp()
+        self.image = self.write_file("a.png", b"png-a")
+
+    def _save(self, item_id: str, image_source_path: str) -> str:
+        """Speichert ein Item mit Bild und liefert den Pfad des Bildes im Speicher."""
+        item = {"id": item_id, "name": f"Item {item_id}"}
+        DataManager.save_item(item, image_source_path=image_source_path)
+        return DataManager.resolve_image_path(None, item["image_filename"])
+
+    def test_delete_removes_unused_image(self):
+        image_path = self._save("i1", self.image)
+        self.assertTrue(os.path.isfile(image_path))
+
+        DataManager.delete_item("i1")
+        self.assertFalse(os.path.exists(image_path))
+
+    def test_shared_image_survives_until_last_owner(self):
+        image_path = self._save("i1", self.image)
+        self._save("i2", self.image)
+
+        DataManager.delete_item("i1")
+        self.assertTrue(os.path.isfile(image_path))
+        DataManager.delete_item("i2")
+        self.assertFalse(os.path.exists(image_path))
+
+    def test_replaced_image_is_removed(self):
+        old_path = self._save("i1", self.image)
+        new_path = self._save("i1", self.write_file("b.png", b"png-b"))
+        self.assertFalse(os.path.exists(old_path))
+        self.assertTrue(os.path.isfile(new_path))
+
+    def test_unknown_owners_keep_images(self):
+        # Bild ohne refs.json (z. B. aus einer älteren Version) -> erst collect_unused_images entscheidet
+        image_path = self._save("i1", self.image)
+        os.remove(DataManager._get_image_store().refs_file)
+        DataManager.reset_state()
+
+        DataManager.delete_item("i1")
+        self.assertTrue(os.path.isfile(image_path))
+        self.assertEqual(DataManager.collect_unused_images(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
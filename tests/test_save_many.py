@@ -0,0 +1,70 @@
+import os
+import unittest
+
+from classes.core.data_manager import DataManager
+from tests import DataDirTestCase
+
+
+class SaveManyTest(DataDirTestCase):
+    """Stapel-Speichern mit save_many (user-010)."""
+
+    def test_same_layout_as_single_save(self):
+        single = DataManager.save_item({"id": "i1", "name": "Fackel"})
+        results = DataManager.save_many(DataManager.KIND_ITEM, [{"id": "i2", "name": "Fackel"}])
+
+        self.assertIsNone(results[0]["error"])
+        self.assertEqual(os.path.dirname(os.path.dirname(results[0]["path"])), os.path.dirname(os.path.dirname(single)))
+        self.assertEqual(os.path.basename(results[0]["path"]), "Fackel - i2.json")
+        self.assertTrue(os.path.isfile(results[0]["path"]))
+
+    def test_results_in_order_with_errors(self):
+        results = DataManager.save_many(
+            DataManager.KIND_CONDITION,
+            [{"name": "müde"}, "kein dict", {"id": "k2", "name": "wach"}],
+        )
+
+        self.assertEqual(len(results), 3)
+        self.assertTrue(results[0]["id"])
+        self.assertIsNone(results[0]["error"])
+        self.assertIsNone(results[1]["id"])
+        self.assertIsNotNone(results[1]["error"])
+        self.assertEqual(results[2]["id"], "k2")
+        self.assertEqual(
+            sorted(c["name"] for c in DataManager.get_all_conditions()),
+            ["müde", "wach"],
+        )
+
+    def test_characters_go_to_their_campaign(self):
+        DataManager.save_campaign({"id": "camp-1", "title": "Alpha", "type": "Sandbox"})
+        results = DataManager.save_many(
+            DataManager.KIND_CHARACTER,
+            [
+                {"id": "c1", "name": "Maya", "age": 30, "campaign_id": "camp-1"},
+                {"id": "c2", "name": "Bert", "age": 20},
+            ],
+        )
+
+        self.assertTrue(DataManager._is_within(results[0]["path"], DataManager.CAMPAIGNS_DIR))
+        self.assertTrue(DataManager._is_within(results[1]["path"], DataManager.CHARACTERS_DIR))
+        self.assertEqual(DataManager.get_character_by_id("c1")["name"], "Maya")
+
+    def test_indexes_see_saved_records(self):
+        DataManager.query_characters()
+        DataManager.search("x")
+        DataManager.save_many(
+            DataManager.KIND_CHARACTER,
+            [{"id": f"c{i}", "name": f"Söldner {i}", "age": 30, "role": "npc"} for i in range(5)],
+        )
+
+        self.assertEqual(len(DataManager.query_characters(role="npc")), 5)
+        self.assertEqual(len(DataManager.search("söldner")), 5)
+        DataManager.reset_state()
+        self.assertEqual(len(DataManager.get_characters_by_role("npc")), 5)
+
+    def test_unsupported_kind(self):
+        with self.assertRaises(ValueError):
+            DataManager.save_many(DataManager.KIND_QUEST, [{"title": "Bunker"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
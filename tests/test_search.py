@@ -0,0 +1,77 @@
+import json
+import os
+import unittest
+
+from classes.core.data_manager import DataManager
+from classes.core.io_stats import IO_STATS
+from tests import DataDirTestCase
+
+
+class SearchTest(DataDirTestCase):
+    """Volltextsuche über den persistenten Suchindex (user-019)."""
+
+    def setUp(self):
+        super().setUp()
+        DataManager.save_item({"id": "i1", "name": "Giftpfeil", "description": "Ein Pfeil mit Gift"})
+        DataManager.save_item({"id": "i2", "name": "Heiltrank", "description": "Hilft gegen Gift"})
+        DataManager.save_condition({"id": "k1", "name": "Vergiftet"})
+        DataManager.save_campaign({"id": "camp-1", "title": "Alpha", "type": "Sandbox"})
+        DataManager.save_quest({"campaign_id": "camp-1", "title": "Der Bunker", "description": "Finde den Eingang."})
+
+    @staticmethod
+    def _ids(results):
+        return [result["id"] for result in results]
+
+    def test_prefix_and_ranking(self):
+        results = DataManager.search("gift", kinds=[DataManager.KIND_ITEM])
+        self.assertEqual(self._ids(results), ["i1", "i2"])
+        self.assertEqual(self._ids(DataManager.search("gift pfeil")), ["i1"])
+        self.assertEqual(DataManager.search("gift zzzz"), [])
+        self.assertEqual(DataManager.search(""), [])
+
+    def test_quests_are_searchable(self):
+        results = DataManager.search("bunker")
+        self.assertEqual([r["kind"] for r in results], [DataManager.KIND_QUEST])
+
+    def test_save_and_delete_update_index(self):
+        DataManager.search("gift")
+        DataManager.save_item({"id": "i3", "name": "Gegengift"})
+        DataManager.delete_item("i2")
+
+        self.assertEqual(sorted(self._ids(DataManager.search("gegengift"))), ["i3"])
+        self.assertNotIn("i2", self._ids(DataManager.search("heiltrank")))
+
+    def test_warm_search_does_not_rescan(self):
+        DataManager.search("gift")
+        IO_STATS.reset()
+
+        DataManager.search("gift")
+        io = IO_STATS.snapshot()["io"]
+        self.assertEqual(io["stat_calls"], 0)
+        self.assertEqual(io["dir_listings"], 0)
+
+    def test_external_edit_after_invalidate(self):
+        path = DataManager.search("heiltrank")[0]["path"]
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        data["description"] = "leuchtet im Dunkeln"
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(path + ".tmp", path)
+
+        self.assertEqual(DataManager.search("dunkeln"), [])
+        DataManager.invalidate_manifest()
+        self.assertEqual(self._ids(DataManager.search("dunkeln")), ["i2"])
+
+    def test_index_survives_restart(self):
+        before = DataManager.search("gift")
+        DataManager.reset_state()
+        IO_STATS.reset()
+
+        self.assertEqual(DataManager.search("gift"), before)
+        # Index aus der Sidecar-Datei, unveränderte Entities werden nicht erneut geöffnet
+        self.assertLess(IO_STATS.snapshot()["io"]["files_opened"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
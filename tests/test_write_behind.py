@@ -0,0 +1,59 @@
+import os
+import unittest
+
+from classes.core.data_manager import DataManager
+from tests import DataDirTestCase
+
+
+class WriteBehindRenameTest(DataDirTestCase):
+    """Umbenennen, während der vorige Stand noch in der Schreib-Warteschlange liegt."""
+
+    def setUp(self):
+        super().setUp()
+        DataManager.enable_write_behind(delay=0.5, fsync=False)
+
+    def tearDown(self):
+        DataManager.disable_write_behind()
+        super().tearDown()
+
+    @staticmethod
+    def _json_files(base_dir):
+        return sorted(f for _, _, files in os.walk(base_dir) for f in files if f.endswith(".json"))
+
+    def test_rename_character_before_write(self):
+        old_path = DataManager.save_character({"id": "c1", "name": "Hans", "age": 30})
+        DataManager.save_character({"id": "c1", "name": "Franz", "age": 30}, file_path=old_path)
+        DataManager.flush()
+
+        self.assertEqual(self._json_files(DataManager.CHARACTERS_DIR), ["Franz - c1.json"])
+        self.assertEqual([c["data"]["name"] for c in DataManager.get_all_characters()], ["Franz"])
+
+    def test_rename_item_before_write(self):
+        old_path = DataManager.save_item({"id": "i1", "name": "Fackel"})
+        DataManager.save_item({"id": "i1", "name": "Laterne"}, file_path=old_path)
+        DataManager.flush()
+
+        self.assertEqual(self._json_files(DataManager.ITEMS_DIR), ["Laterne - i1.json"])
+
+    def test_rename_player_before_write(self):
+        DataManager.save_player({"id": "p1", "name": "Alice"})
+        DataManager.save_player({"id": "p1", "name": "Bob"})
+        DataManager.flush()
+
+        self.assertEqual(self._json_files(DataManager.PLAYERS_DIR), ["Bob - p1.json"])
+        self.assertEqual([p["data"]["name"] for p in DataManager.get_all_players()], ["Bob"])
+
+    def test_rename_player_after_write(self):
+        DataManager.save_player({"id": "p2", "name": "Alice"})
+        DataManager.flush()
+        self.assertEqual(len(DataManager.get_all_players()), 1)
+        DataManager.save_player({"id": "p2", "name": "Bob"})
+        DataManager.flush()
+
+        self.assertEqual(self._json_files(DataManager.PLAYERS_DIR), ["Bob - p2.json"])
+        self.assertEqual([p["data"]["name"] for p in DataManager.get_all_players()], ["Bob"])
+        self.assertEqual(DataManager.get_player_by_id("p2")["name"], "Bob")
+
+
+if __name__ == "__main__":
+    unittest.main()